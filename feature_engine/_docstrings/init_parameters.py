@@ -36,3 +36,30 @@ _unseen_docstring = """unseen: string, default='ignore'
         error. If 'ignore', then unseen categories will be set as NaN and a warning will
         be raised instead.
     """.rstrip()
+
+_cv_docstring = """cv: int, cross-validation generator or an iterable, default=None
+        Determines the cross-validation splitting strategy used to encode the training
+        set in `fit_transform()`. If None, `fit_transform()` encodes the training set
+        with the mappings learned from the entire dataset. Otherwise, each observation
+        is encoded with the mappings learned from the folds that do not contain it,
+        which prevents the target from leaking into the encoded variables. Possible
+        inputs for cv are:
+
+            - None, to not use out-of-fold encoding,
+
+            - int, to specify the number of folds in a (Stratified)KFold,
+
+            - CV splitter
+                - (https://scikit-learn.org/stable/glossary.html#term-CV-splitter)
+
+            - An iterable yielding (train, test) splits as arrays of indices.
+
+        The int inputs use splitters instantiated with `shuffle=False`. To shuffle the
+        observations, pass a CV splitter instead. The methods `fit()` and `transform()`
+        always use the mappings learned from the entire dataset.
+    """.rstrip()
+
+_n_jobs_docstring = """n_jobs: int, default=None
+        The number of jobs to run in parallel. None means 1 unless in a
+        joblib.parallel_backend context. -1 means using all processors.
+    """.rstrip()
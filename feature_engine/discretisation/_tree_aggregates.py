@@ -0,0 +1,111 @@
+# License: BSD 3 clause
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from joblib import Parallel, delayed
+from sklearn.base import clone
+
+
+def _aggregate(
+    codes: np.ndarray, y: np.ndarray, n_categories: int, regression: bool
+):
+    """
+    Summarises the observations of a variable encoded as integer codes, like the
+    categories of an ordinal encoded variable or the bins of a discretised variable,
+    per code.
+
+    For regression, returns one row per code, with the target mean as target and
+    the number of observations as sample weight. For classification, returns one row
+    per code and class, with the number of observations as sample weight. A
+    decision tree trained on these rows learns the same splits and predictions as one
+    trained on the original observations, because the impurity of the nodes depends
+    only on the sums of the weights and targets.
+    """
+    if regression:
+        count = np.bincount(codes, minlength=n_categories)
+        total = np.bincount(codes, weights=y, minlength=n_categories)
+        present = np.flatnonzero(count)
+        return present.reshape(-1, 1), total[present] / count[present], count[present]
+
+    classes, y_codes = np.unique(y, return_inverse=True)
+    table = np.bincount(
+        codes * len(classes) + y_codes, minlength=n_categories * len(classes)
+    ).reshape(n_categories, len(classes))
+    category, class_ = np.nonzero(table)
+    return category.reshape(-1, 1), classes[class_], table[category, class_]
+
+
+def _score_fold(
+    model,
+    candidates: List[dict],
+    scorer,
+    codes: np.ndarray,
+    y: np.ndarray,
+    n_categories: int,
+    regression: bool,
+    train: np.ndarray,
+    test: np.ndarray,
+) -> List[float]:
+    """
+    Trains one tree per candidate set of hyperparameters on the per code
+    summaries of the training fold, and scores them on the held-out observations.
+    """
+    X_agg, y_agg, weights = _aggregate(codes[train], y[train], n_categories, regression)
+    X_test = codes[test].reshape(-1, 1)
+
+    scores = []
+    for params in candidates:
+        tree = clone(model).set_params(**params)
+        tree.fit(X_agg, y_agg, sample_weight=weights)
+        scores.append(scorer(tree, X_test, y[test]))
+
+    return scores
+
+
+def _search_trees(
+    model,
+    candidates: List[dict],
+    scorer,
+    codes: Dict[str, np.ndarray],
+    y: np.ndarray,
+    n_categories: Dict[str, int],
+    regression: bool,
+    splits: List[Tuple[np.ndarray, np.ndarray]],
+    n_jobs: Optional[int] = None,
+) -> dict:
+    """
+    Grid searches the tree of each variable on the per code summaries, and returns
+    the tree with the best hyperparameters, per variable, trained on the summaries
+    of all observations.
+
+    The folds of all variables are scored in parallel. Like GridSearchCV, the first
+    candidate with the best mean score wins.
+    """
+    scores = Parallel(n_jobs=n_jobs)(
+        delayed(_score_fold)(
+            model,
+            candidates,
+            scorer,
+            codes[var],
+            y,
+            n_categories[var],
+            regression,
+            train,
+            test,
+        )
+        for var in codes
+        for train, test in splits
+    )
+    scores = np.asarray(scores).reshape(len(codes), len(splits), -1)
+
+    trees = {}
+    for i, var in enumerate(codes):
+        best = int(np.argmax(scores[i].mean(axis=0)))
+        X_agg, y_agg, weights = _aggregate(
+            codes[var], y, n_categories[var], regression
+        )
+        trees[var] = clone(model).set_params(**candidates[best])
+        trees[var].fit(X_agg, y_agg, sample_weight=weights)
+
+    return trees
@@ -144,6 +144,7 @@ class ArbitraryDiscretiser(BaseDiscretiser, FitFromDictMixin):
 
         # for consistency wit the rest of the discretisers, we add this attribute
         self.binner_dict_ = self.binning_dict
+        self._fit_intervals()
 
         return self
 
@@ -1,6 +1,7 @@
 # Authors: Morgan Sell <morganpsell@gmail.com>
 # License: BSD 3 clause
 
+import numpy as np
 import pandas as pd
 
 from feature_engine._base_transformers.base_numerical import BaseNumericalTransformer
@@ -21,7 +22,8 @@ class BaseDiscretiser(BaseNumericalTransformer):
 
     _return_boundaries_docstring = """return_boundaries: bool, default=False
         Whether the output should be the interval boundaries. If True, it returns
-        the interval boundaries. If False, it returns integers.
+        the interval boundaries as a categorical variable. If False, it returns
+        integers, of the smallest integer type that fits the number of intervals.
         """.rstrip()
 
     _binner_dict_docstring = """binner_dict_:
@@ -56,6 +58,43 @@ class BaseDiscretiser(BaseNumericalTransformer):
         self.return_object = return_object
         self.return_boundaries = return_boundaries
 
+    def _fit_intervals(self) -> None:
+        """
+        Stores the interval limits per variable as arrays, to sort the values with
+        np.searchsorted(), and the interval names, which are returned when
+        `return_boundaries=True`.
+        """
+        self._limits = {}
+        self._boundaries = {}
+
+        for var in self.variables_:
+            self._limits[var], self._boundaries[var] = self._make_intervals(var)
+
+    def _make_intervals(self, var):
+        """Returns the interval limits and names of a variable from `binner_dict_`."""
+        limits = np.asarray(self.binner_dict_[var], dtype=float)
+        if not (np.diff(limits) > 0).all():
+            raise ValueError(
+                f"The interval limits of {var} must increase monotonically."
+            )
+
+        # the interval names, with the precision used by pd.cut()
+        intervals = pd.cut([], self.binner_dict_[var]).categories
+        boundaries = pd.CategoricalDtype(intervals.astype(str), ordered=True)
+
+        return limits, boundaries
+
+    def _get_intervals(self, var):
+        """
+        Returns the interval limits and names stored in fit. They are made again,
+        without storing them, if the discretiser was fitted with an older version,
+        or if `binner_dict_` was modified after fit.
+        """
+        limits = getattr(self, "_limits", {}).get(var)
+        if limits is None or not np.array_equal(limits, self.binner_dict_[var]):
+            return self._make_intervals(var)
+        return limits, self._boundaries[var]
+
     def transform(self, X: pd.DataFrame) -> pd.DataFrame:
         """Sort the variable values into the intervals.
 
@@ -73,20 +112,37 @@ class BaseDiscretiser(BaseNumericalTransformer):
         # check input dataframe and if class was fitted
         X = super().transform(X)
 
-        # transform variables
-        if self.return_boundaries is True:
-            for feature in self.variables_:
-                X[feature] = pd.cut(X[feature], self.binner_dict_[feature])
-            X[self.variables_] = X[self.variables_].astype(str)
+        values = X[self.variables_].to_numpy(dtype=float)
 
-        else:
-            for feature in self.variables_:
-                X[feature] = pd.cut(
-                    X[feature], self.binner_dict_[feature], labels=False
-                )
+        discrete = {}
+        for j, feature in enumerate(self.variables_):
+            limits, boundaries = self._get_intervals(feature)
+
+            # like pd.cut(), the intervals are closed on the right, and values
+            # outside the limits take no interval, that is, -1.
+            codes = np.searchsorted(limits, values[:, j], side="left") - 1
+            outside = (values[:, j] <= limits[0]) | (values[:, j] > limits[-1])
 
-            # return object
-            if self.return_object:
-                X[self.variables_] = X[self.variables_].astype("O")
+            if self.return_boundaries is True:
+                codes[outside] = -1
+                discrete[feature] = pd.Categorical.from_codes(
+                    codes, dtype=boundaries
+                )
+            elif outside.any():
+                discrete[feature] = np.where(outside, np.nan, codes)
+            else:
+                # the smallest integer type that fits the number of intervals
+                dtype = np.min_scalar_type(-len(limits))
+                discrete[feature] = codes.astype(dtype)
+
+        discrete = pd.DataFrame(discrete, index=X.index)
+
+        # return object
+        if self.return_object and not self.return_boundaries:
+            discrete = discrete.astype("O")
+
+        # replacing the variables at once is faster than one at a time
+        columns = X.columns
+        X = pd.concat([X.drop(columns=self.variables_), discrete], axis=1)[columns]
 
         return X
@@ -3,8 +3,17 @@
 
 from typing import Dict, List, Optional, Union
 
+import numpy as np
 import pandas as pd
-from sklearn.model_selection import GridSearchCV
+from joblib import Parallel, delayed
+from sklearn.base import clone
+from sklearn.metrics import get_scorer
+from sklearn.model_selection import (
+    GridSearchCV,
+    ParameterGrid,
+    check_cv,
+    train_test_split,
+)
 from sklearn.tree import DecisionTreeClassifier, DecisionTreeRegressor
 from sklearn.utils.multiclass import check_classification_targets, type_of_target
 
@@ -14,17 +23,47 @@ from feature_engine._docstrings.fit_attributes import (
     _n_features_in_docstring,
     _variables_attribute_docstring,
 )
-from feature_engine._docstrings.init_parameters import _variables_numerical_docstring
+from feature_engine._docstrings.init_parameters import (
+    _n_jobs_docstring,
+    _variables_numerical_docstring,
+)
 from feature_engine._docstrings.methods import _fit_transform_docstring
 from feature_engine._docstrings.substitute import Substitution
 from feature_engine._variable_handling.init_parameter_checks import (
     _check_init_parameter_variables,
 )
+from feature_engine.discretisation._tree_aggregates import _search_trees
 from feature_engine.tags import _return_tags
 
 
+def _fit_tree(
+    tree_model: GridSearchCV, X: pd.DataFrame, y: pd.Series, sample: np.ndarray
+) -> GridSearchCV:
+    """
+    Finds the best tree with the grid search on the observations in `sample`, and
+    refits it to all observations.
+    """
+    tree_model.fit(X.iloc[sample], y.iloc[sample])
+
+    if len(sample) < len(X):
+        tree_model.best_estimator_ = clone(tree_model.best_estimator_).fit(X, y)
+
+    return tree_model
+
+
+def _histogram(values: np.ndarray, max_bins: int):
+    """
+    Sorts the values into at most `max_bins` bins of equal frequency. Returns the
+    limits between the bins and the bin of each value, with intervals closed on the
+    right, like pandas.cut().
+    """
+    limits = np.unique(np.quantile(values, np.linspace(0, 1, max_bins + 1)))[1:-1]
+    return limits, np.searchsorted(limits, values, side="left")
+
+
 @Substitution(
     variables=_variables_numerical_docstring,
+    n_jobs=_n_jobs_docstring,
     variables_=_variables_attribute_docstring,
     feature_names_in_=_feature_names_in_docstring,
     n_features_in_=_n_features_in_docstring,
@@ -46,6 +85,13 @@ class DecisionTreeDiscretiser(BaseNumericalTransformer):
     variables to transform can be indicated. Alternatively, the discretiser will
     automatically select all numerical variables.
 
+    With `method='histogram'`, the variables are first sorted into at most
+    `max_bins` bins of equal frequency, and the trees are trained on the number of
+    observations and the target statistics per bin, as gradient boosting libraries
+    do. This is much faster on large datasets. The limits of the intervals found by
+    the trees are then stored, and the variables are transformed by sorting their
+    values into those intervals.
+
     More details in the :ref:`User Guide <decisiontree_discretiser>`.
 
     Parameters
@@ -92,10 +138,34 @@ class DecisionTreeDiscretiser(BaseNumericalTransformer):
         DecisionTreeClassifier(). For reproducibility it is recommended to set
         the random_state to an integer.
 
+    method: str, default='tree'
+        How the trees are trained. Can take 'tree', to train the trees on the values
+        of the variable, or 'histogram', to train the trees on the bins of equal
+        frequency of the variable.
+
+    max_bins: int, default=256
+        The maximum number of bins of equal frequency in which the variables are
+        sorted before training the trees. Only used when `method='histogram'`.
+
+    max_samples: int, default=None
+        The maximum number of observations used in the grid search. If the train set
+        has more observations, the grid search is carried out on a random sample of
+        `max_samples` observations, stratified by the target for classification, and
+        the best tree is then refit to the entire train set. If None, the grid search
+        uses all observations.
+
+    {n_jobs}
+        The trees of the different variables are trained in parallel.
+
     Attributes
     ----------
     binner_dict_:
-        Dictionary containing the fitted tree per variable.
+        Dictionary containing the fitted tree per variable. With
+        `method='histogram'`, dictionary with the interval limits per variable.
+
+    predictions_dict_:
+        Dictionary with the prediction of the tree in each interval per variable.
+        Only when `method='histogram'`.
 
     scores_dict_:
         Dictionary with the score of the best decision tree per variable.
@@ -162,17 +232,44 @@ class DecisionTreeDiscretiser(BaseNumericalTransformer):
         param_grid: Optional[Dict[str, Union[str, int, float, List[int]]]] = None,
         regression: bool = True,
         random_state: Optional[int] = None,
+        n_jobs=None,
+        max_samples: Optional[int] = None,
+        method: str = "tree",
+        max_bins: int = 256,
     ) -> None:
 
         if not isinstance(regression, bool):
             raise ValueError("regression can only take True or False")
 
+        if method not in ["tree", "histogram"]:
+            raise ValueError(
+                f"method takes only values 'tree' or 'histogram'. Got {method} "
+                f"instead."
+            )
+
+        if not isinstance(max_bins, int) or max_bins < 2:
+            raise ValueError(
+                f"max_bins must be an integer bigger than 1. Got {max_bins} instead."
+            )
+
+        if max_samples is not None and (
+            not isinstance(max_samples, int) or max_samples < 1
+        ):
+            raise ValueError(
+                f"max_samples must be None or a positive integer. Got {max_samples} "
+                f"instead."
+            )
+
         self.cv = cv
         self.scoring = scoring
         self.regression = regression
         self.variables = _check_init_parameter_variables(variables)
         self.param_grid = param_grid
         self.random_state = random_state
+        self.n_jobs = n_jobs
+        self.max_samples = max_samples
+        self.method = method
+        self.max_bins = max_bins
 
     def fit(self, X: pd.DataFrame, y: pd.Series):  # type: ignore
         """
@@ -208,25 +305,52 @@ class DecisionTreeDiscretiser(BaseNumericalTransformer):
         else:
             param_grid = {"max_depth": [1, 2, 3, 4]}
 
-        self.binner_dict_ = {}
-        self.scores_dict_ = {}
-
-        for var in self.variables_:
-
-            if self.regression:
-                model = DecisionTreeRegressor(random_state=self.random_state)
-            else:
-                model = DecisionTreeClassifier(random_state=self.random_state)
-
-            tree_model = GridSearchCV(
-                model, cv=self.cv, scoring=self.scoring, param_grid=param_grid
+        if self.regression:
+            model = DecisionTreeRegressor(random_state=self.random_state)
+        else:
+            model = DecisionTreeClassifier(random_state=self.random_state)
+
+        y = pd.Series(np.asarray(y), index=X.index)
+
+        # observations for the grid search
+        sample = np.arange(len(X))
+        if self.max_samples is not None and len(X) > self.max_samples:
+            sample, _ = train_test_split(
+                sample,
+                train_size=self.max_samples,
+                random_state=self.random_state,
+                stratify=None if self.regression else y,
             )
+            sample = np.sort(sample)
 
-            # fit the model to the variable
-            tree_model.fit(X[var].to_frame(), y)
+        # the cross-validation splits are computed once and shared by all variables
+        splits = list(
+            check_cv(self.cv, y.iloc[sample], classifier=not self.regression).split(
+                np.zeros((len(sample), 1)), y.iloc[sample]
+            )
+        )
+
+        if self.method == "histogram":
+            self._fit_histograms(X, y, model, param_grid, sample, splits)
+            return self
+
+        tree_models = Parallel(n_jobs=self.n_jobs)(
+            delayed(_fit_tree)(
+                GridSearchCV(
+                    clone(model), cv=splits, scoring=self.scoring, param_grid=param_grid
+                ),
+                X[var].to_frame(),
+                y,
+                sample,
+            )
+            for var in self.variables_
+        )
 
-            self.binner_dict_[var] = tree_model
-            self.scores_dict_[var] = tree_model.score(X[var].to_frame(), y)
+        self.binner_dict_ = dict(zip(self.variables_, tree_models))
+        self.scores_dict_ = {
+            var: tree_model.score(X[var].to_frame(), y)
+            for var, tree_model in self.binner_dict_.items()
+        }
 
         return self
 
@@ -249,6 +373,14 @@ class DecisionTreeDiscretiser(BaseNumericalTransformer):
         # check input dataframe and if class was fitted
         X = super().transform(X)
 
+        if self.method == "histogram":
+            for feature in self.variables_:
+                bins = np.searchsorted(
+                    self.binner_dict_[feature][1:-1], X[feature], side="left"
+                )
+                X[feature] = np.asarray(self.predictions_dict_[feature])[bins]
+            return X
+
         for feature in self.variables_:
             if self.regression:
                 X[feature] = self.binner_dict_[feature].predict(X[feature].to_frame())
@@ -258,6 +390,65 @@ class DecisionTreeDiscretiser(BaseNumericalTransformer):
 
         return X
 
+    def _fit_histograms(
+        self,
+        X: pd.DataFrame,
+        y: pd.Series,
+        model,
+        param_grid,
+        sample: np.ndarray,
+        splits: list,
+    ):
+        """
+        Grid search the tree of each variable on the number of observations and
+        target statistics per bin of equal frequency, and store the limits of the
+        intervals found by the best tree.
+        """
+        y_ = y.to_numpy()
+        candidates = list(ParameterGrid(param_grid))
+        scorer = get_scorer(self.scoring)
+
+        histograms = {
+            var: _histogram(X[var].to_numpy(dtype=float), self.max_bins)
+            for var in self.variables_
+        }
+
+        trees = _search_trees(
+            model,
+            candidates,
+            scorer,
+            {var: histograms[var][1] for var in self.variables_},
+            y_,
+            {var: len(histograms[var][0]) + 1 for var in self.variables_},
+            self.regression,
+            [(sample[train], sample[test]) for train, test in splits],
+            self.n_jobs,
+        )
+
+        self.binner_dict_ = {}
+        self.predictions_dict_ = {}
+        self.scores_dict_ = {}
+
+        for var, tree in trees.items():
+            limits, codes = histograms[var]
+
+            # the splits of the tree fall between consecutive bins. The split
+            # between bins k and k + 1 is the upper limit of bin k.
+            thresholds = tree.tree_.threshold[tree.tree_.feature >= 0]
+            cuts = np.unique(np.floor(thresholds).astype(int))
+            cuts = cuts[(cuts >= 0) & (cuts < len(limits))]
+
+            ordinal = np.append(0, cuts + 1).reshape(-1, 1)
+            if self.regression:
+                predictions = tree.predict(ordinal)
+            else:
+                predictions = tree.predict_proba(ordinal)[:, 1]
+
+            self.binner_dict_[var] = [float("-inf")] + limits[cuts].tolist()
+            self.binner_dict_[var].append(float("inf"))
+            self.predictions_dict_[var] = predictions.tolist()
+            self.scores_dict_[var] = scorer(tree, codes.reshape(-1, 1), y_)
+
     def _more_tags(self):
         tags_dict = _return_tags()
         tags_dict["variables"] = "numerical"
@@ -156,4 +156,6 @@ class EqualFrequencyDiscretiser(BaseDiscretiser):
             bins[len(bins) - 1] = float("inf")
             self.binner_dict_[var] = bins
 
+        self._fit_intervals()
+
         return self
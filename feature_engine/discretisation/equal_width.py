@@ -168,4 +168,6 @@ class EqualWidthDiscretiser(BaseDiscretiser):
             bins[len(bins) - 1] = float("inf")
             self.binner_dict_[var] = bins
 
+        self._fit_intervals()
+
         return self
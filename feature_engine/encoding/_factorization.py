@@ -0,0 +1,50 @@
+"""Factorisation of categorical variables shared across encoders.
+
+The encoders work on the integer code of each observation, so that the categories
+are looked up once per category, instead of once per observation.
+
+Variables of categorical dtype already store those codes. Their categories are
+hashed once, when the variable is cast as categorical, and all encoders reuse the
+codes instead of hashing the categories of each observation again.
+"""
+
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def _factorize_categories(x: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the integer code of each observation and the categories in order of
+    appearance, like `pd.factorize()`. Missing values are coded as -1.
+
+    Variables of categorical dtype reuse their codes, which are only renumbered in
+    order of appearance.
+    """
+    if not pd.api.types.is_categorical_dtype(x):
+        return pd.factorize(x.to_numpy())
+
+    codes = x.cat.codes.to_numpy()
+    # the categories present, in order of appearance. The codes are small
+    # integers, which are much faster to hash than the categories.
+    present = pd.unique(codes[codes >= 0])
+    renumber = np.full(len(x.cat.categories) + 1, -1, dtype=np.intp)
+    renumber[present] = np.arange(len(present))
+
+    return renumber[codes], x.cat.categories.to_numpy()[present]
+
+
+def _count_categories(x: pd.Series) -> pd.Series:
+    """
+    Returns the number of observations per category, ordered from the most to the
+    least frequent, like `value_counts()`.
+    """
+    if pd.api.types.is_categorical_dtype(x):
+        return x.value_counts()
+
+    codes, uniques = _factorize_categories(x)
+    counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+    return pd.Series(counts, index=uniques, name=x.name).sort_values(
+        ascending=False
+    )
@@ -0,0 +1,312 @@
+"""Grouped target statistics computed on integer category codes.
+
+The functions in this module factorise a variable once and aggregate the target
+per category with `np.bincount`, which is much faster than a pandas groupby.
+"""
+
+from typing import Callable, Dict, Iterator, List, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+
+from feature_engine.encoding._factorization import _factorize_categories
+
+
+def _factorize(x: pd.Series) -> Tuple[np.ndarray, pd.Index]:
+    """
+    Returns the integer code of each observation and the categories in code order.
+
+    Categories are sorted, like in the index returned by a pandas groupby. Variables
+    cast as categorical reuse their codes and return all the categories, including
+    those not present in the data.
+    """
+    if pd.api.types.is_categorical_dtype(x):
+        return np.asarray(x.cat.codes, dtype=np.intp), x.cat.categories
+
+    codes, uniques = _factorize_categories(x)
+    try:
+        order = np.argsort(uniques, kind="stable")
+    except TypeError:
+        # categories of different types, which numpy can't compare
+        codes, categories = pd.factorize(x, sort=True)
+        return codes.astype(np.intp, copy=False), pd.Index(categories)
+
+    # the position of each category in the sorted categories, with -1 for NaN.
+    rank = np.empty(len(order) + 1, dtype=np.intp)
+    rank[order] = np.arange(len(order))
+    rank[-1] = -1
+    return rank[codes], pd.Index(uniques[order])
+
+
+def _grouped_statistics(
+    codes: np.ndarray, n_categories: int, y: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns the number of observations, the sum of the target and the sum of the
+    squared deviations of the target from its mean per category.
+
+    The deviations are computed in a second pass, after the means, so that they keep
+    their precision if the target has a large offset.
+    """
+    count = np.bincount(codes, minlength=n_categories).astype(float)
+    total = np.bincount(codes, weights=y, minlength=n_categories)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = np.where(count > 0, total / count, 0)
+    deviation = y - mean[codes]
+    sq_dev = np.bincount(codes, weights=deviation * deviation, minlength=n_categories)
+    return count, total, sq_dev
+
+
+def _target_statistics(
+    x: pd.Series, y: Union[pd.Series, np.ndarray]
+) -> Tuple[pd.Index, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Factorises a variable and returns its categories, together with the number of
+    observations, the sum of the target and the sum of the squared deviations of the
+    target from its mean per category.
+
+    With a binary target coded as 0 and 1, the sum of the target is the number of
+    positive observations per category.
+    """
+    codes, categories = _factorize(x)
+    count, total, sq_dev = _grouped_statistics(
+        codes, len(categories), np.asarray(y, dtype=float)
+    )
+    return categories, count, total, sq_dev
+
+
+def _stacked_batches(
+    X: pd.DataFrame, variables: List[Union[str, int]], max_stacked: int
+) -> Iterator[Tuple[List[Union[str, int]], List[pd.Index], np.ndarray, np.ndarray]]:
+    """
+    Factorises the variables and stacks their category codes, in batches of at
+    most `max_stacked` observations, or one variable per batch if it has more
+    observations.
+
+    The codes of each variable are shifted by the number of categories of the
+    preceding variables in the batch, so that the categories of all variables are
+    unique.
+
+    Yields
+    ------
+    batch: list
+        The variables in the batch.
+
+    categories: list
+        The categories of each variable in the batch.
+
+    offsets: array
+        The first code of each variable, followed by the total number of categories.
+
+    codes: array
+        The stacked codes, of length len(batch) * len(X).
+    """
+    per_batch = max(max_stacked // max(len(X), 1), 1)
+
+    for start in range(0, len(variables), per_batch):
+        stop = start + per_batch
+        factorized = [_factorize(X[var]) for var in variables[start:stop]]
+        categories = [categories for _, categories in factorized]
+        offsets = np.concatenate([[0], np.cumsum([len(c) for c in categories])])
+        codes = np.concatenate(
+            [codes + offset for (codes, _), offset in zip(factorized, offsets)]
+        )
+        yield variables[start:stop], categories, offsets, codes
+
+
+def _batched_target_statistics(
+    X: pd.DataFrame,
+    variables: List[Union[str, int]],
+    y: Union[pd.Series, np.ndarray],
+    max_stacked: int = 2**24,
+) -> Dict[Union[str, int], Tuple[pd.Index, np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Returns the output of `_target_statistics()` for several variables, computed
+    with one bincount over the stacked category codes of each batch of variables.
+    """
+    y = np.asarray(y, dtype=float)
+
+    statistics = {}
+    for batch, categories, offsets, codes in _stacked_batches(
+        X, variables, max_stacked
+    ):
+        count, total, sq_dev = _grouped_statistics(
+            codes, offsets[-1], np.tile(y, len(batch))
+        )
+        for var, cat, begin, end in zip(batch, categories, offsets, offsets[1:]):
+            statistics[var] = (
+                cat,
+                count[begin:end],
+                total[begin:end],
+                sq_dev[begin:end],
+            )
+
+    return statistics
+
+
+def _batched_contingency_tables(
+    X: pd.DataFrame,
+    variables: List[Union[str, int]],
+    y_codes: np.ndarray,
+    n_classes: int,
+    max_stacked: int = 2**24,
+) -> Dict[Union[str, int], Tuple[pd.Index, np.ndarray]]:
+    """
+    Returns the output of `_contingency_table()` for several variables, computed
+    with one bincount over the stacked category codes of each batch of variables.
+    """
+    tables = {}
+    for batch, categories, offsets, codes in _stacked_batches(
+        X, variables, max_stacked
+    ):
+        table = np.bincount(
+            codes * n_classes + np.tile(y_codes, len(batch)),
+            minlength=offsets[-1] * n_classes,
+        )
+        table = table.reshape(offsets[-1], n_classes).astype(float)
+        for var, cat, begin, end in zip(batch, categories, offsets, offsets[1:]):
+            tables[var] = (cat, table[begin:end])
+
+    return tables
+
+
+def _contingency_table(
+    x: pd.Series, y_codes: np.ndarray, n_classes: int
+) -> Tuple[pd.Index, np.ndarray]:
+    """
+    Factorises a variable and returns its categories, together with the number of
+    observations per category and class.
+
+    The table is computed in a single pass over the category codes and the class
+    codes of the target.
+
+    Returns
+    -------
+    categories: pandas Index
+        The categories of the variable, in the order of the rows of the table.
+
+    table: array of shape = [n_categories, n_classes]
+        The number of observations per category (rows) and class (columns).
+    """
+    codes, categories = _factorize(x)
+    table = np.bincount(
+        codes * n_classes + y_codes, minlength=len(categories) * n_classes
+    )
+    return categories, table.reshape(len(categories), n_classes).astype(float)
+
+
+def _fold_encoding(
+    codes: np.ndarray,
+    n_categories: int,
+    y: np.ndarray,
+    full_statistics: Tuple[np.ndarray, np.ndarray, np.ndarray],
+    test: np.ndarray,
+    encoding_func: Callable,
+) -> np.ndarray:
+    """
+    Encodes the held-out observations with the statistics of the remaining folds.
+
+    The statistics of the training folds are obtained by subtracting the statistics
+    of the held-out fold from those of the entire dataset. The squared deviations
+    from the mean of each part add up to those from the overall mean after adding
+    the squared differences between the means, times the number of observations.
+    """
+    full_count, full_total, full_sq_dev = full_statistics
+    test_count, test_total, test_sq_dev = _grouped_statistics(
+        codes[test], n_categories, y[test]
+    )
+    count = full_count - test_count
+    total = full_total - test_total
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        full_mean = np.where(full_count > 0, full_total / full_count, 0)
+        test_mean = np.where(test_count > 0, test_total / test_count, full_mean)
+        mean = np.where(count > 0, total / count, full_mean)
+
+    sq_dev = (
+        full_sq_dev
+        - test_sq_dev
+        - test_count * (test_mean - full_mean) ** 2
+        - count * (mean - full_mean) ** 2
+    )
+    encoding = encoding_func(count, total, np.maximum(sq_dev, 0))
+    return encoding[codes[test]]
+
+
+def _out_of_fold_encoding(
+    X: pd.DataFrame,
+    y: np.ndarray,
+    variables: List[Union[str, int]],
+    splits: List[Tuple[np.ndarray, np.ndarray]],
+    encoding_func: Callable,
+    n_jobs=None,
+) -> Dict[Union[str, int], np.ndarray]:
+    """
+    Encodes the categories of each observation with the encoding learned from the
+    folds that do not contain the observation.
+
+    Each variable is factorised only once, and all the folds of all the variables and
+    targets are encoded in parallel.
+
+    Parameters
+    ----------
+    X: pandas dataframe of shape = [n_samples, n_features]
+        The dataframe to encode.
+
+    y: array of shape = [n_samples, n_targets]
+        The target. Multi-class targets are passed as one indicator column per class.
+
+    variables: list
+        The variables to encode.
+
+    splits: list
+        The (train, test) indices of each fold.
+
+    encoding_func: callable
+        Function that takes the number of observations, the sum of the target and the
+        sum of the squared deviations of the target from its mean per category, and
+        returns the encoding per category.
+
+    n_jobs: int, default=None
+        The number of jobs to run in parallel.
+
+    Returns
+    -------
+    encodings: dict
+        Array of shape = [n_samples, n_targets] with the encoded values, per variable.
+    """
+    y = np.asarray(y, dtype=float)
+    n_targets = y.shape[1]
+
+    factorized = [_factorize(X[var]) for var in variables]
+    full_statistics = [
+        [
+            _grouped_statistics(codes, len(categories), y[:, j])
+            for j in range(n_targets)
+        ]
+        for codes, categories in factorized
+    ]
+
+    results = Parallel(n_jobs=n_jobs)(
+        delayed(_fold_encoding)(
+            codes, len(categories), y[:, j], full[j], test, encoding_func
+        )
+        for (codes, categories), full in zip(factorized, full_statistics)
+        for j in range(n_targets)
+        for _, test in splits
+    )
+    results = iter(results)
+
+    # observations that are not in any held-out fold keep the encoding learned
+    # from the entire dataset
+    encodings = {}
+    for var, (codes, _), full in zip(variables, factorized, full_statistics):
+        encoded = np.empty((len(X), n_targets), dtype=float)
+        for j in range(n_targets):
+            encoded[:, j] = encoding_func(*full[j])[codes]
+            for _, test in splits:
+                encoded[test, j] = next(results)
+        encodings[var] = encoded
+
+    return encodings
@@ -1,8 +1,11 @@
 import warnings
 from typing import List, Union
 
+import numpy as np
 import pandas as pd
+from pandas.api.extensions import take
 from sklearn.base import BaseEstimator, TransformerMixin
+from sklearn.model_selection import check_cv
 from sklearn.utils.validation import check_is_fitted
 
 from feature_engine._base_transformers.mixins import GetFeatureNamesOutMixin
@@ -23,9 +26,105 @@ from feature_engine.dataframe_checks import (
     _check_X_matches_training_df,
     check_X,
 )
+from feature_engine.encoding._factorization import _factorize_categories
+from feature_engine.encoding._grouped_statistics import _out_of_fold_encoding
 from feature_engine.tags import _return_tags
 
 
+def _encode(
+    x: pd.Series,
+    categories: pd.Index,
+    encoding: np.ndarray,
+    encoding_unseen: np.ndarray,
+) -> pd.Series:
+    """
+    Replaces the categories by their encoding. Unseen categories are replaced by
+    the last value of `encoding_unseen`.
+
+    Parameters
+    ----------
+    x: pandas series
+        The variable to encode.
+
+    categories: pandas index
+        The categories seen during fit.
+
+    encoding: array
+        The encoding of each category.
+
+    encoding_unseen: array
+        The encoding of each category, followed by the encoding of unseen
+        categories. Only used if the variable contains unseen categories, so that
+        the dtype of the encoding is kept otherwise.
+    """
+    if pd.api.types.is_categorical_dtype(x):
+        # only the categories of the variable are looked up.
+        idx = categories.get_indexer(x.cat.categories)[x.cat.codes.to_numpy()]
+    else:
+        # the categories are looked up once, and the observations take their
+        # position through the codes.
+        codes, uniques = _factorize_categories(x)
+        idx = np.append(categories.get_indexer(uniques), -1)[codes]
+
+    if (idx == -1).any():
+        encoding = encoding_unseen
+
+    return pd.Series(encoding[idx], index=x.index, name=x.name)
+
+
+def _inverse_map(
+    x: pd.Series,
+    values: Union[None, np.ndarray],
+    position: Union[None, np.ndarray],
+    categories: np.ndarray,
+) -> pd.Series:
+    """
+    Replaces the encoded values by the original categories. Values that do not
+    correspond to any category are replaced by NaN.
+
+    Parameters
+    ----------
+    x: pandas series
+        The encoded variable.
+
+    values: array or None
+        The sorted encoded values. None if the encoded values are the positions of
+        the categories.
+
+    position: array or None
+        The position of the category of each encoded value.
+
+    categories: array
+        The categories, in the order of the encoding dictionary.
+    """
+    encoded = x.to_numpy()
+
+    if encoded.dtype.kind not in "biuf":
+        encoded = pd.to_numeric(x, errors="coerce").to_numpy(dtype=float)
+
+    if values is None:
+        with np.errstate(invalid="ignore"):
+            found = (encoded >= 0) & (encoded < len(categories))
+            if encoded.dtype.kind == "f":
+                found &= encoded % 1 == 0
+        if found.all():
+            return pd.Series(
+                categories[encoded.astype(np.intp)], index=x.index, name=x.name
+            )
+        idx = np.where(found, encoded, -1).astype(np.intp)
+    else:
+        # the binary search over millions of unsorted values is slower than hashing,
+        # so only the distinct encoded values are searched.
+        codes, uniques = pd.factorize(encoded)
+        idx = np.searchsorted(values, uniques).clip(max=len(values) - 1)
+        idx = np.where(values[idx] == uniques, position[idx], -1)
+        idx = np.append(idx, -1)[codes]
+
+    return pd.Series(
+        take(categories, idx, allow_fill=True), index=x.index, name=x.name
+    )
+
+
 @Substitution(
     ignore_format=_ignore_format_docstring,
     variables=_variables_categorical_docstring,
@@ -167,23 +266,13 @@ class CategoricalMethodsMixin(BaseEstimator, TransformerMixin, GetFeatureNamesOu
         # check if dataset contains na
         _check_contains_na(X, self.variables_)
 
-        # replace categories by the learned parameters
+        # replace categories by the learned parameters. Seen and unseen categories
+        # are resolved in a single look up, which returns the encoded values with
+        # their final dtype.
         for feature in self.encoder_dict_.keys():
-            X[feature] = X[feature].map(self.encoder_dict_[feature])
-
-            # if original variables are cast as categorical, they will remain
-            # categorical after the encoding, and this is probably not desired
-            if pd.api.types.is_categorical_dtype(X[feature]):
-                if all(isinstance(x, int) for x in X[feature]):
-                    X[feature] = X[feature].astype("int")
-                else:
-                    X[feature] = X[feature].astype("float")
-
-        if self.unseen == "encode":
-            X[self.variables_] = X[self.variables_].fillna(
-                self._unseen, downcast="infer"
-            )
-        else:
+            X[feature] = _encode(X[feature], *self._get_lookup(feature)[1])
+
+        if self.unseen != "encode":
             # check if nan values were introduced by the transformation
             self._check_nan_values_after_transformation(X)
 
@@ -236,11 +325,68 @@ class CategoricalMethodsMixin(BaseEstimator, TransformerMixin, GetFeatureNamesOu
 
         # replace encoded categories by the original values
         for feature in self.encoder_dict_.keys():
-            inv_map = {v: k for k, v in self.encoder_dict_[feature].items()}
-            X[feature] = X[feature].map(inv_map)
+            X[feature] = _inverse_map(X[feature], *self._get_lookup(feature)[2])
 
         return X
 
+    def _fit_lookup(self):
+        """
+        Stores the tables used by `transform()` and `inverse_transform()` for each
+        variable in `encoder_dict_`.
+        """
+        self._lookup = {
+            feature: self._make_lookup(mapping)
+            for feature, mapping in self.encoder_dict_.items()
+        }
+
+    def _get_lookup(self, feature):
+        """
+        Returns the tables of a variable stored in fit. They are made again, without
+        storing them, if the encoder was fitted with an older version, or if
+        `encoder_dict_` was modified after fit.
+        """
+        mapping = self.encoder_dict_[feature]
+        lookup = getattr(self, "_lookup", {}).get(feature)
+        if lookup is None or lookup[0] != mapping:
+            return self._make_lookup(mapping)
+        return lookup
+
+    def _make_lookup(self, mapping: dict):
+        """
+        Returns a copy of the mapping of a variable, to find out later if it was
+        modified, and the tables to encode and to decode the variable.
+
+        To encode, the categories are stored in an index, whose hash table is built
+        at the first look up and reused afterwards, together with the array of
+        encoded values. The value for unseen categories, or NaN, is appended at the
+        end of the array, where the position -1 of unseen categories points.
+
+        To decode, if the categories were encoded as consecutive integers starting
+        at 0, like in the OrdinalEncoder(), the encoded value is the position of the
+        category. Otherwise, the encoded values are sorted, to be found with a
+        binary search. If several categories share the encoded value, the last one
+        is returned.
+        """
+        unseen = self._unseen if getattr(self, "unseen", None) == "encode" else np.nan
+
+        categories = pd.Index(list(mapping.keys()))
+        encoding = np.asarray(list(mapping.values()))
+        lookup = (categories, encoding, np.append(encoding, unseen))
+
+        categories = categories.to_numpy()
+        values = encoding.astype(float)
+
+        if np.array_equal(values, np.arange(len(values))):
+            return dict(mapping), lookup, (None, None, categories)
+
+        # categories absent from the data can be encoded as NaN.
+        position = np.flatnonzero(~np.isnan(values))
+        position = position[np.argsort(values[position], kind="stable")]
+        values = values[position]
+        last = np.append(values[1:] != values[:-1], True)
+
+        return dict(mapping), lookup, (values[last], position[last], categories)
+
     def _more_tags(self):
         tags_dict = _return_tags()
         tags_dict["variables"] = "categorical"
@@ -249,3 +395,143 @@ class CategoricalMethodsMixin(BaseEstimator, TransformerMixin, GetFeatureNamesOu
         # so we need to leave without this test
         tags_dict["_xfail_checks"]["check_estimators_nan_inf"] = "transformer allows NA"
         return tags_dict
+
+
+class TargetEncoderMixin:
+    """Shared methods across encoders that replace categories by target statistics.
+
+    - Out-of-fold encoding of the training set in `fit_transform()`.
+    - Encoding of multi-class targets, where each variable is replaced by one
+      variable per class, and `encoder_dict_` contains the mappings per class, per
+      variable.
+
+    The encoders need to implement the method `_encode()`, which returns the encoding
+    per category from the number of observations, the sum of the target and the sum
+    of the squared deviations of the target from its mean per category.
+    """
+
+    def _check_multiclass(self, multiclass: bool) -> None:
+        if not isinstance(multiclass, bool):
+            raise ValueError(
+                "multiclass takes only booleans True and False. "
+                f"Got {multiclass} instead."
+            )
+
+    def _encode_out_of_fold(
+        self, X: pd.DataFrame, y: pd.Series, classifier: bool
+    ) -> pd.DataFrame:
+        """
+        Replaces the categories of each observation by the encoding learned from the
+        folds that do not contain the observation.
+        """
+        splits = list(check_cv(self.cv, y, classifier=classifier).split(X, y))
+
+        if self.multiclass is True:
+            # one indicator column per class
+            target = np.asarray(y)[:, None] == self.classes_[None, :]
+        else:
+            target = np.asarray(y)[:, None]
+
+        encodings = _out_of_fold_encoding(
+            X, target, self.variables_, splits, self._encode, self.n_jobs
+        )
+
+        if self.multiclass is True:
+            for feature in self.variables_:
+                for i, class_ in enumerate(self.classes_.tolist()):
+                    X[f"{feature}_{class_}"] = encodings[feature][:, i]
+            X.drop(labels=self.variables_, axis=1, inplace=True)
+        else:
+            for feature in self.variables_:
+                X[feature] = encodings[feature][:, 0]
+
+        return X
+
+    def transform(self, X: pd.DataFrame) -> pd.DataFrame:
+        """Replace categories with the learned parameters.
+
+        With `multiclass=True`, each variable is replaced by one variable per class.
+
+        Parameters
+        ----------
+        X: pandas dataframe of shape = [n_samples, n_features].
+            The dataset to transform.
+
+        Returns
+        -------
+        X_new: pandas dataframe.
+            The dataframe containing the categories replaced by numbers.
+        """
+        if self.multiclass is False:
+            return super().transform(X)  # type: ignore
+
+        X = self._check_transform_input_and_state(X)  # type: ignore
+
+        # check if dataset contains na
+        _check_contains_na(X, self.variables_)
+
+        nan_columns = []
+        for feature in self.variables_:
+            mappings = self.encoder_dict_[feature]
+            classes = self.classes_.tolist()
+
+            # all classes share the categories, so we look them up only once.
+            categories = pd.Index(list(mappings[classes[0]].keys()))
+            indexer = categories.get_indexer(X[feature])
+            if (indexer == -1).any():
+                nan_columns.append(str(feature))
+
+            for class_ in classes:
+                # unseen categories take the last value of the array
+                unseen = self._unseen[class_] if self.unseen == "encode" else np.nan
+                values = np.append(list(mappings[class_].values()), unseen)
+                X[f"{feature}_{class_}"] = values[indexer]
+
+        # drop the original non-encoded variables.
+        X.drop(labels=self.variables_, axis=1, inplace=True)
+
+        if nan_columns and self.unseen != "encode":
+            msg = (
+                "During the encoding, NaN values were introduced in the feature(s) "
+                f"{', '.join(nan_columns)}."
+            )
+            if self.unseen == "ignore":
+                warnings.warn(msg)
+            else:
+                raise ValueError(msg)
+
+        return X
+
+    def inverse_transform(self, X: pd.DataFrame) -> pd.DataFrame:
+        """Convert the encoded variable back to the original values.
+
+        Note that if multiclass is True, then this method is not implemented.
+
+        Parameters
+        ----------
+        X: pandas dataframe of shape = [n_samples, n_features].
+            The transformed dataframe.
+
+        Returns
+        -------
+        X_tr: pandas dataframe of shape = [n_samples, n_features].
+            The un-transformed dataframe, with the categorical variables containing the
+            original values.
+        """
+        if self.multiclass is True:
+            raise NotImplementedError(
+                "inverse_transform is not implemented for multi-class targets."
+            )
+        return super().inverse_transform(X)  # type: ignore
+
+    def _add_new_feature_names(self, feature_names) -> List:
+        """With multi-class targets, replaces the variables by one per class."""
+        if self.multiclass is False:
+            return feature_names
+
+        feature_names = feature_names + [
+            f"{feature}_{class_}"
+            for feature in self.variables_
+            for class_ in self.classes_.tolist()
+        ]
+        return [f for f in feature_names if f not in self.variables_]
@@ -22,6 +22,7 @@ from feature_engine._docstrings.methods import (
 )
 from feature_engine._docstrings.substitute import Substitution
 from feature_engine.dataframe_checks import check_X
+from feature_engine.encoding._factorization import _count_categories
 from feature_engine.encoding._helper_functions import check_parameter_unseen
 from feature_engine.encoding.base_encoder import (
     CategoricalInitMixin,
@@ -185,14 +186,18 @@ class CountFrequencyEncoder(CategoricalInitMixin, CategoricalMethodsMixin):
 
         # learn encoding maps
         for var in self.variables_:
+            counts = _count_categories(X[var])
+
             if self.encoding_method == "count":
-                self.encoder_dict_[var] = X[var].value_counts().to_dict()
+                self.encoder_dict_[var] = counts.to_dict()
 
             elif self.encoding_method == "frequency":
-                self.encoder_dict_[var] = X[var].value_counts(normalize=True).to_dict()
+                self.encoder_dict_[var] = (counts / counts.sum()).to_dict()
 
         # unseen categories are replaced by 0
         if self.unseen == "encode":
             self._unseen = 0
 
+        self._fit_lookup()
+
         return self
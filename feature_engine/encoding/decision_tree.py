@@ -3,8 +3,12 @@
 
 from typing import List, Optional, Union
 
+import numpy as np
 import pandas as pd
+from sklearn.metrics import get_scorer
+from sklearn.model_selection import ParameterGrid, check_cv
 from sklearn.pipeline import Pipeline
+from sklearn.tree import DecisionTreeClassifier, DecisionTreeRegressor
 from sklearn.utils.multiclass import check_classification_targets, type_of_target
 
 from feature_engine._docstrings.fit_attributes import (
@@ -14,12 +18,14 @@ from feature_engine._docstrings.fit_attributes import (
 )
 from feature_engine._docstrings.init_parameters import (
     _ignore_format_docstring,
+    _n_jobs_docstring,
     _variables_categorical_docstring,
 )
 from feature_engine._docstrings.methods import _fit_transform_docstring
 from feature_engine._docstrings.substitute import Substitution
-from feature_engine.dataframe_checks import check_X_y
+from feature_engine.dataframe_checks import _check_contains_na, check_X_y
 from feature_engine.discretisation import DecisionTreeDiscretiser
+from feature_engine.discretisation._tree_aggregates import _search_trees
 from feature_engine.encoding.base_encoder import (
     CategoricalInitMixin,
     CategoricalMethodsMixin,
@@ -31,6 +37,7 @@ from feature_engine.tags import _return_tags
 @Substitution(
     ignore_format=_ignore_format_docstring,
     variables=_variables_categorical_docstring,
+    n_jobs=_n_jobs_docstring,
     variables_=_variables_attribute_docstring,
     feature_names_in_=_feature_names_in_docstring,
     n_features_in_=_n_features_in_docstring,
@@ -111,10 +118,30 @@ class DecisionTreeEncoder(CategoricalInitMixin, CategoricalMethodsMixin):
 
     {ignore_format}
 
+    fit_on_aggregates: bool, default=False
+        Whether to train the decision trees on the number of observations and the
+        target per category, instead of on the individual observations. The trees
+        learn the same splits, but are trained on as many rows as categories, which
+        is much faster on large datasets. Note that hyperparameters that count
+        samples, like `min_samples_leaf` or `min_samples_split`, then count
+        categories. The cross-validation splits are computed once and shared by all
+        variables.
+
+    {n_jobs}
+
     Attributes
     ----------
     encoder_:
-        sklearn Pipeline containing the ordinal encoder and the decision tree.
+        sklearn Pipeline containing the ordinal encoder and the decision tree. Only
+        present if `fit_on_aggregates=False`.
+
+    encoder_dict_:
+        Dictionary with the prediction of the decision tree per category, per
+        variable. Only present if `fit_on_aggregates=True`.
+
+    scores_dict_:
+        Dictionary with the score of the best decision tree per variable. Only
+        present if `fit_on_aggregates=True`.
 
     {variables_}
 
@@ -198,8 +225,16 @@ class DecisionTreeEncoder(CategoricalInitMixin, CategoricalMethodsMixin):
         random_state: Optional[int] = None,
         variables: Union[None, int, str, List[Union[str, int]]] = None,
         ignore_format: bool = False,
+        fit_on_aggregates: bool = False,
+        n_jobs=None,
     ) -> None:
 
+        if not isinstance(fit_on_aggregates, bool):
+            raise ValueError(
+                "fit_on_aggregates takes only booleans True and False. "
+                f"Got {fit_on_aggregates} instead."
+            )
+
         super().__init__(variables, ignore_format)
         self.encoding_method = encoding_method
         self.cv = cv
@@ -207,6 +242,8 @@ class DecisionTreeEncoder(CategoricalInitMixin, CategoricalMethodsMixin):
         self.regression = regression
         self.param_grid = param_grid
         self.random_state = random_state
+        self.fit_on_aggregates = fit_on_aggregates
+        self.n_jobs = n_jobs
 
     def fit(self, X: pd.DataFrame, y: pd.Series):
         """
@@ -252,6 +289,10 @@ class DecisionTreeEncoder(CategoricalInitMixin, CategoricalMethodsMixin):
             unseen="raise",
         )
 
+        if self.fit_on_aggregates is True:
+            self._fit_on_aggregates(X, y, cat_encoder, param_grid)
+            return self
+
         # initialize decision tree discretiser
         tree_discretiser = DecisionTreeDiscretiser(
             cv=self.cv,
@@ -260,6 +301,7 @@ class DecisionTreeEncoder(CategoricalInitMixin, CategoricalMethodsMixin):
             param_grid=param_grid,
             regression=self.regression,
             random_state=self.random_state,
+            n_jobs=self.n_jobs,
         )
 
         # pipeline for the encoder
@@ -274,6 +316,63 @@ class DecisionTreeEncoder(CategoricalInitMixin, CategoricalMethodsMixin):
 
         return self
 
+    def _fit_on_aggregates(
+        self, X: pd.DataFrame, y: pd.Series, cat_encoder: OrdinalEncoder, param_grid
+    ):
+        """
+        Grid search the tree of each variable on the number of observations and
+        target sum per category, instead of on the observations.
+
+        The cross-validation splits are computed once and shared by all variables.
+        The folds of all variables are trained in parallel.
+        """
+        X_enc = cat_encoder.fit_transform(X, y)
+        y_ = np.asarray(y)
+
+        if self.regression:
+            model = DecisionTreeRegressor(random_state=self.random_state)
+        else:
+            model = DecisionTreeClassifier(random_state=self.random_state)
+
+        splits = list(
+            check_cv(self.cv, y, classifier=not self.regression).split(X, y)
+        )
+        candidates = list(ParameterGrid(param_grid))
+        scorer = get_scorer(self.scoring)
+
+        codes = {
+            var: X_enc[var].to_numpy(dtype=np.intp) for var in self.variables_
+        }
+        n_categories = {
+            var: len(cat_encoder.encoder_dict_[var]) for var in self.variables_
+        }
+
+        trees = _search_trees(
+            model,
+            candidates,
+            scorer,
+            codes,
+            y_,
+            n_categories,
+            self.regression,
+            splits,
+            self.n_jobs,
+        )
+
+        self.encoder_dict_ = {}
+        self.scores_dict_ = {}
+
+        for var, tree in trees.items():
+            ordinal = np.arange(n_categories[var]).reshape(-1, 1)
+            if self.regression:
+                predictions = tree.predict(ordinal)
+            else:
+                predictions = tree.predict_proba(ordinal)[:, 1]
+
+            categories = cat_encoder.encoder_dict_[var].keys()
+            self.encoder_dict_[var] = dict(zip(categories, predictions.tolist()))
+            self.scores_dict_[var] = scorer(tree, codes[var].reshape(-1, 1), y_)
+
     def transform(self, X: pd.DataFrame) -> pd.DataFrame:
         """
         Replace categorical variables by the predictions of the decision tree.
@@ -291,7 +390,22 @@ class DecisionTreeEncoder(CategoricalInitMixin, CategoricalMethodsMixin):
 
         X = self._check_transform_input_and_state(X)
 
-        X = self.encoder_.transform(X)
+        if self.fit_on_aggregates is False:
+            return self.encoder_.transform(X)
+
+        _check_contains_na(X, self.variables_)
+
+        for feature in self.variables_:
+            categories = pd.Index(list(self.encoder_dict_[feature].keys()))
+            codes = categories.get_indexer(X[feature])
+            if (codes == -1).any():
+                raise ValueError(
+                    f"During the encoding, unseen categories were found in the "
+                    f"feature {feature}. Fit the encoder on the entire data or group "
+                    f"infrequent categories with the RareLabelEncoder()."
+                )
+            encoding = np.asarray(list(self.encoder_dict_[feature].values()))
+            X[feature] = encoding[codes]
 
         return X
 
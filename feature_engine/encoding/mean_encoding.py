@@ -2,7 +2,9 @@
 # License: BSD 3 clause
 from typing import List, Union
 
+import numpy as np
 import pandas as pd
+from sklearn.utils.multiclass import check_classification_targets
 
 from feature_engine._docstrings.fit_attributes import (
     _feature_names_in_docstring,
@@ -10,7 +12,9 @@ from feature_engine._docstrings.fit_attributes import (
     _variables_attribute_docstring,
 )
 from feature_engine._docstrings.init_parameters import (
+    _cv_docstring,
     _ignore_format_docstring,
+    _n_jobs_docstring,
     _unseen_docstring,
     _variables_categorical_docstring,
 )
@@ -20,11 +24,16 @@ from feature_engine._docstrings.methods import (
     _transform_encoders_docstring,
 )
 from feature_engine._docstrings.substitute import Substitution
+from feature_engine.encoding._grouped_statistics import (
+    _batched_target_statistics,
+    _contingency_table,
+)
 from feature_engine.encoding._helper_functions import check_parameter_unseen
 from feature_engine.dataframe_checks import check_X_y
 from feature_engine.encoding.base_encoder import (
     CategoricalInitMixin,
     CategoricalMethodsMixin,
+    TargetEncoderMixin,
 )
 
 
@@ -38,6 +47,8 @@ _unseen_docstring = (
     ignore_format=_ignore_format_docstring,
     variables=_variables_categorical_docstring,
     unseen=_unseen_docstring,
+    cv=_cv_docstring,
+    n_jobs=_n_jobs_docstring,
     variables_=_variables_attribute_docstring,
     feature_names_in_=_feature_names_in_docstring,
     n_features_in_=_n_features_in_docstring,
@@ -45,7 +56,7 @@ _unseen_docstring = (
     transform=_transform_encoders_docstring,
     inverse_transform=_inverse_transform_docstring,
 )
-class MeanEncoder(CategoricalInitMixin, CategoricalMethodsMixin):
+class MeanEncoder(CategoricalInitMixin, TargetEncoderMixin, CategoricalMethodsMixin):
     """
     The MeanEncoder() replaces categories by the mean value of the target for each
     category.
@@ -104,10 +115,27 @@ class MeanEncoder(CategoricalInitMixin, CategoricalMethodsMixin):
         calculated as ni / (ni+smoothing). Higher values lead to stronger smoothing
         (higher weight of prior).
 
+    multiclass: bool, default=False
+        Whether the target is multi-class. If True, each variable is replaced by one
+        variable per class, with the proportion of observations of that class per
+        category, named with the variable name and the class, like in `colour_blue`.
+        Smoothing is applied to the proportion of each class. If `unseen='encode'`,
+        unseen categories are encoded with the proportion of each class in the
+        entire dataset.
+
+    {cv}
+
+    {n_jobs}
+
     Attributes
     ----------
     encoder_dict_:
-        Dictionary with the target mean value per category per variable.
+        Dictionary with the target mean value per category per variable. If
+        `multiclass=True`, dictionary with the proportion of observations of each
+        class per category, per class, per variable.
+
+    classes_:
+        The classes of the target. Only present if `multiclass=True`.
 
     {variables_}
 
@@ -171,6 +199,9 @@ class MeanEncoder(CategoricalInitMixin, CategoricalMethodsMixin):
         ignore_format: bool = False,
         unseen: str = "ignore",
         smoothing: Union[int, float, str] = 0.0,
+        multiclass: bool = False,
+        cv=None,
+        n_jobs=None,
     ) -> None:
         super().__init__(variables, ignore_format)
         if (
@@ -185,6 +216,10 @@ class MeanEncoder(CategoricalInitMixin, CategoricalMethodsMixin):
         self.smoothing = smoothing
         check_parameter_unseen(unseen, ["ignore", "raise", "encode"])
         self.unseen = unseen
+        self._check_multiclass(multiclass)
+        self.multiclass = multiclass
+        self.cv = cv
+        self.n_jobs = n_jobs
 
     def fit(self, X: pd.DataFrame, y: pd.Series):
         """
@@ -206,25 +241,111 @@ class MeanEncoder(CategoricalInitMixin, CategoricalMethodsMixin):
 
         self.encoder_dict_ = {}
 
-        y_prior = y.mean()
+        if self.multiclass is True:
+            self._fit_multiclass(X, y)
+            return self
+
+        if self.unseen == "encode":
+            self._unseen = y.mean()
+
+        statistics = _batched_target_statistics(X, self.variables_, y)
+
+        for var in self.variables_:
+            categories, count, total, sq_dev = statistics[var]
+            encoding = self._encode(count, total, sq_dev)
+            # categories of categorical variables that are absent from the data
+            # have no target mean.
+            encoding[count == 0] = np.nan
+            self.encoder_dict_[var] = dict(zip(categories, encoding.tolist()))
+
+        self._fit_lookup()
+
+        return self
+
+    def _fit_multiclass(self, X: pd.DataFrame, y: pd.Series):
+        """
+        Learn the proportion of observations of each class, per category, from the
+        contingency table of each variable against the target.
+        """
+        check_classification_targets(y)
+        y_codes, classes = pd.factorize(y, sort=True)
+        self.classes_ = np.asarray(classes)
+        classes = self.classes_.tolist()
 
         if self.unseen == "encode":
-            self._unseen = y_prior
+            y_prior = np.bincount(y_codes, minlength=len(classes)) / len(y)
+            self._unseen = dict(zip(classes, y_prior.tolist()))
 
-        if self.smoothing == "auto":
-            y_var = y.var(ddof=0)
         for var in self.variables_:
+            categories, table = _contingency_table(X[var], y_codes, len(classes))
+            count = table.sum(axis=1)
+            self.encoder_dict_[var] = {}
+            for i, class_ in enumerate(classes):
+                # the squared deviations of the class indicator from its mean.
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    sq_dev = np.where(count > 0, table[:, i] ** 2 / count, 0)
+                sq_dev = table[:, i] - sq_dev
+                encoding = self._encode(count, table[:, i], sq_dev)
+                encoding[count == 0] = np.nan
+                self.encoder_dict_[var][class_] = dict(
+                    zip(categories, encoding.tolist())
+                )
+
+    def fit_transform(self, X: pd.DataFrame, y: pd.Series) -> pd.DataFrame:
+        """
+        Learn the mean value of the target for each category of the variable and
+        encode the training set.
+
+        If `cv` is not None, each observation is encoded with the target mean values
+        learned from the folds that do not contain the observation.
+
+        Parameters
+        ----------
+        X: pandas dataframe of shape = [n_samples, n_features]
+            The training input samples. Can be the entire dataframe, not just the
+            variables to be encoded.
+
+        y: pandas series
+            The target.
+
+        Returns
+        -------
+        X_new: pandas dataframe of shape = [n_samples, n_features].
+            The dataframe containing the categories replaced by numbers.
+        """
+        if self.cv is None:
+            return super().fit_transform(X, y)
+
+        self.fit(X, y)
+
+        X, y = check_X_y(X, y)
+
+        return self._encode_out_of_fold(X, y, classifier=self.multiclass)
+
+    def _encode(
+        self, count: np.ndarray, total: np.ndarray, sq_dev: np.ndarray
+    ) -> np.ndarray:
+        """
+        Returns the smoothed target mean per category, from the number of
+        observations, the sum of the target and the sum of the squared deviations of
+        the target from its mean per category. Categories without observations are
+        encoded with the prior.
+        """
+        n_obs = count.sum()
+        y_prior = total.sum() / n_obs
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean = total / count
             if self.smoothing == "auto":
-                damping = y.groupby(X[var]).var(ddof=0) / y_var
+                between = np.where(count > 0, count * (mean - y_prior) ** 2, 0)
+                y_var = (sq_dev.sum() + between.sum()) / n_obs
+                damping = sq_dev / count / y_var
             else:
                 damping = self.smoothing
-            counts = X[var].value_counts()
-            _lambda = counts / (counts + damping)
-            self.encoder_dict_[var] = (
-                _lambda * y.groupby(X[var]).mean() + (1.0 - _lambda) * y_prior
-            ).to_dict()
+            _lambda = count / (count + damping)
+            encoding = _lambda * mean + (1.0 - _lambda) * y_prior
 
-        return self
+        return np.where(count > 0, encoding, y_prior)
 
     def inverse_transform(self, X: pd.DataFrame) -> pd.DataFrame:
         """Convert the encoded variable back to the original values.
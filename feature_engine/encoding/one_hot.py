@@ -18,6 +18,10 @@ from feature_engine._docstrings.init_parameters import (
 from feature_engine._docstrings.methods import _fit_transform_docstring
 from feature_engine._docstrings.substitute import Substitution
 from feature_engine.dataframe_checks import _check_contains_na, check_X
+from feature_engine.encoding._factorization import (
+    _count_categories,
+    _factorize_categories,
+)
 from feature_engine.encoding.base_encoder import (
     CategoricalInitMixin,
     CategoricalMethodsMixin,
@@ -204,13 +208,17 @@ class OneHotEncoder(CategoricalInitMixin, CategoricalMethodsMixin):
 
         self.encoder_dict_ = {}
 
+        # categories in order of appearance
+        uniques = {
+            var: list(_factorize_categories(X[var])[1]) for var in self.variables_
+        }
+
         # make dummies only for the most popular categories
         if self.top_categories:
             for var in self.variables_:
                 self.encoder_dict_[var] = [
                     x
-                    for x in X[var]
-                    .value_counts()
+                    for x in _count_categories(X[var])
                     .sort_values(ascending=False)
                     .head(self.top_categories)
                     .index
@@ -220,23 +228,21 @@ class OneHotEncoder(CategoricalInitMixin, CategoricalMethodsMixin):
             # return k-1 dummies
             if self.drop_last:
                 for var in self.variables_:
-                    category_ls = [x for x in X[var].unique()]
-                    self.encoder_dict_[var] = category_ls[:-1]
+                    self.encoder_dict_[var] = uniques[var][:-1]
 
             # return k dummies
             else:
                 for var in self.variables_:
-                    self.encoder_dict_[var] = [x for x in X[var].unique()]
+                    self.encoder_dict_[var] = uniques[var]
 
         self.variables_binary_ = [
-            var for var in self.variables_ if X[var].nunique() == 2
+            var for var in self.variables_ if len(uniques[var]) == 2
         ]
 
         # automatically encode binary variables as 1 dummy
         if self.drop_last_binary:
             for var in self.variables_binary_:
-                category = X[var].unique()[0]
-                self.encoder_dict_[var] = [category]
+                self.encoder_dict_[var] = [uniques[var][0]]
 
         return self
 
@@ -263,8 +269,13 @@ class OneHotEncoder(CategoricalInitMixin, CategoricalMethodsMixin):
         _check_contains_na(X, self.variables_)
 
         for feature in self.variables_:
-            for category in self.encoder_dict_[feature]:
-                X[f"{feature}_{category}"] = np.where(X[feature] == category, 1, 0)
+            # the categories are looked up once, and the dummies are found by
+            # comparing integer codes.
+            codes, uniques = _factorize_categories(X[feature])
+            position = pd.Index(self.encoder_dict_[feature]).get_indexer(uniques)
+            position = np.append(position, -1)[codes]
+            for i, category in enumerate(self.encoder_dict_[feature]):
+                X[f"{feature}_{category}"] = np.where(position == i, 1, 0)
 
         # drop the original non-encoded variables.
         X.drop(labels=self.variables_, axis=1, inplace=True)
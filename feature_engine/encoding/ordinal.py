@@ -3,6 +3,7 @@
 
 from typing import List, Optional, Union
 
+import numpy as np
 import pandas as pd
 
 from feature_engine._docstrings.fit_attributes import (
@@ -21,6 +22,8 @@ from feature_engine._docstrings.methods import (
     _transform_encoders_docstring,
 )
 from feature_engine._docstrings.substitute import Substitution
+from feature_engine.encoding._factorization import _factorize_categories
+from feature_engine.encoding._grouped_statistics import _batched_target_statistics
 from feature_engine.encoding._helper_functions import check_parameter_unseen
 from feature_engine.dataframe_checks import check_X, check_X_y
 from feature_engine.encoding.base_encoder import (
@@ -197,18 +200,26 @@ class OrdinalEncoder(CategoricalInitMixin, CategoricalMethodsMixin):
         # find mappings
         self.encoder_dict_ = {}
 
+        if self.encoding_method == "ordered":
+            statistics = _batched_target_statistics(X, self.variables_, y)
+
         for var in self.variables_:
 
             if self.encoding_method == "ordered":
-                t = y.groupby(X[var]).mean()  # type: ignore
+                categories, count, total, _ = statistics[var]
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    t = pd.Series(total / count, index=categories)
                 t = t.sort_values(ascending=True).index
 
             elif self.encoding_method == "arbitrary":
-                t = X[var].unique()
+                # categories in order of appearance
+                _, t = _factorize_categories(X[var])
 
             self.encoder_dict_[var] = {k: i for i, k in enumerate(t, 0)}
 
         if self.unseen == "encode":
             self._unseen = -1
 
+        self._fit_lookup()
+
         return self
@@ -23,6 +23,7 @@ from feature_engine._docstrings.methods import (
     _transform_encoders_docstring,
 )
 from feature_engine._docstrings.substitute import Substitution
+from feature_engine.encoding._grouped_statistics import _batched_target_statistics
 from feature_engine.encoding._helper_functions import check_parameter_unseen
 from feature_engine.dataframe_checks import check_X_y
 from feature_engine.encoding.base_encoder import (
@@ -104,6 +105,12 @@ class PRatioEncoder(CategoricalInitMixin, CategoricalMethodsMixin):
 
     {unseen}
 
+    smoothing: int, float, default=0.0
+        Laplace smoothing. The number added to the count of positive and negative
+        observations of each category before computing the probabilities. If 0, the
+        encoder raises an error when a category has no observations of one of the
+        classes. Values greater than 0 return a finite ratio for those categories.
+
     Attributes
     ----------
     encoder_dict_:
@@ -143,16 +150,23 @@ class PRatioEncoder(CategoricalInitMixin, CategoricalMethodsMixin):
         variables: Union[None, int, str, List[Union[str, int]]] = None,
         ignore_format: bool = False,
         unseen: str = "ignore",
+        smoothing: Union[int, float] = 0.0,
     ) -> None:
 
         if encoding_method not in ["ratio", "log_ratio"]:
             raise ValueError(
                 "encoding_method takes only values 'ratio' and 'log_ratio'"
             )
+        if not isinstance(smoothing, (int, float)) or smoothing < 0:
+            raise ValueError(
+                f"smoothing must be a number greater than or equal to 0. "
+                f"Got {smoothing} instead."
+            )
         super().__init__(variables, ignore_format)
         self.encoding_method = encoding_method
         check_parameter_unseen(unseen, ["ignore", "raise"])
         self.unseen = unseen
+        self.smoothing = smoothing
 
     def fit(self, X: pd.DataFrame, y: pd.Series):
         """
@@ -181,40 +195,44 @@ class PRatioEncoder(CategoricalInitMixin, CategoricalMethodsMixin):
         self._fit(X)
         self._get_feature_names_in(X)
 
-        temp = pd.concat([X, y], axis=1)
-        temp.columns = list(X.columns) + ["target"]
-
         # if target does not have values 0 and 1, we need to remap, to be able to
         # compute the averages.
         if any(x for x in y.unique() if x not in [0, 1]):
-            temp["target"] = np.where(temp["target"] == y.unique()[0], 0, 1)
+            y = np.where(y == y.unique()[0], 0, 1)
 
         self.encoder_dict_ = {}
 
+        statistics = _batched_target_statistics(X, self.variables_, y)
+
         for var in self.variables_:
+            categories, count, n_pos, _ = statistics[var]
 
-            t = temp.groupby(var)["target"].mean()
-            t = pd.concat([t, 1 - t], axis=1)
-            t.columns = ["p1", "p0"]
+            # with Laplace smoothing, both classes gain `smoothing` observations.
+            with np.errstate(divide="ignore", invalid="ignore"):
+                p1 = (n_pos + self.smoothing) / (count + 2 * self.smoothing)
+            p0 = 1 - p1
 
             if self.encoding_method == "log_ratio":
-                if not t.loc[t["p0"] == 0, :].empty or not t.loc[t["p1"] == 0, :].empty:
+                if (p0 == 0).any() or (p1 == 0).any():
                     raise ValueError(
                         "p(0) or p(1) for a category in variable {} is zero, log of "
                         "zero is not defined".format(var)
                     )
                 else:
-                    self.encoder_dict_[var] = (np.log(t.p1 / t.p0)).to_dict()
+                    encoding = np.log(p1 / p0)
 
             elif self.encoding_method == "ratio":
-                if not t.loc[t["p0"] == 0, :].empty:
+                if (p0 == 0).any():
                     raise ValueError(
                         "p(0) for a category in variable {} is zero, division by 0 is "
                         "not defined".format(var)
                     )
-
                 else:
-                    self.encoder_dict_[var] = (t.p1 / t.p0).to_dict()
+                    encoding = p1 / p0
+
+            self.encoder_dict_[var] = dict(zip(categories, encoding.tolist()))
+
+        self._fit_lookup()
 
         return self
 
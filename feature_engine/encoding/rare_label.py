@@ -2,10 +2,11 @@
 # License: BSD 3 clause
 
 import warnings
-from typing import List, Optional, Union
+from typing import List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed
 
 from feature_engine._docstrings.fit_attributes import (
     _feature_names_in_docstring,
@@ -14,20 +15,94 @@ from feature_engine._docstrings.fit_attributes import (
 )
 from feature_engine._docstrings.init_parameters import (
     _ignore_format_docstring,
+    _n_jobs_docstring,
     _variables_categorical_docstring,
 )
 from feature_engine._docstrings.methods import _fit_transform_docstring
 from feature_engine._docstrings.substitute import Substitution
-from feature_engine.dataframe_checks import _check_contains_na, check_X
+from feature_engine.dataframe_checks import check_X
+from feature_engine.encoding._factorization import (
+    _count_categories,
+    _factorize_categories,
+)
 from feature_engine.encoding.base_encoder import (
     CategoricalInitMixin,
     CategoricalMethodsMixin,
 )
 
 
+def _frequencies(x: pd.Series) -> pd.Series:
+    """
+    Returns the fraction of observations per category, ordered from the most to the
+    least frequent, counting the categories in a single pass.
+    """
+    counts = _count_categories(x)
+    # variables cast as categorical also count the categories absent from the data
+    counts = counts[counts > 0]
+    return counts / float(len(x))
+
+
+def _heavy_hitters(
+    x: pd.Series, error: float, min_counters: int, chunksize: int = 1_000_000
+) -> Tuple[pd.Series, bool]:
+    """
+    Estimates the fraction of observations of the most frequent categories with a
+    Misra-Gries summary, updated in one pass over chunks of the variable.
+
+    The summary keeps at most k = max(1 / error, min_counters) counters. When the
+    counts of a chunk, or their merge with the summary, exceed k counters, the
+    (k+1)-th largest count is subtracted from all counters and the non-positive
+    ones are dropped. The estimated frequency of
+    any category is then at most `error` below its true frequency, and never above.
+
+    Returns
+    -------
+    frequencies: pandas series
+        The estimated fraction of observations per category in the summary, ordered
+        from the most to the least frequent.
+
+    truncated: bool
+        Whether counters were dropped. If False, the frequencies are exact and the
+        summary contains all the categories.
+    """
+    n_counters = max(int(np.ceil(1 / error)), min_counters)
+
+    def _prune(counts: pd.Series) -> pd.Series:
+        threshold = np.partition(counts.to_numpy(), -(n_counters + 1))[
+            -(n_counters + 1)
+        ]
+        return counts[counts > threshold] - threshold
+
+    summary = pd.Series(dtype=float)
+    truncated = False
+
+    for start in range(0, len(x), chunksize):
+        stop = start + chunksize
+        counts = x.iloc[start:stop].value_counts()
+        counts = counts[counts > 0].astype(float)
+        counts.index = counts.index.astype(object)
+
+        # the counts of the chunk are summarised before merging, so the summary is
+        # only ever merged with k counters. The errors of both summaries add up to
+        # at most 1 / (k + 1) of the observations seen so far.
+        if len(counts) > n_counters:
+            counts = _prune(counts)
+            truncated = True
+
+        summary = summary.add(counts, fill_value=0)
+
+        if len(summary) > n_counters:
+            summary = _prune(summary)
+            truncated = True
+
+    summary = summary.sort_values(ascending=False, kind="stable")
+    return summary / float(len(x)), truncated
+
+
 @Substitution(
     ignore_format=_ignore_format_docstring,
     variables=_variables_categorical_docstring,
+    n_jobs=_n_jobs_docstring,
     variables_=_variables_attribute_docstring,
     feature_names_in_=_feature_names_in_docstring,
     n_features_in_=_n_features_in_docstring,
@@ -88,6 +163,21 @@ class RareLabelEncoder(CategoricalInitMixin, CategoricalMethodsMixin):
 
     {ignore_format}
 
+    {n_jobs}
+
+    frequency_estimator: str, default='exact'
+        How to find the frequency of the categories. If `'exact'`, the observations
+        of each category are counted. If `'sketch'`, the most frequent categories
+        are found in one pass over the variable with a heavy-hitters summary of
+        bounded size, without counting every category. Useful for variables with
+        millions of distinct categories.
+
+    sketch_error: float, default=0.001
+        Only used when `frequency_estimator='sketch'`. The maximum error of the
+        estimated frequencies. All categories with frequency >= `tol` are
+        considered frequent, and none with frequency < `tol - sketch_error`. The
+        summary keeps up to `1 / sketch_error` categories per variable.
+
     Attributes
     ----------
     encoder_dict_:
@@ -136,6 +226,9 @@ class RareLabelEncoder(CategoricalInitMixin, CategoricalMethodsMixin):
         replace_with: Union[str, int, float] = "Rare",
         variables: Union[None, int, str, List[Union[str, int]]] = None,
         ignore_format: bool = False,
+        n_jobs=None,
+        frequency_estimator: str = "exact",
+        sketch_error: float = 0.001,
     ) -> None:
 
         if tol < 0 or tol > 1:
@@ -152,11 +245,26 @@ class RareLabelEncoder(CategoricalInitMixin, CategoricalMethodsMixin):
             ):
                 raise ValueError("max_n_categories takes only positive integer numbers")
 
+        if frequency_estimator not in ["exact", "sketch"]:
+            raise ValueError(
+                "frequency_estimator takes only values 'exact' and 'sketch'. "
+                f"Got {frequency_estimator} instead."
+            )
+
+        if not isinstance(sketch_error, float) or not 0 < sketch_error < 1:
+            raise ValueError(
+                "sketch_error takes values between 0 and 1. "
+                f"Got {sketch_error} instead."
+            )
+
         super().__init__(variables, ignore_format)
         self.tol = tol
         self.n_categories = n_categories
         self.max_n_categories = max_n_categories
         self.replace_with = replace_with
+        self.n_jobs = n_jobs
+        self.frequency_estimator = frequency_estimator
+        self.sketch_error = sketch_error
 
     def fit(self, X: pd.DataFrame, y: Optional[pd.Series] = None):
         """
@@ -176,17 +284,33 @@ class RareLabelEncoder(CategoricalInitMixin, CategoricalMethodsMixin):
         self._fit(X)
         self._get_feature_names_in(X)
 
+        # count the categories of all variables at once.
+        if self.frequency_estimator == "exact":
+            frequencies = Parallel(n_jobs=self.n_jobs)(
+                delayed(_frequencies)(X[var]) for var in self.variables_
+            )
+            truncated = [False] * len(self.variables_)
+        else:
+            results = Parallel(n_jobs=self.n_jobs)(
+                delayed(_heavy_hitters)(X[var], self.sketch_error, self.n_categories)
+                for var in self.variables_
+            )
+            frequencies, truncated = zip(*results)
+
         self.encoder_dict_ = {}
 
-        for var in self.variables_:
-            if len(X[var].unique()) > self.n_categories:
+        for var, freq, trunc in zip(self.variables_, frequencies, truncated):
+            # a truncated summary has more counters than n_categories, so the
+            # variable has more categories than n_categories.
+            if trunc or len(freq) > self.n_categories:
 
                 # if the variable has more than the indicated number of categories
                 # the encoder will learn the most frequent categories
-                t = pd.Series(X[var].value_counts() / float(len(X)))
 
-                # non-rare labels:
-                freq_idx = t[t >= self.tol].index
+                # non-rare labels. The estimated frequencies are at most
+                # sketch_error below the true ones.
+                tol = self.tol - self.sketch_error if trunc else self.tol
+                freq_idx = freq[freq >= tol].index
 
                 if self.max_n_categories:
                     self.encoder_dict_[var] = freq_idx[: self.max_n_categories]
@@ -201,7 +325,7 @@ class RareLabelEncoder(CategoricalInitMixin, CategoricalMethodsMixin):
                     "indicated in n_categories. Thus, all categories will be "
                     "considered frequent".format(var)
                 )
-                self.encoder_dict_[var] = X[var].unique()
+                self.encoder_dict_[var] = freq.index
 
         return self
 
@@ -218,23 +342,64 @@ class RareLabelEncoder(CategoricalInitMixin, CategoricalMethodsMixin):
         Returns
         -------
         X: pandas dataframe of shape = [n_samples, n_features]
-            The dataframe where rare categories have been grouped.
+            The dataframe where rare categories have been grouped. Variables cast as
+            categorical remain categorical, with the rare label added to the
+            categories.
         """
 
         X = self._check_transform_input_and_state(X)
 
-        # check if dataset contains na
-        _check_contains_na(X, self.variables_)
-
+        # missing data is found from the category codes, which are -1 for NaN, to
+        # avoid scanning the object columns one more time.
         for feature in self.variables_:
-            X[feature] = np.where(
-                X[feature].isin(self.encoder_dict_[feature]),
-                X[feature],
-                self.replace_with,
-            )
+            X[feature] = self._replace_rare(X[feature], self.encoder_dict_[feature])
 
         return X
 
+    def _replace_rare(
+        self, x: pd.Series, frequent: Union[pd.Index, np.ndarray, list]
+    ) -> pd.Series:
+        """
+        Replaces the infrequent categories of a variable, working on the category
+        codes, so that the frequent categories are looked up only once per category
+        instead of once per observation.
+        """
+        if pd.api.types.is_categorical_dtype(x):
+            categories = x.cat.categories
+            codes = np.asarray(x.cat.codes)
+        else:
+            codes, categories = _factorize_categories(x)
+
+        if (codes == -1).any():
+            raise ValueError(
+                "Some of the variables to transform contain NaN. Check and "
+                "remove those before using this transformer."
+            )
+
+        # encoders pickled with older versions store the frequent categories in
+        # an array or a list instead of an index.
+        keep = pd.Index(frequent).get_indexer(categories) != -1
+
+        if pd.api.types.is_categorical_dtype(x):
+            # keep the categorical dtype: frequent categories retain their position,
+            # rare ones are mapped to the new category, which is always added.
+            new_categories = categories[keep]
+            if self.replace_with not in new_categories:
+                new_categories = new_categories.append(pd.Index([self.replace_with]))
+            code_map = np.where(
+                keep,
+                np.cumsum(keep) - 1,
+                new_categories.get_loc(self.replace_with),
+            )
+            return pd.Series(
+                pd.Categorical.from_codes(code_map[codes], new_categories),
+                index=x.index,
+                name=x.name,
+            )
+
+        values = np.where(keep, categories, self.replace_with)
+        return pd.Series(values[codes], index=x.index, name=x.name)
+
     def inverse_transform(self, X: pd.DataFrame):
         """inverse_transform is not implemented for this transformer."""
         raise NotImplementedError(
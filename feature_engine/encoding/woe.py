@@ -1,10 +1,11 @@
 # Authors: Soledad Galli <solegalli@protonmail.com>
 # License: BSD 3 clause
 
-from typing import List, Union
+from typing import List, Tuple, Union
 
 import numpy as np
 import pandas as pd
+from sklearn.utils.multiclass import check_classification_targets
 
 from feature_engine._docstrings.fit_attributes import (
     _feature_names_in_docstring,
@@ -12,7 +13,9 @@ from feature_engine._docstrings.fit_attributes import (
     _variables_attribute_docstring,
 )
 from feature_engine._docstrings.init_parameters import (
+    _cv_docstring,
     _ignore_format_docstring,
+    _n_jobs_docstring,
     _unseen_docstring,
     _variables_categorical_docstring,
 )
@@ -23,14 +26,37 @@ from feature_engine._docstrings.methods import (
 )
 from feature_engine._docstrings.substitute import Substitution
 from feature_engine.dataframe_checks import check_X_y
+from feature_engine.encoding._grouped_statistics import (
+    _batched_contingency_tables,
+    _batched_target_statistics,
+    _target_statistics,
+)
 from feature_engine.encoding._helper_functions import check_parameter_unseen
 from feature_engine.encoding.base_encoder import (
     CategoricalInitMixin,
     CategoricalMethodsMixin,
+    TargetEncoderMixin,
 )
 from feature_engine.tags import _return_tags
 
 
+def _weight_of_evidence(
+    n_pos: np.ndarray, n_neg: np.ndarray, smoothing: float = 0.0
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns the proportion of positive and negative observations per category, and
+    the WoE, from the number of positive and negative observations per category.
+
+    With Laplace smoothing, `smoothing` is added to the number of positive and
+    negative observations of every category, so that no proportion is zero.
+    """
+    pos = (n_pos + smoothing) / (n_pos.sum() + smoothing * len(n_pos))
+    neg = (n_neg + smoothing) / (n_neg.sum() + smoothing * len(n_neg))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        woe = np.log(pos / neg)
+    return pos, neg, woe
+
+
 class WoE:
     def _check_fit_input(self, X: pd.DataFrame, y: pd.Series):
         """
@@ -52,27 +78,33 @@ class WoE:
         return X, y
 
     def _calculate_woe(self, X: pd.DataFrame, y: pd.Series, variable: Union[str, int]):
-        total_pos = y.sum()
-        inverse_y = y.ne(1).copy()
-        total_neg = inverse_y.sum()
-
-        pos = y.groupby(X[variable]).sum() / total_pos
-        neg = inverse_y.groupby(X[variable]).sum() / total_neg
-
-        if not (pos[:] == 0).sum() == 0 or not (neg[:] == 0).sum() == 0:
+        # with a binary target, the sum of the target is the number of positives
+        categories, count, n_pos, _ = _target_statistics(X[variable], y)
+        pos, neg, woe = _weight_of_evidence(n_pos, count - n_pos)
+        self._check_woe_is_defined(pos, neg, variable)
+
+        return (
+            pd.Series(pos, index=categories),
+            pd.Series(neg, index=categories),
+            pd.Series(woe, index=categories),
+        )
+
+    def _check_woe_is_defined(
+        self, pos: np.ndarray, neg: np.ndarray, variable: Union[str, int]
+    ):
+        if (pos == 0).any() or (neg == 0).any():
             raise ValueError(
                 "The proportion of one of the classes for a category in "
                 "variable {} is zero, and log of zero is not defined".format(variable)
             )
 
-        woe = np.log(pos / neg)
-        return pos, neg, woe
-
 
 @Substitution(
     ignore_format=_ignore_format_docstring,
     variables=_variables_categorical_docstring,
     unseen=_unseen_docstring,
+    cv=_cv_docstring,
+    n_jobs=_n_jobs_docstring,
     variables_=_variables_attribute_docstring,
     feature_names_in_=_feature_names_in_docstring,
     n_features_in_=_n_features_in_docstring,
@@ -80,7 +112,9 @@ class WoE:
     transform=_transform_encoders_docstring,
     inverse_transform=_inverse_transform_docstring,
 )
-class WoEEncoder(CategoricalInitMixin, CategoricalMethodsMixin, WoE):
+class WoEEncoder(
+    CategoricalInitMixin, TargetEncoderMixin, CategoricalMethodsMixin, WoE
+):
     """
     The WoEEncoder() replaces categories by the weight of evidence
     (WoE). The WoE was used primarily in the financial sector to create credit risk
@@ -99,7 +133,8 @@ class WoEEncoder(CategoricalInitMixin, CategoricalMethodsMixin, WoE):
     (fit). The encoder then transforms the categories into the mapped numbers
     (transform).
 
-    This categorical encoding is exclusive for binary classification.
+    This categorical encoding is designed for binary classification. For multi-class
+    targets, set `multiclass=True` to obtain the WoE of each class against the rest.
 
     **Note**
 
@@ -117,10 +152,30 @@ class WoEEncoder(CategoricalInitMixin, CategoricalMethodsMixin, WoE):
 
     {unseen}
 
+    multiclass: bool, default=False
+        Whether the target is multi-class. If True, each variable is replaced by one
+        variable per class, with the WoE of that class against the rest, named with
+        the variable name and the class, like in `colour_blue`.
+
+    {cv}
+
+    {n_jobs}
+
+    smoothing: int, float, default=0.0
+        Laplace smoothing. The number added to the count of positive and negative
+        observations of each category before computing the WoE. If 0, the encoder
+        raises an error when a category has no observations of one of the classes.
+        Values greater than 0 return a finite WoE for those categories, and shrink
+        the WoE of infrequent categories towards 0.
+
     Attributes
     ----------
     encoder_dict_:
-        Dictionary with the WoE per variable.
+        Dictionary with the WoE per variable. If `multiclass=True`, dictionary with the
+        WoE per category, per class, per variable.
+
+    classes_:
+        The classes of the target. Only present if `multiclass=True`.
 
     {variables_}
 
@@ -180,11 +235,26 @@ class WoEEncoder(CategoricalInitMixin, CategoricalMethodsMixin, WoE):
         variables: Union[None, int, str, List[Union[str, int]]] = None,
         ignore_format: bool = False,
         unseen: str = "ignore",
+        multiclass: bool = False,
+        cv=None,
+        n_jobs=None,
+        smoothing: Union[int, float] = 0.0,
     ) -> None:
 
+        if not isinstance(smoothing, (int, float)) or smoothing < 0:
+            raise ValueError(
+                f"smoothing must be a number greater than or equal to 0. "
+                f"Got {smoothing} instead."
+            )
+
         super().__init__(variables, ignore_format)
         check_parameter_unseen(unseen, ["ignore", "raise"])
+        self._check_multiclass(multiclass)
         self.unseen = unseen
+        self.multiclass = multiclass
+        self.cv = cv
+        self.n_jobs = n_jobs
+        self.smoothing = smoothing
 
     def fit(self, X: pd.DataFrame, y: pd.Series):
         """
@@ -197,23 +267,117 @@ class WoEEncoder(CategoricalInitMixin, CategoricalMethodsMixin, WoE):
             Can be the entire dataframe, not just the categorical variables.
 
         y: pandas series.
-            Target, must be binary.
+            Target, must be binary, unless `multiclass=True`.
         """
 
-        X, y = self._check_fit_input(X, y)
+        if self.multiclass is True:
+            X, y = check_X_y(X, y)
+        else:
+            X, y = self._check_fit_input(X, y)
 
         self._fit(X)
         self._get_feature_names_in(X)
 
         self.encoder_dict_ = {}
 
+        if self.multiclass is True:
+            self._fit_multiclass(X, y)
+            return self
+
+        statistics = _batched_target_statistics(X, self.variables_, y)
+
         for var in self.variables_:
-            _, _, woe = self._calculate_woe(X, y, var)
+            categories, count, n_pos, _ = statistics[var]
+            pos, neg, woe = _weight_of_evidence(n_pos, count - n_pos, self.smoothing)
+            self._check_woe_is_defined(pos, neg, var)
+
+            self.encoder_dict_[var] = dict(zip(categories, woe.tolist()))
 
-            self.encoder_dict_[var] = woe.to_dict()
+        self._fit_lookup()
 
         return self
 
+    def _fit_multiclass(self, X: pd.DataFrame, y: pd.Series):
+        """
+        Learn the WoE of each class against the rest, from the contingency table of
+        each variable against the target.
+        """
+        check_classification_targets(y)
+        y_codes, classes = pd.factorize(y, sort=True)
+        self.classes_ = np.asarray(classes)
+        classes = self.classes_.tolist()
+
+        tables = _batched_contingency_tables(X, self.variables_, y_codes, len(classes))
+
+        for var in self.variables_:
+            categories, table = tables[var]
+            count = table.sum(axis=1)
+            self.encoder_dict_[var] = {}
+            for i, class_ in enumerate(classes):
+                pos, neg, woe = _weight_of_evidence(
+                    table[:, i], count - table[:, i], self.smoothing
+                )
+
+                if (pos == 0).any() or (neg == 0).any():
+                    raise ValueError(
+                        "The proportion of one of the classes for a category in "
+                        f"variable {var} is zero for class {class_}, and log of zero "
+                        "is not defined"
+                    )
+
+                self.encoder_dict_[var][class_] = dict(zip(categories, woe.tolist()))
+
+    def fit_transform(self, X: pd.DataFrame, y: pd.Series) -> pd.DataFrame:
+        """
+        Learn the WoE and encode the training set.
+
+        If `cv` is not None, each observation is encoded with the WoE learned from the
+        folds that do not contain the observation.
+
+        Parameters
+        ----------
+        X: pandas dataframe of shape = [n_samples, n_features]
+            The training input samples.
+            Can be the entire dataframe, not just the categorical variables.
+
+        y: pandas series.
+            Target, must be binary, unless `multiclass=True`.
+
+        Returns
+        -------
+        X_new: pandas dataframe of shape = [n_samples, n_features].
+            The dataframe containing the categories replaced by numbers.
+        """
+        if self.cv is None:
+            return super().fit_transform(X, y)
+
+        self.fit(X, y)
+
+        if self.multiclass is True:
+            X, y = check_X_y(X, y)
+        else:
+            X, y = self._check_fit_input(X, y)
+
+        return self._encode_out_of_fold(X, y, classifier=True)
+
+    def _encode(
+        self, count: np.ndarray, total: np.ndarray, sq_dev: np.ndarray
+    ) -> np.ndarray:
+        """
+        Returns the WoE per category, from the number of observations and the number
+        of positive observations per category.
+        """
+        pos, neg, woe = _weight_of_evidence(total, count - total, self.smoothing)
+
+        if (pos == 0).any() or (neg == 0).any():
+            raise ValueError(
+                "The proportion of one of the classes for a category in the training "
+                "folds is zero, and log of zero is not defined. Try grouping "
+                "infrequent categories or reducing the number of folds."
+            )
+
+        return woe
+
     def _more_tags(self):
         tags_dict = _return_tags()
         tags_dict["variables"] = "categorical"
@@ -6,8 +6,11 @@ from .arbitrary_number import ArbitraryNumberImputer
 from .categorical import CategoricalImputer
 from .drop_missing_data import DropMissingData
 from .end_tail import EndTailImputer
+from .iterative import IterativeImputer
+from .knn import KNNImputer
 from .mean_median import MeanMedianImputer
 from .missing_indicator import AddMissingIndicator
+from .multi_strategy import MultiStrategyImputer
 from .random_sample import RandomSampleImputer
 
 __all__ = [
@@ -18,4 +21,7 @@ __all__ = [
     "AddMissingIndicator",
     "RandomSampleImputer",
     "DropMissingData",
+    "IterativeImputer",
+    "KNNImputer",
+    "MultiStrategyImputer",
 ]
@@ -1,9 +1,15 @@
+from typing import List
+
+import numpy as np
 import pandas as pd
 from sklearn.base import BaseEstimator, TransformerMixin
 from sklearn.utils.validation import check_is_fitted
 
 from feature_engine.dataframe_checks import _check_X_matches_training_df, check_X
 from feature_engine._base_transformers.mixins import GetFeatureNamesOutMixin
+from feature_engine._variable_handling.variable_type_selection import (
+    _find_all_variables,
+)
 from feature_engine.tags import _return_tags
 
 
@@ -23,6 +29,19 @@ class BaseImputer(BaseEstimator, TransformerMixin, GetFeatureNamesOutMixin):
         Impute missing data.
         """.rstrip()
 
+    _group_by_docstring = """group_by: str, int or list, default=None
+        The variable or variables that define the groups in which the imputation
+        values are learned, for example, the region. If None, one value is learned
+        per variable. Missing data in groups not seen during `fit()`, in groups
+        without values for the variable, or with missing group, is replaced by the
+        value learned from all observations. The group variables are not imputed.
+        """.rstrip()
+
+    _group_imputer_dict_docstring = """group_imputer_dict_:
+        Dictionary with a pandas Series per variable, with the values to replace
+        missing data in each group. Only when `group_by` is not None.
+        """.rstrip()
+
     def _transform(self, X: pd.DataFrame) -> pd.DataFrame:
         """
         Common checks before transforming data:
@@ -72,11 +91,62 @@ class BaseImputer(BaseEstimator, TransformerMixin, GetFeatureNamesOutMixin):
 
         X = self._transform(X)
 
+        if getattr(self, "group_by", None) is not None:
+            X = self._impute_by_group(X)
+
         # Replace missing data with learned parameters
         X.fillna(value=self.imputer_dict_, inplace=True)
 
         return X
 
+    def _find_group_variables(self, X: pd.DataFrame) -> List:
+        """
+        Finds the variables that define the groups and removes them from the
+        variables to impute.
+        """
+        self.group_by_ = _find_all_variables(X, self.group_by)
+        self.variables_ = [var for var in self.variables_ if var not in self.group_by_]
+        return self.group_by_
+
+    def _group_keys(self, X: pd.DataFrame) -> pd.Index:
+        """Returns the group of each observation."""
+        if len(self.group_by_) == 1:
+            return pd.Index(X[self.group_by_[0]])
+        return pd.MultiIndex.from_frame(X[self.group_by_])
+
+    def _impute_by_group(self, X: pd.DataFrame) -> pd.DataFrame:
+        """
+        Replaces missing data with the values learned per group. Missing data in
+        groups without a value is left for the global imputation.
+        """
+        if not self.group_imputer_dict_:
+            return X
+
+        # find the position of the group of each observation in the learned
+        # values, in one hash table lookup for all variables.
+        groups = next(iter(self.group_imputer_dict_.values())).index
+        codes = groups.get_indexer(self._group_keys(X))
+        found = codes >= 0
+        codes = np.where(found, codes, 0)
+
+        for var, values in self.group_imputer_dict_.items():
+            to_impute = X[var].isna().to_numpy() & found
+            if not to_impute.any():
+                continue
+
+            new_values = pd.Series(values.to_numpy()[codes], index=X.index)
+            if pd.api.types.is_categorical_dtype(X[var]):
+                new_categories = new_values[to_impute].dropna().unique()
+                new_categories = [
+                    value
+                    for value in new_categories
+                    if value not in X[var].cat.categories
+                ]
+                X[var] = X[var].cat.add_categories(new_categories)
+            X[var] = X[var].mask(to_impute, new_values)
+
+        return X
+
     def _get_feature_names_in(self, X):
         """Get the names and number of features in the train set (the dataframe
         used during fit)."""
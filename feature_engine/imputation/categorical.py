@@ -3,6 +3,7 @@
 
 from typing import List, Optional, Union
 
+import numpy as np
 import pandas as pd
 
 from feature_engine._docstrings.fit_attributes import (
@@ -24,8 +25,91 @@ from feature_engine.imputation.base_imputer import BaseImputer
 from feature_engine.tags import _return_tags
 
 
+def _fill_categorical(x: pd.Series, value) -> pd.Series:
+    """
+    Replaces the missing values of a variable of type category by `value`, in the
+    category codes. `value` is added as the last category if it is not one already.
+    """
+    if pd.isnull(value):
+        return x
+
+    categories = x.cat.categories
+    position = categories.get_indexer([value])[0]
+    if position == -1:
+        categories = categories.append(pd.Index([value]))
+        position = len(categories) - 1
+
+    codes = x.cat.codes.to_numpy()
+    codes = np.where(codes == -1, position, codes)
+
+    dtype = pd.CategoricalDtype(categories, ordered=x.cat.ordered)
+    return pd.Series(
+        pd.Categorical.from_codes(codes, dtype=dtype), index=x.index, name=x.name
+    )
+
+
+def _most_frequent_categories(X: pd.DataFrame, variables: List) -> dict:
+    """
+    Returns the most frequent category of each variable. Raises an error if a
+    variable contains more than one most frequent category.
+    """
+    frequent_categories = {}
+    multiple_modes = []
+
+    for var in variables:
+        # sorted from the most to the least frequent category
+        counts = X[var].value_counts()
+        if len(counts) == 0 or counts.iloc[0] == 0:
+            # all values are missing
+            frequent_categories[var] = np.nan
+            continue
+        if len(counts) > 1 and counts.iloc[1] == counts.iloc[0]:
+            multiple_modes.append(str(var))
+        frequent_categories[var] = counts.index[0]
+
+    # Some variables may contain more than 1 mode:
+    if len(multiple_modes) > 0:
+        if len(variables) == 1:
+            raise ValueError(
+                f"The variable {multiple_modes[0]} contains multiple "
+                f"frequent categories."
+            )
+        raise ValueError(
+            f"The variable(s) {', '.join(multiple_modes)} contain(s) "
+            f"multiple frequent categories."
+        )
+
+    return frequent_categories
+
+
+def _most_frequent_categories_by_group(
+    X: pd.DataFrame, variables: List, group_by: List
+) -> dict:
+    """
+    Returns a pandas Series per variable with the most frequent category of each
+    group. If more than one category is the most frequent, the first one in sorted
+    order is returned.
+    """
+    groups = X.groupby(group_by, observed=True).size().index
+    frequent_categories = {}
+
+    for var in variables:
+        counts = X.groupby(group_by + [var], observed=True).size()
+        # keep the most frequent category of each group
+        counts = counts.sort_values(ascending=False, kind="stable")
+        counts = counts[~counts.index.droplevel(-1).duplicated()]
+        modes = pd.Series(
+            counts.index.get_level_values(-1), index=counts.index.droplevel(-1)
+        )
+        frequent_categories[var] = modes.reindex(groups)
+
+    return frequent_categories
+
+
 @Substitution(
+    group_by=BaseImputer._group_by_docstring,
     imputer_dict_=BaseImputer._imputer_dict_docstring,
+    group_imputer_dict_=BaseImputer._group_imputer_dict_docstring,
     variables_=_variables_attribute_docstring,
     feature_names_in_=_feature_names_in_docstring,
     n_features_in_=_n_features_in_docstring,
@@ -51,6 +135,10 @@ class CategoricalImputer(BaseImputer):
     list of variables to impute, the imputer will automatically select and impute all
     variables in the dataframe.
 
+    With `group_by`, the CategoricalImputer() learns the most frequent category of the
+    variable per group, and replaces missing data with the category of the group of
+    the observation. Only available with `imputation_method='frequent'`.
+
     More details in the :ref:`User Guide <categorical_imputer>`.
 
     Parameters
@@ -82,10 +170,14 @@ class CategoricalImputer(BaseImputer):
         type object or categorical. If True, the imputer will select all variables or
         accept all variables entered by the user, including those cast as numeric.
 
+    {group_by}
+
     Attributes
     ----------
     {imputer_dict_}
 
+    {group_imputer_dict_}
+
     {variables_}
 
     {feature_names_in_}
@@ -129,6 +221,7 @@ class CategoricalImputer(BaseImputer):
         variables: Union[None, int, str, List[Union[str, int]]] = None,
         return_object: bool = False,
         ignore_format: bool = False,
+        group_by: Union[None, int, str, List[Union[str, int]]] = None,
     ) -> None:
 
         if imputation_method not in ["missing", "frequent"]:
@@ -139,11 +232,17 @@ class CategoricalImputer(BaseImputer):
         if not isinstance(ignore_format, bool):
             raise ValueError("ignore_format takes only booleans True and False")
 
+        if group_by is not None and imputation_method != "frequent":
+            raise ValueError(
+                "group_by can only be used with imputation_method='frequent'"
+            )
+
         self.imputation_method = imputation_method
         self.fill_value = fill_value
         self.variables = _check_init_parameter_variables(variables)
         self.return_object = return_object
         self.ignore_format = ignore_format
+        self.group_by = _check_init_parameter_variables(group_by)
 
     def fit(self, X: pd.DataFrame, y: Optional[pd.Series] = None):
         """
@@ -172,43 +271,19 @@ class CategoricalImputer(BaseImputer):
             # select all variables or check variables entered by the user
             self.variables_ = _find_all_variables(X, self.variables)
 
+        if self.group_by is not None:
+            self._find_group_variables(X)
+
         if self.imputation_method == "missing":
             self.imputer_dict_ = {var: self.fill_value for var in self.variables_}
 
         elif self.imputation_method == "frequent":
+            self.imputer_dict_ = _most_frequent_categories(X, self.variables_)
 
-            # if imputing only 1 variable:
-            if len(self.variables_) == 1:
-                var = self.variables_[0]
-                mode_vals = X[var].mode()
-
-                # Some variables may contain more than 1 mode:
-                if len(mode_vals) > 1:
-                    raise ValueError(
-                        f"The variable {var} contains multiple frequent categories."
-                    )
-
-                self.imputer_dict_ = {var: mode_vals[0]}
-
-            # imputing multiple variables:
-            else:
-                # Returns a dataframe with 1 row if there is one mode per
-                # variable, or more rows if there are more modes:
-                mode_vals = X[self.variables_].mode()
-
-                # Careful: some variables contain multiple modes
-                if len(mode_vals) > 1:
-                    varnames = mode_vals.dropna(axis=1).columns.to_list()
-                    if len(varnames) > 1:
-                        varnames_str = ", ".join(varnames)
-                    else:
-                        varnames_str = varnames[0]
-                    raise ValueError(
-                        f"The variable(s) {varnames_str} contain(s) multiple frequent "
-                        f"categories."
-                    )
-
-                self.imputer_dict_ = mode_vals.iloc[0].to_dict()
+            if self.group_by is not None:
+                self.group_imputer_dict_ = _most_frequent_categories_by_group(
+                    X, self.variables_, self.group_by_
+                )
 
         self._get_feature_names_in(X)
 
@@ -216,23 +291,30 @@ class CategoricalImputer(BaseImputer):
 
     def transform(self, X: pd.DataFrame) -> pd.DataFrame:
 
-        # Frequent category imputation
-        if self.imputation_method == "frequent":
-            X = super().transform(X)
-
-        # Imputation with string
-        else:
-            X = self._transform(X)
-
-            # if variable is of type category, we need to add the new
-            # category, before filling in the nan
-            for variable in self.variables_:
-                if pd.api.types.is_categorical_dtype(X[variable]):
-                    X[variable].cat.add_categories(
-                        self.imputer_dict_[variable], inplace=True
-                    )
-
-            X.fillna(self.imputer_dict_, inplace=True)
+        X = self._transform(X)
+
+        if self.group_by is not None:
+            X = self._impute_by_group(X)
+
+        # variables of type category are filled in their codes, adding the
+        # imputation value to the categories if needed.
+        categorical = [
+            var
+            for var in self.variables_
+            if pd.api.types.is_categorical_dtype(X[var])
+        ]
+        for var in categorical:
+            X[var] = _fill_categorical(X[var], self.imputer_dict_[var])
+
+        if len(categorical) < len(self.variables_):
+            X.fillna(
+                {
+                    var: value
+                    for var, value in self.imputer_dict_.items()
+                    if var not in categorical
+                },
+                inplace=True,
+            )
 
         # add additional step to return variables cast as object
         if self.return_object:
@@ -1,9 +1,11 @@
 # Authors: Pradumna Suryawanshi <pradumnasuryawanshi@gmail.com>
 # License: BSD 3 clause
 
-from typing import List, Optional, Union
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
+from sklearn.utils.validation import check_is_fitted
 
 from feature_engine._docstrings.fit_attributes import (
     _feature_names_in_docstring,
@@ -17,7 +19,7 @@ from feature_engine._variable_handling.init_parameter_checks import (
 from feature_engine._variable_handling.variable_type_selection import (
     _find_all_variables,
 )
-from feature_engine.dataframe_checks import check_X
+from feature_engine.dataframe_checks import _check_X_matches_training_df, check_X
 from feature_engine.imputation.base_imputer import BaseImputer
 from feature_engine.tags import _return_tags
 
@@ -84,6 +86,15 @@ class DropMissingData(BaseImputer):
     return_na_data:
         Returns a dataframe with the rows that contain missing data.
 
+    return_na_mask:
+        Returns a boolean Series flagging the rows that contain missing data.
+
+    split_na_data:
+        Returns the rows without and with missing data.
+
+    iter_split_na_data:
+        Returns the rows without and with missing data, chunk by chunk.
+
     transform:
         Remove rows with missing data.
 
@@ -150,9 +161,8 @@ class DropMissingData(BaseImputer):
 
         # If user passes a threshold, then missing_only is ignored:
         if self.threshold is None and self.missing_only is True:
-            self.variables_ = [
-                var for var in self.variables_ if X[var].isnull().sum() > 0
-            ]
+            has_missing = X[self.variables_].isnull().any()
+            self.variables_ = [var for var in self.variables_ if has_missing[var]]
 
         self._get_feature_names_in(X)
 
@@ -176,17 +186,7 @@ class DropMissingData(BaseImputer):
 
         X = self._transform(X)
 
-        if self.threshold:
-            X.dropna(
-                thresh=len(self.variables_) * self.threshold,
-                subset=self.variables_,
-                axis=0,
-                inplace=True,
-            )
-        else:
-            X.dropna(axis=0, how="any", subset=self.variables_, inplace=True)
-
-        return X
+        return X.loc[~self._na_rows(X)]
 
     def return_na_data(self, X: pd.DataFrame) -> pd.DataFrame:
         """
@@ -197,20 +197,124 @@ class DropMissingData(BaseImputer):
 
         Parameters
         ----------
-        X_na: pandas dataframe of shape = [n_samples_with_na, features]
+        X: pandas dataframe of shape = [n_samples, n_features]
+            The dataframe to be examined.
+
+        Returns
+        -------
+        X_na: pandas dataframe of shape = [n_samples_with_na, n_features]
+            The subset of the dataframe with the rows with missing data.
+        """
+
+        X = self._transform(X)
+
+        return X.loc[self._na_rows(X)]
+
+    def return_na_mask(self, X: pd.DataFrame) -> pd.Series:
+        """
+        Returns a boolean Series, with the index of the dataframe, that flags the rows
+        that would be removed with the `transform()` method. The dataframe is not
+        copied. The indices of the rows with missing data are `mask.index[mask]`.
+
+        Parameters
+        ----------
+        X: pandas dataframe of shape = [n_samples, n_features]
+            The dataframe to be examined.
+
+        Returns
+        -------
+        mask: pandas Series of shape = [n_samples, ]
+            True for the rows with missing data.
+        """
+
+        check_is_fitted(self)
+
+        # only the variables to examine are read, so there is no need to copy
+        if not isinstance(X, pd.DataFrame):
+            X = check_X(X)
+        _check_X_matches_training_df(X, self.n_features_in_)
+
+        return pd.Series(self._na_rows(X), index=X.index)
+
+    def split_na_data(self, X: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Returns the rows without missing data, which are the output of `transform()`,
+        and the rows with missing data, which are the output of `return_na_data()`,
+        finding the missing data only once.
+
+        Parameters
+        ----------
+        X: pandas dataframe of shape = [n_samples, n_features]
+            The dataframe to be split.
+
+        Returns
+        -------
+        X_new: pandas dataframe of shape = [n_samples - n_samples_with_na, n_features]
+            The complete case dataframe for the selected variables.
+
+        X_na: pandas dataframe of shape = [n_samples_with_na, n_features]
             The subset of the dataframe with the rows with missing data.
         """
 
         X = self._transform(X)
 
+        na_rows = self._na_rows(X)
+
+        return X.loc[~na_rows], X.loc[na_rows]
+
+    def iter_split_na_data(
+        self,
+        X: Union[pd.DataFrame, Iterable[pd.DataFrame]],
+        chunksize: int = 10_000,
+    ) -> Iterator[Tuple[pd.DataFrame, pd.DataFrame]]:
+        """
+        Splits the data into the rows without and with missing data, chunk by chunk,
+        like `split_na_data()`. This is useful with data that does not fit in memory,
+        for example, read with `pd.read_csv(..., chunksize=n)`.
+
+        Parameters
+        ----------
+        X: pandas dataframe or iterable of pandas dataframes
+            The data to be split. A dataframe is split in chunks of `chunksize` rows.
+            Iterables, like the readers returned by `pd.read_csv()` with `chunksize`,
+            are split chunk by chunk.
+
+        chunksize: int, default=10000
+            The number of rows of each chunk when X is a dataframe.
+
+        Returns
+        -------
+        chunks: iterator of tuples (X_new, X_na)
+            The rows without missing data and the rows with missing data of each
+            chunk.
+        """
+
+        if not isinstance(chunksize, int) or chunksize < 1:
+            raise ValueError(
+                f"chunksize must be a positive integer. Got {chunksize} instead."
+            )
+
+        chunks = X
+        if isinstance(X, pd.DataFrame):
+            chunks = (
+                X.iloc[start:stop]
+                for start, stop in zip(
+                    range(0, len(X), chunksize),
+                    range(chunksize, len(X) + chunksize, chunksize),
+                )
+            )
+
+        # the chunks are split when the iterator is consumed, but the parameters
+        # are checked now.
+        return (self.split_na_data(chunk) for chunk in chunks)
+
+    def _na_rows(self, X: pd.DataFrame) -> np.ndarray:
+        """Returns a boolean array that flags the rows to remove."""
         if self.threshold:
-            idx = pd.isnull(X[self.variables_]).mean(axis=1) >= self.threshold
-            idx = idx[idx]
-        else:
-            idx = pd.isnull(X[self.variables_]).any(1)
-            idx = idx[idx]
+            n_values = X[self.variables_].notna().sum(axis=1).to_numpy()
+            return n_values < len(self.variables_) * self.threshold
 
-        return X.loc[idx.index, :]
+        return X[self.variables_].isna().any(axis=1).to_numpy()
 
     def _more_tags(self):
         tags_dict = _return_tags()
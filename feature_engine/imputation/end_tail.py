@@ -24,7 +24,9 @@ from feature_engine.imputation.base_imputer import BaseImputer
 
 @Substitution(
     variables=BaseImputer._variables_numerical_docstring,
+    group_by=BaseImputer._group_by_docstring,
     imputer_dict_=BaseImputer._imputer_dict_docstring,
+    group_imputer_dict_=BaseImputer._group_imputer_dict_docstring,
     variables_=_variables_attribute_docstring,
     feature_names_in_=_feature_names_in_docstring,
     n_features_in_=_n_features_in_docstring,
@@ -63,6 +65,10 @@ class EndTailImputer(BaseImputer):
 
     The imputer then replaces the missing data with the estimated values (transform).
 
+    With `group_by`, the EndTailImputer() learns the values at the end of the
+    distribution of the variable per group, and replaces missing data with the value
+    of the group of the observation.
+
     More details in the :ref:`User Guide <end_tail_imputer>`.
 
     Parameters
@@ -91,10 +97,14 @@ class EndTailImputer(BaseImputer):
 
     {variables}
 
+    {group_by}
+
     Attributes
     ----------
     {imputer_dict_}
 
+    {group_imputer_dict_}
+
     {variables_}
 
     {feature_names_in_}
@@ -134,6 +144,7 @@ class EndTailImputer(BaseImputer):
         tail: str = "right",
         fold: int = 3,
         variables: Union[None, int, str, List[Union[str, int]]] = None,
+        group_by: Union[None, int, str, List[Union[str, int]]] = None,
     ) -> None:
 
         if imputation_method not in ["gaussian", "iqr", "max"]:
@@ -151,6 +162,7 @@ class EndTailImputer(BaseImputer):
         self.tail = tail
         self.fold = fold
         self.variables = _check_init_parameter_variables(variables)
+        self.group_by = _check_init_parameter_variables(group_by)
 
     def fit(self, X: pd.DataFrame, y: Optional[pd.Series] = None):
         """
@@ -170,31 +182,41 @@ class EndTailImputer(BaseImputer):
         # find or check for numerical variables
         self.variables_ = _find_or_check_numerical_variables(X, self.variables)
 
+        if self.group_by is not None:
+            self._find_group_variables(X)
+
         # estimate imputation values
+        self.imputer_dict_ = self._end_tail_values(X[self.variables_]).to_dict()
+
+        if self.group_by is not None:
+            values = self._end_tail_values(
+                X.groupby(self.group_by_, observed=True)[self.variables_]
+            )
+            self.group_imputer_dict_ = {var: values[var] for var in self.variables_}
+
+        self._get_feature_names_in(X)
+
+        return self
+
+    def _end_tail_values(self, X):
+        """
+        Returns the values at the end of the distribution of the variables in a
+        dataframe, or of each group in a grouped dataframe.
+        """
         if self.imputation_method == "max":
-            self.imputer_dict_ = (X[self.variables_].max() * self.fold).to_dict()
+            values = X.max() * self.fold
 
         elif self.imputation_method == "gaussian":
             if self.tail == "right":
-                self.imputer_dict_ = (
-                    X[self.variables_].mean() + self.fold * X[self.variables_].std()
-                ).to_dict()
+                values = X.mean() + self.fold * X.std()
             elif self.tail == "left":
-                self.imputer_dict_ = (
-                    X[self.variables_].mean() - self.fold * X[self.variables_].std()
-                ).to_dict()
+                values = X.mean() - self.fold * X.std()
 
         elif self.imputation_method == "iqr":
-            IQR = X[self.variables_].quantile(0.75) - X[self.variables_].quantile(0.25)
+            IQR = X.quantile(0.75) - X.quantile(0.25)
             if self.tail == "right":
-                self.imputer_dict_ = (
-                    X[self.variables_].quantile(0.75) + (IQR * self.fold)
-                ).to_dict()
+                values = X.quantile(0.75) + (IQR * self.fold)
             elif self.tail == "left":
-                self.imputer_dict_ = (
-                    X[self.variables_].quantile(0.25) - (IQR * self.fold)
-                ).to_dict()
-
-        self._get_feature_names_in(X)
+                values = X.quantile(0.25) - (IQR * self.fold)
 
-        return self
+        return values
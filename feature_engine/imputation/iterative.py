@@ -0,0 +1,520 @@
+# License: BSD 3 clause
+
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.base import clone, is_classifier
+from sklearn.dummy import DummyClassifier
+from sklearn.linear_model import BayesianRidge, LogisticRegression
+from sklearn.utils import check_random_state
+
+from feature_engine._docstrings.fit_attributes import (
+    _feature_names_in_docstring,
+    _n_features_in_docstring,
+    _variables_attribute_docstring,
+)
+from feature_engine._docstrings.init_parameters import _n_jobs_docstring
+from feature_engine._docstrings.methods import _fit_transform_docstring
+from feature_engine._docstrings.substitute import Substitution
+from feature_engine._variable_handling.init_parameter_checks import (
+    _check_init_parameter_variables,
+)
+from feature_engine._variable_handling.variable_type_selection import (
+    _find_all_variables,
+    _find_categorical_and_numerical_variables,
+)
+from feature_engine.dataframe_checks import check_X
+from feature_engine.imputation.base_imputer import BaseImputer
+from feature_engine.tags import _return_tags
+
+
+def _fit_predict(
+    estimator, D: np.ndarray, predictors: np.ndarray, y: np.ndarray, train, predict
+):
+    """
+    Fits a clone of the estimator on the `train` rows of the `predictors` columns of
+    D, and returns it together with its predictions for the `predict` rows.
+    """
+    estimator = clone(estimator)
+    if is_classifier(estimator) and len(np.unique(y[train])) == 1:
+        # classifiers need at least 2 classes
+        estimator = DummyClassifier(strategy="most_frequent")
+
+    estimator.fit(D[train][:, predictors], y[train])
+
+    if predict.any():
+        return estimator, estimator.predict(D[predict][:, predictors])
+    return estimator, np.empty(0)
+
+
+@Substitution(
+    n_jobs=_n_jobs_docstring,
+    variables_=_variables_attribute_docstring,
+    feature_names_in_=_feature_names_in_docstring,
+    n_features_in_=_n_features_in_docstring,
+    transform=BaseImputer._transform_docstring,
+    fit_transform=_fit_transform_docstring,
+)
+class IterativeImputer(BaseImputer):
+    """
+    The IterativeImputer() replaces missing data with the predictions of a model
+    that uses the other variables as predictors. It works with both numerical and
+    categorical variables.
+
+    The missing values are first replaced by the mean or median of numerical
+    variables, and by the most frequent category of categorical variables. Then, at
+    each iteration, the imputer trains one model per variable with missing data, on
+    the observations where the variable is not missing, and replaces the missing
+    values by the model predictions. The models of all variables are trained on the
+    values imputed in the previous iteration, so they can be trained in parallel.
+    The iterations stop when the imputed values no longer change, or after
+    `max_iter` iterations.
+
+    Numerical variables are predicted with a regressor, and categorical variables
+    with a classifier. Categorical variables are one-hot encoded when used as
+    predictors.
+
+    During transform, the models of each iteration are applied in the same order.
+
+    More details in the :ref:`User Guide <iterative_imputer>`.
+
+    Parameters
+    ----------
+    variables: list, default=None
+        The list of variables to impute, which are also used as predictors. If None,
+        the imputer will select all numerical and categorical variables.
+
+    regressor: estimator, default=None
+        The regressor used to predict numerical variables. If None, the imputer
+        uses sklearn's BayesianRidge().
+
+    classifier: estimator, default=None
+        The classifier used to predict categorical variables. If None, the imputer
+        uses sklearn's LogisticRegression().
+
+    initial_strategy: str, default='mean'
+        How the missing values of numerical variables are replaced before the first
+        iteration. Can take 'mean' or 'median'.
+
+    max_iter: int, default=10
+        The maximum number of iterations.
+
+    tol: float, default=0.001
+        The iterations stop when, for every variable, the largest change of the
+        imputed values of numerical variables, relative to the largest absolute
+        value of the variable, and the fraction of imputed categories that change,
+        are smaller than `tol`.
+
+    max_samples: int, default=None
+        The maximum number of observations used to train the models. If the training
+        set has more observations, the models are trained on a random sample of
+        `max_samples` observations. If None, all observations are used.
+
+    chunksize: int, default=None
+        The number of observations with missing data that are imputed at once
+        during transform. Smaller chunks use less memory. If None, all observations
+        are imputed at once.
+
+    warm_start: bool, default=False
+        If True, and the imputer was fitted before, `fit()` starts with the missing
+        values imputed by the previous fit instead of by the mean, median or most
+        frequent category, and adds its iterations to the previous ones. The
+        variables must be the same as in the previous fit, and the initial values
+        and categories learned in the first fit are kept.
+
+    {n_jobs}
+
+    random_state: int, default=None
+        The seed used to sample the observations to train the models when
+        `max_samples` is not None.
+
+    Attributes
+    ----------
+    initial_imputer_dict_:
+        Dictionary with the values that replace the missing data before the first
+        iteration.
+
+    categories_:
+        Dictionary with the categories of each categorical variable. Categories not
+        seen during the first fit are not used as predictors, and are not predicted.
+
+    estimators_:
+        List with one dictionary per iteration, with the model fitted for each
+        variable. The last dictionary also contains the models of the variables
+        without missing data in the train set.
+
+    n_iter_:
+        The number of iterations run by the last call to `fit()`. If there is no
+        missing data in the train set, the models are trained once, in 1 iteration.
+
+    {variables_}
+
+    {feature_names_in_}
+
+    {n_features_in_}
+
+    Methods
+    -------
+    fit:
+        Train the models to impute each variable.
+
+    {fit_transform}
+
+    {transform}
+
+    See Also
+    --------
+    sklearn.impute.IterativeImputer
+
+    Examples
+    --------
+
+    >>> import pandas as pd
+    >>> import numpy as np
+    >>> from feature_engine.imputation import IterativeImputer
+    >>> X = pd.DataFrame(dict(
+    >>>        x1 = [np.nan, 2, 3, 4, 5, 6],
+    >>>        x2 = [2, 4, 6, 8, 10, np.nan],
+    >>>        ))
+    >>> ii = IterativeImputer()
+    >>> ii.fit(X)
+    >>> ii.transform(X).round(1)
+        x1    x2
+    0  1.0   2.0
+    1  2.0   4.0
+    2  3.0   6.0
+    3  4.0   8.0
+    4  5.0  10.0
+    5  6.0  12.0
+    """
+
+    def __init__(
+        self,
+        variables: Union[None, int, str, List[Union[str, int]]] = None,
+        regressor=None,
+        classifier=None,
+        initial_strategy: str = "mean",
+        max_iter: int = 10,
+        tol: float = 1e-3,
+        max_samples: Optional[int] = None,
+        chunksize: Optional[int] = None,
+        warm_start: bool = False,
+        n_jobs: Optional[int] = None,
+        random_state: Optional[int] = None,
+    ) -> None:
+
+        if initial_strategy not in ["mean", "median"]:
+            raise ValueError("initial_strategy takes only values 'mean' or 'median'")
+
+        if not isinstance(max_iter, int) or max_iter < 1:
+            raise ValueError(
+                f"max_iter must be a positive integer. Got {max_iter} instead."
+            )
+
+        if not isinstance(tol, (int, float)) or tol < 0:
+            raise ValueError(
+                f"tol must be a number greater than or equal to 0. Got {tol} instead."
+            )
+
+        for name, value in [("max_samples", max_samples), ("chunksize", chunksize)]:
+            if value is not None and (not isinstance(value, int) or value < 1):
+                raise ValueError(
+                    f"{name} must be None or a positive integer. Got {value} instead."
+                )
+
+        if not isinstance(warm_start, bool):
+            raise ValueError("warm_start takes only booleans True and False")
+
+        self.variables = _check_init_parameter_variables(variables)
+        self.regressor = regressor
+        self.classifier = classifier
+        self.initial_strategy = initial_strategy
+        self.max_iter = max_iter
+        self.tol = tol
+        self.max_samples = max_samples
+        self.chunksize = chunksize
+        self.warm_start = warm_start
+        self.n_jobs = n_jobs
+        self.random_state = random_state
+
+    def fit(self, X: pd.DataFrame, y: Optional[pd.Series] = None):
+        """
+        Train the models to impute each variable, iteratively.
+
+        Parameters
+        ----------
+        X: pandas dataframe of shape = [n_samples, n_features]
+            The training dataset.
+
+        y: pandas Series, default=None
+            y is not needed in this imputation. You can pass None or y.
+        """
+
+        # check input dataframe
+        X = check_X(X)
+
+        # find numerical and categorical variables, in the order of the dataframe
+        # or of the list entered by the user.
+        categorical, numerical = _find_categorical_and_numerical_variables(
+            X, self.variables
+        )
+        variables_ = [
+            var
+            for var in _find_all_variables(X, self.variables)
+            if var in numerical + categorical
+        ]
+
+        warm_start = self.warm_start is True and hasattr(self, "estimators_")
+        if warm_start and variables_ != self.variables_:
+            raise ValueError(
+                "With warm_start=True, the variables must be the same as in the "
+                "previous fit."
+            )
+        self.variables_ = variables_
+
+        all_missing = [str(var) for var in self.variables_ if X[var].isnull().all()]
+        if len(all_missing) > 0:
+            raise ValueError(
+                f"The variable(s) {', '.join(all_missing)} contain(s) only missing "
+                f"values."
+            )
+
+        if self.max_samples is not None and len(X) > self.max_samples:
+            X = X.sample(
+                self.max_samples, random_state=check_random_state(self.random_state)
+            )
+
+        if not warm_start:
+            self._fit_initial_values(X, categorical)
+            self.estimators_: List[Dict] = []
+
+        missing = X[self.variables_].isnull().to_numpy()
+        Z = self._encode(X)
+        # the largest absolute value of each variable, to measure the changes
+        scale = np.nanmax(np.abs(Z), axis=0)
+        if warm_start:
+            Z = self._impute(Z, missing)
+        else:
+            Z = self._impute_initial_values(Z, missing)
+
+        # variables with missing data are imputed iteratively. A single variable
+        # has no predictors, so it keeps the initial values.
+        if len(self.variables_) > 1:
+            to_impute = list(np.flatnonzero(missing.any(axis=0)))
+            complete = list(np.flatnonzero(~missing.any(axis=0)))
+        else:
+            to_impute, complete = [], []
+
+        self.n_iter_ = 0
+        for _ in range(self.max_iter if len(to_impute) > 0 else 0):
+            D, predictors = self._design(Z)
+            results = self._fit_models(D, predictors, Z, missing, to_impute)
+
+            change = 0.0
+            step = {}
+            for j, (model, prediction) in zip(to_impute, results):
+                var = self.variables_[j]
+                step[var] = model
+                change = max(
+                    change,
+                    self._change(var, Z[missing[:, j], j], prediction, scale[j]),
+                )
+                Z[missing[:, j], j] = prediction
+
+            self.estimators_.append(step)
+            self.n_iter_ += 1
+
+            if change < self.tol:
+                break
+
+        # variables without missing data get one model, trained on the imputed data,
+        # so that they can be imputed during transform.
+        if len(complete) > 0:
+            D, predictors = self._design(Z)
+            results = self._fit_models(D, predictors, Z, missing, complete)
+            if self.n_iter_ == 0:
+                # without missing data, training these models is the only iteration
+                self.estimators_.append({})
+                self.n_iter_ = 1
+            for j, (model, _) in zip(complete, results):
+                self.estimators_[-1][self.variables_[j]] = model
+
+        self._get_feature_names_in(X)
+
+        return self
+
+    def transform(self, X: pd.DataFrame) -> pd.DataFrame:
+
+        X = self._transform(X)
+
+        missing = X[self.variables_].isnull().to_numpy()
+
+        # only the observations with missing data are imputed
+        rows = np.flatnonzero(missing.any(axis=1))
+        if len(rows) == 0:
+            return X
+
+        chunksize = self.chunksize or len(rows)
+        imputed = np.empty((len(rows), len(self.variables_)))
+        for start in range(0, len(rows), chunksize):
+            stop = start + chunksize
+            chunk = rows[start:stop]
+            imputed[start:stop] = self._impute(
+                self._encode(X.iloc[chunk]), missing[chunk]
+            )
+
+        for j, var in enumerate(self.variables_):
+            is_missing = missing[rows, j]
+            if not is_missing.any():
+                continue
+
+            values = imputed[is_missing, j]
+            if var in self.categories_:
+                values = self.categories_[var][values.astype(np.intp)]
+
+            column = X[var].copy()
+            column.iloc[rows[is_missing]] = values
+            X[var] = column
+
+        return X
+
+    # Get docstring from BaseClass
+    transform.__doc__ = BaseImputer.transform.__doc__
+
+    def _fit_initial_values(self, X: pd.DataFrame, categorical: List) -> None:
+        """Learns the categories and the values that replace the missing data first."""
+        self.categories_ = {}
+        self.initial_imputer_dict_ = {}
+
+        for var in self.variables_:
+            if var in categorical:
+                counts = X[var].value_counts()
+                self.categories_[var] = counts.index.to_numpy()
+                self.initial_imputer_dict_[var] = counts.index[0]
+            elif self.initial_strategy == "mean":
+                self.initial_imputer_dict_[var] = X[var].mean()
+            else:
+                self.initial_imputer_dict_[var] = X[var].median()
+
+    def _encode(self, X: pd.DataFrame) -> np.ndarray:
+        """
+        Returns the variables as a float array. Categorical variables are replaced
+        by the position of their category in `categories_`, or -1 for categories
+        not seen in fit. Missing values are NaN.
+        """
+        Z = np.empty((len(X), len(self.variables_)))
+        for j, var in enumerate(self.variables_):
+            if var in self.categories_:
+                codes = pd.Index(self.categories_[var]).get_indexer(X[var])
+                Z[:, j] = np.where(X[var].isnull(), np.nan, codes)
+            else:
+                Z[:, j] = X[var].to_numpy(dtype=float)
+        return Z
+
+    def _impute_initial_values(self, Z: np.ndarray, missing: np.ndarray) -> np.ndarray:
+        """Replaces the missing values by the initial values."""
+        for j, var in enumerate(self.variables_):
+            value = self.initial_imputer_dict_[var]
+            if var in self.categories_:
+                # the most frequent category is the first one
+                value = 0
+            Z[missing[:, j], j] = value
+        return Z
+
+    def _impute(self, Z: np.ndarray, missing: np.ndarray) -> np.ndarray:
+        """Imputes the missing values with the models of every iteration."""
+        Z = self._impute_initial_values(Z, missing)
+
+        for step in self.estimators_:
+            D, predictors = self._design(Z)
+            predictions = {}
+            for j, var in enumerate(self.variables_):
+                if var in step and missing[:, j].any():
+                    predictions[j] = step[var].predict(
+                        D[missing[:, j]][:, predictors[j]]
+                    )
+            for j, prediction in predictions.items():
+                Z[missing[:, j], j] = prediction
+
+        return Z
+
+    def _design(self, Z: np.ndarray) -> Tuple[np.ndarray, List[np.ndarray]]:
+        """
+        Returns the matrix of predictors, with categorical variables one-hot encoded,
+        and the columns of the matrix used to predict each variable, which are all
+        the columns except those of the variable itself.
+        """
+        blocks = []
+        for j, var in enumerate(self.variables_):
+            if var in self.categories_:
+                categories = np.arange(len(self.categories_[var]))
+                blocks.append((Z[:, [j]] == categories).astype(float))
+            else:
+                blocks.append(Z[:, [j]])
+
+        bounds = np.cumsum([0] + [block.shape[1] for block in blocks])
+        columns = np.arange(bounds[-1])
+        predictors = [
+            columns[(columns < begin) | (columns >= end)]
+            for begin, end in zip(bounds, bounds[1:])
+        ]
+
+        return np.hstack(blocks), predictors
+
+    def _fit_models(
+        self,
+        D: np.ndarray,
+        predictors: List[np.ndarray],
+        Z: np.ndarray,
+        missing: np.ndarray,
+        variables: List[int],
+    ) -> List[Tuple]:
+        """
+        Trains the model of each variable, in parallel, and returns it together with
+        its predictions for the missing values.
+        """
+        regressor = BayesianRidge() if self.regressor is None else self.regressor
+        classifier = (
+            LogisticRegression(max_iter=1000)
+            if self.classifier is None
+            else self.classifier
+        )
+
+        tasks = []
+        for j in variables:
+            var = self.variables_[j]
+            if var in self.categories_:
+                # unseen categories are not used to train the model
+                train = ~missing[:, j] & (Z[:, j] >= 0)
+                estimator = classifier
+            else:
+                train = ~missing[:, j]
+                estimator = regressor
+
+            tasks.append(
+                delayed(_fit_predict)(
+                    estimator, D, predictors[j], Z[:, j], train, missing[:, j]
+                )
+            )
+
+        return Parallel(n_jobs=self.n_jobs)(tasks)
+
+    def _change(
+        self, var, previous: np.ndarray, current: np.ndarray, scale: float
+    ) -> float:
+        """
+        Returns the change of the imputed values of a variable, as a fraction of the
+        largest absolute value of numerical variables, or as the fraction of
+        changed categories of categorical variables.
+        """
+        if var in self.categories_:
+            return float(np.mean(previous != current))
+        return float(np.abs(current - previous).max() / max(scale, 1e-12))
+
+    def _more_tags(self):
+        tags_dict = _return_tags()
+        tags_dict["allow_nan"] = True
+        tags_dict["variables"] = "all"
+        return tags_dict
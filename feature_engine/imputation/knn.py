@@ -0,0 +1,328 @@
+# License: BSD 3 clause
+
+from typing import List, Optional, Union
+
+import numpy as np
+import pandas as pd
+from sklearn.neighbors import NearestNeighbors
+from sklearn.utils import check_random_state
+
+from feature_engine._docstrings.fit_attributes import (
+    _feature_names_in_docstring,
+    _n_features_in_docstring,
+    _variables_attribute_docstring,
+)
+from feature_engine._docstrings.init_parameters import _n_jobs_docstring
+from feature_engine._docstrings.methods import _fit_transform_docstring
+from feature_engine._docstrings.substitute import Substitution
+from feature_engine._variable_handling.init_parameter_checks import (
+    _check_init_parameter_variables,
+)
+from feature_engine._variable_handling.variable_type_selection import (
+    _find_or_check_numerical_variables,
+)
+from feature_engine.dataframe_checks import check_X
+from feature_engine.imputation.base_imputer import BaseImputer
+
+# memory of the neighbour indices that KNNImputer() builds in fit, as a multiple
+# of the memory of X_. Each index stores a copy of X_ restricted to the observed
+# variables, plus the position of each observation.
+_INDEX_MEMORY = 4
+
+
+@Substitution(
+    variables=BaseImputer._variables_numerical_docstring,
+    n_jobs=_n_jobs_docstring,
+    variables_=_variables_attribute_docstring,
+    feature_names_in_=_feature_names_in_docstring,
+    n_features_in_=_n_features_in_docstring,
+    transform=BaseImputer._transform_docstring,
+    fit_transform=_fit_transform_docstring,
+)
+class KNNImputer(BaseImputer):
+    """
+    The KNNImputer() replaces missing data with the mean value of the nearest
+    neighbours of the observation. It works only with numerical variables.
+
+    The neighbours are searched among the observations of the train set without
+    missing data, using the Euclidean distance over the variables that are not
+    missing in the observation to impute. The neighbours are found with a ball tree,
+    a kd-tree or brute force search, built over the observed variables. The trees
+    of the most common combinations of missing variables in the train set, and of
+    each single missing variable, are built in `fit()`, as long as together they
+    take at most 4 times the memory of `X_`. The trees of other combinations are
+    built when needed and discarded after the transform.
+
+    The variables should be on a similar scale, as variables with larger values
+    dominate the distance.
+
+    More details in the :ref:`User Guide <knn_imputer>`.
+
+    Parameters
+    ----------
+    {variables}
+
+    n_neighbors: int, default=5
+        The number of neighbours used to impute each observation.
+
+    weights: str, default='uniform'
+        How the values of the neighbours are averaged. Can take 'uniform', for the
+        mean, or 'distance', for the mean weighted by the inverse of the distance.
+
+    algorithm: str, default='auto'
+        The algorithm used to find the neighbours. Can take 'auto', 'ball_tree',
+        'kd_tree' or 'brute'. See sklearn's NearestNeighbors().
+
+    leaf_size: int, default=30
+        The leaf size of the ball tree or kd-tree.
+
+    max_samples: int, default=None
+        The maximum number of observations without missing data in which to search
+        for neighbours. If the train set has more, a random sample of `max_samples`
+        observations is kept. If None, all observations are kept.
+
+    chunksize: int, default=10000
+        The number of observations with missing data whose neighbours are searched
+        at once. Smaller chunks use less memory.
+
+    {n_jobs}
+
+    random_state: int, default=None
+        The seed used to sample the observations when `max_samples` is not None.
+
+    Attributes
+    ----------
+    X_:
+        The observations of the train set without missing data, in which the
+        neighbours are searched.
+
+    {variables_}
+
+    {feature_names_in_}
+
+    {n_features_in_}
+
+    Methods
+    -------
+    fit:
+        Store the observations without missing data.
+
+    {fit_transform}
+
+    {transform}
+
+    See Also
+    --------
+    sklearn.impute.KNNImputer
+
+    Examples
+    --------
+
+    >>> import pandas as pd
+    >>> import numpy as np
+    >>> from feature_engine.imputation import KNNImputer
+    >>> X = pd.DataFrame(dict(
+    >>>        x1 = [np.nan, 1, 2, 3, 10],
+    >>>        x2 = [1, 1, 2, 3, 10],
+    >>>        ))
+    >>> knn = KNNImputer(n_neighbors=2)
+    >>> knn.fit(X)
+    >>> knn.transform(X)
+         x1  x2
+    0   1.5   1
+    1   1.0   1
+    2   2.0   2
+    3   3.0   3
+    4  10.0  10
+    """
+
+    def __init__(
+        self,
+        variables: Union[None, int, str, List[Union[str, int]]] = None,
+        n_neighbors: int = 5,
+        weights: str = "uniform",
+        algorithm: str = "auto",
+        leaf_size: int = 30,
+        max_samples: Optional[int] = None,
+        chunksize: int = 10_000,
+        n_jobs: Optional[int] = None,
+        random_state: Optional[int] = None,
+    ) -> None:
+
+        if weights not in ["uniform", "distance"]:
+            raise ValueError("weights takes only values 'uniform' or 'distance'")
+
+        if algorithm not in ["auto", "ball_tree", "kd_tree", "brute"]:
+            raise ValueError(
+                "algorithm takes only values 'auto', 'ball_tree', 'kd_tree' or "
+                "'brute'"
+            )
+
+        for name, value in [
+            ("n_neighbors", n_neighbors),
+            ("leaf_size", leaf_size),
+            ("chunksize", chunksize),
+        ]:
+            if not isinstance(value, int) or value < 1:
+                raise ValueError(
+                    f"{name} must be a positive integer. Got {value} instead."
+                )
+
+        if max_samples is not None and (
+            not isinstance(max_samples, int) or max_samples < 1
+        ):
+            raise ValueError(
+                f"max_samples must be None or a positive integer. Got {max_samples} "
+                f"instead."
+            )
+
+        self.variables = _check_init_parameter_variables(variables)
+        self.n_neighbors = n_neighbors
+        self.weights = weights
+        self.algorithm = algorithm
+        self.leaf_size = leaf_size
+        self.max_samples = max_samples
+        self.chunksize = chunksize
+        self.n_jobs = n_jobs
+        self.random_state = random_state
+
+    def fit(self, X: pd.DataFrame, y: Optional[pd.Series] = None):
+        """
+        Store the observations of the train set without missing data, and build the
+        neighbour indices.
+
+        Parameters
+        ----------
+        X: pandas dataframe of shape = [n_samples, n_features]
+            The training dataset.
+
+        y: pandas series or None, default=None
+            y is not needed in this imputation. You can pass None or y.
+        """
+
+        # check input dataframe
+        X = check_X(X)
+
+        # find or check for numerical variables
+        self.variables_ = _find_or_check_numerical_variables(X, self.variables)
+
+        X_ = X.loc[X[self.variables_].notnull().all(axis=1), self.variables_]
+        if len(X_) == 0:
+            raise ValueError(
+                "All observations in the train set contain missing data. The "
+                "neighbours are searched among observations without missing data."
+            )
+
+        if self.max_samples is not None and len(X_) > self.max_samples:
+            X_ = X_.sample(
+                self.max_samples, random_state=check_random_state(self.random_state)
+            )
+
+        self.X_ = X_.astype(float)
+
+        # neighbour indices, per combination of observed variables. First, the most
+        # common combinations of missing variables in the train set, then those with
+        # a single missing variable, within the memory budget.
+        missing = X[self.variables_].isnull().to_numpy()
+        missing = missing[missing.any(axis=1) & ~missing.all(axis=1)]
+        patterns, counts = np.unique(missing, axis=0, return_counts=True)
+        patterns = list(patterns[np.argsort(-counts, kind="stable")])
+        patterns += list(np.eye(len(self.variables_), dtype=bool))
+
+        budget = _INDEX_MEMORY * len(self.variables_)
+        self._indices = {}
+        for pattern in patterns:
+            # values stored per observation: the observed variables and its position
+            size = (~pattern).sum() + 1
+            if size > budget:
+                continue
+            if size > 1 and (~pattern).tobytes() not in self._indices:
+                self._indices[(~pattern).tobytes()] = self._build_index(~pattern)
+                budget -= size
+
+        self._get_feature_names_in(X)
+
+        return self
+
+    def transform(self, X: pd.DataFrame) -> pd.DataFrame:
+
+        X = self._transform(X)
+
+        values = X[self.variables_].to_numpy(dtype=float)
+        missing = np.isnan(values)
+
+        # only the observations with missing data are imputed
+        rows = np.flatnonzero(missing.any(axis=1))
+        if len(rows) == 0:
+            return X
+
+        # group the observations by the variables that are missing
+        patterns, inverse, counts = np.unique(
+            missing[rows], axis=0, return_inverse=True, return_counts=True
+        )
+        rows = rows[np.argsort(inverse.ravel(), kind="stable")]
+        bounds = np.concatenate([[0], np.cumsum(counts)])
+
+        reference = self.X_.to_numpy()
+        for pattern, begin, end in zip(patterns, bounds, bounds[1:]):
+            pattern_rows = rows[begin:end]
+
+            if pattern.all():
+                # nothing to compare, impute with the mean of the observations
+                values[pattern_rows] = reference.mean(axis=0)
+                continue
+
+            index = self._get_index(~pattern)
+            for start in range(0, len(pattern_rows), self.chunksize):
+                stop = start + self.chunksize
+                chunk = pattern_rows[start:stop]
+                distances, neighbours = index.kneighbors(values[chunk][:, ~pattern])
+                values[np.ix_(chunk, pattern)] = self._average(
+                    reference[neighbours][:, :, pattern], distances
+                )
+
+        for j, var in enumerate(self.variables_):
+            if missing[:, j].any():
+                X[var] = values[:, j]
+
+        return X
+
+    # Get docstring from BaseClass
+    transform.__doc__ = BaseImputer.transform.__doc__
+
+    def _get_index(self, observed: np.ndarray) -> NearestNeighbors:
+        """
+        Returns the neighbour index over the observed variables built in fit, or a
+        new one, which is not stored, for other combinations of observed variables.
+        """
+        index = self._indices.get(observed.tobytes())
+        if index is None:
+            index = self._build_index(observed)
+        return index
+
+    def _build_index(self, observed: np.ndarray) -> NearestNeighbors:
+        """Builds the neighbour index over the observed variables."""
+        return NearestNeighbors(
+            n_neighbors=min(self.n_neighbors, len(self.X_)),
+            algorithm=self.algorithm,
+            leaf_size=self.leaf_size,
+            n_jobs=self.n_jobs,
+        ).fit(self.X_.to_numpy()[:, observed])
+
+    def _average(self, neighbours: np.ndarray, distances: np.ndarray) -> np.ndarray:
+        """
+        Returns the mean of the values of the neighbours, of shape
+        [n_observations, n_neighbours, n_variables], per observation.
+        """
+        if self.weights == "uniform":
+            return neighbours.mean(axis=1)
+
+        with np.errstate(divide="ignore"):
+            weights = 1 / distances
+        # neighbours at distance 0 take all the weight
+        exact = np.isinf(weights).any(axis=1)
+        weights[exact] = np.isinf(weights[exact])
+
+        return np.einsum("ij,ijk->ik", weights, neighbours) / weights.sum(
+            axis=1, keepdims=True
+        )
@@ -24,7 +24,9 @@ from feature_engine.imputation.base_imputer import BaseImputer
 
 @Substitution(
     variables=BaseImputer._variables_numerical_docstring,
+    group_by=BaseImputer._group_by_docstring,
     imputer_dict_=BaseImputer._imputer_dict_docstring,
+    group_imputer_dict_=BaseImputer._group_imputer_dict_docstring,
     variables_=_variables_attribute_docstring,
     feature_names_in_=_feature_names_in_docstring,
     n_features_in_=_n_features_in_docstring,
@@ -40,6 +42,10 @@ class MeanMedianImputer(BaseImputer):
     MeanMedianImputer() will automatically select all variables of type numeric in the
     training set.
 
+    With `group_by`, the MeanMedianImputer() learns the mean or median value of the
+    variable per group, for example, per region, and replaces missing data with the
+    value of the group of the observation.
+
     More details in the :ref:`User Guide <mean_median_imputer>`.
 
     Parameters
@@ -49,10 +55,14 @@ class MeanMedianImputer(BaseImputer):
 
     {variables}
 
+    {group_by}
+
     Attributes
     ----------
     {imputer_dict_}
 
+    {group_imputer_dict_}
+
     {variables_}
 
     {feature_names_in_}
@@ -93,6 +103,7 @@ class MeanMedianImputer(BaseImputer):
         self,
         imputation_method: str = "median",
         variables: Union[None, int, str, List[Union[str, int]]] = None,
+        group_by: Union[None, int, str, List[Union[str, int]]] = None,
     ) -> None:
 
         if imputation_method not in ["median", "mean"]:
@@ -100,6 +111,7 @@ class MeanMedianImputer(BaseImputer):
 
         self.imputation_method = imputation_method
         self.variables = _check_init_parameter_variables(variables)
+        self.group_by = _check_init_parameter_variables(group_by)
 
     def fit(self, X: pd.DataFrame, y: Optional[pd.Series] = None):
         """
@@ -120,6 +132,9 @@ class MeanMedianImputer(BaseImputer):
         # find or check for numerical variables
         self.variables_ = _find_or_check_numerical_variables(X, self.variables)
 
+        if self.group_by is not None:
+            self._find_group_variables(X)
+
         # find imputation parameters: mean or median
         if self.imputation_method == "mean":
             self.imputer_dict_ = X[self.variables_].mean().to_dict()
@@ -127,6 +142,14 @@ class MeanMedianImputer(BaseImputer):
         elif self.imputation_method == "median":
             self.imputer_dict_ = X[self.variables_].median().to_dict()
 
+        if self.group_by is not None:
+            grouped = X.groupby(self.group_by_, observed=True)[self.variables_]
+            if self.imputation_method == "mean":
+                values = grouped.mean()
+            else:
+                values = grouped.median()
+            self.group_imputer_dict_ = {var: values[var] for var in self.variables_}
+
         self._get_feature_names_in(X)
 
         return self
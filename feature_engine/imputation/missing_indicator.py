@@ -3,6 +3,7 @@
 
 from typing import List, Optional, Union
 
+import numpy as np
 import pandas as pd
 
 from feature_engine._docstrings.fit_attributes import (
@@ -21,6 +22,46 @@ from feature_engine.dataframe_checks import check_X
 from feature_engine.imputation.base_imputer import BaseImputer
 from feature_engine.tags import _return_tags
 
+_INDICATOR_FORMATS = ["int", "uint8", "bool", "sparse", "bitmap"]
+
+
+def _indicator_names(variables: List, indicator_format: str) -> List:
+    """Returns the names of the missing indicators of the variables."""
+    if indicator_format == "bitmap":
+        n_columns = (len(variables) + 7) // 8
+        return [f"na_bitmap_{i}" for i in range(n_columns)]
+    return [f"{var}_na" for var in variables]
+
+
+def _missing_indicators(
+    missing: np.ndarray, names: List, indicator_format: str, index: pd.Index
+) -> pd.DataFrame:
+    """
+    Returns the missing indicators, in the requested format, from the boolean
+    array flagging missing values, of shape [n_samples, n_variables].
+    """
+    if indicator_format == "bitmap":
+        indicators = np.packbits(missing, axis=1, bitorder="little")
+    elif indicator_format == "sparse":
+        indicators = {
+            name: pd.arrays.SparseArray(missing[:, i], fill_value=0, dtype=np.uint8)
+            for i, name in enumerate(names)
+        }
+    elif indicator_format == "bool":
+        indicators = missing
+    else:
+        indicators = missing.astype(indicator_format)
+
+    return pd.DataFrame(indicators, index=index, columns=names)
+
+
+def _add_indicators(X: pd.DataFrame, indicators: pd.DataFrame) -> pd.DataFrame:
+    """Adds the missing indicators at the end of the dataframe."""
+    if X.columns.isin(indicators.columns).any():
+        X[indicators.columns] = indicators
+        return X
+    return pd.concat([X, indicators], axis=1)
+
 
 @Substitution(
     feature_names_in_=_feature_names_in_docstring,
@@ -43,6 +84,10 @@ class AddMissingIndicator(BaseImputer):
     variables that show missing data during `fit()`. These may be a subset of the
     variables you indicated in `variables`.
 
+    The missing indicators can be returned as integers, booleans or sparse
+    columns, or packed as bits, 8 variables per column, to reduce the memory
+    taken by the dataframe when missing indicators are added to many variables.
+
     More details in the :ref:`User Guide <add_missing_indicator>`.
 
     Parameters
@@ -60,6 +105,21 @@ class AddMissingIndicator(BaseImputer):
         The list of variables to impute. If None, the imputer will find and
         select all variables.
 
+    indicator_format: str, default='int'
+        How the missing indicators are returned. Can take the following values:
+
+        **'int'**: one int64 column per variable.
+
+        **'uint8'**: one uint8 column per variable.
+
+        **'bool'**: one boolean column per variable.
+
+        **'sparse'**: one sparse uint8 column per variable, which stores only the
+        missing values. Suitable when missing data is rare.
+
+        **'bitmap'**: one uint8 column per group of 8 variables, named `na_bitmap_`
+        followed by the group number. Bit `i` of column `na_bitmap_j` is 1 when the
+        variable `8 * j + i` in `variables_` is missing.
 
     Attributes
     ----------
@@ -105,13 +165,21 @@ class AddMissingIndicator(BaseImputer):
         self,
         missing_only: bool = True,
         variables: Union[None, int, str, List[Union[str, int]]] = None,
+        indicator_format: str = "int",
     ) -> None:
 
         if not isinstance(missing_only, bool):
             raise ValueError("missing_only takes values True or False")
 
+        if indicator_format not in _INDICATOR_FORMATS:
+            raise ValueError(
+                "indicator_format takes only values 'int', 'uint8', 'bool', "
+                f"'sparse' or 'bitmap'. Got {indicator_format} instead."
+            )
+
         self.variables = _check_init_parameter_variables(variables)
         self.missing_only = missing_only
+        self.indicator_format = indicator_format
 
     def fit(self, X: pd.DataFrame, y: Optional[pd.Series] = None):
         """
@@ -133,9 +201,8 @@ class AddMissingIndicator(BaseImputer):
         self.variables_ = _find_all_variables(X, self.variables)
 
         if self.missing_only is True:
-            self.variables_ = [
-                var for var in self.variables_ if X[var].isnull().sum() > 0
-            ]
+            has_missing = X[self.variables_].isnull().any()
+            self.variables_ = [var for var in self.variables_ if has_missing[var]]
 
         self._get_feature_names_in(X)
 
@@ -160,14 +227,17 @@ class AddMissingIndicator(BaseImputer):
 
         X = self._transform(X)
 
-        indicator_names = [f"{feature}_na" for feature in self.variables_]
-        X[indicator_names] = X[self.variables_].isna().astype(int)
+        # find missing data in all variables at once
+        missing = X[self.variables_].isna().to_numpy()
+        indicators = _missing_indicators(
+            missing, self._get_new_features_name(), self.indicator_format, X.index
+        )
 
-        return X
+        return _add_indicators(X, indicators)
 
     def _get_new_features_name(self) -> List:
         """Return names of the created features."""
-        return [f"{feat}_na" for feat in self.variables_]
+        return _indicator_names(self.variables_, self.indicator_format)
 
     def _add_new_feature_names(self, feature_names) -> List:
         """Adds names of new features."""
@@ -0,0 +1,320 @@
+# License: BSD 3 clause
+
+from typing import List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from feature_engine._docstrings.fit_attributes import (
+    _feature_names_in_docstring,
+    _n_features_in_docstring,
+    _variables_attribute_docstring,
+)
+from feature_engine._docstrings.methods import _fit_transform_docstring
+from feature_engine._docstrings.substitute import Substitution
+from feature_engine._variable_handling.init_parameter_checks import (
+    _check_init_parameter_variables,
+)
+from feature_engine._variable_handling.variable_type_selection import (
+    _find_all_variables,
+)
+from feature_engine.dataframe_checks import check_X
+from feature_engine.imputation.base_imputer import BaseImputer
+from feature_engine.imputation.categorical import (
+    _fill_categorical,
+    _most_frequent_categories,
+)
+from feature_engine.imputation.missing_indicator import (
+    _INDICATOR_FORMATS,
+    _add_indicators,
+    _indicator_names,
+    _missing_indicators,
+)
+from feature_engine.tags import _return_tags
+
+
+@Substitution(
+    imputer_dict_=BaseImputer._imputer_dict_docstring,
+    variables_=_variables_attribute_docstring,
+    feature_names_in_=_feature_names_in_docstring,
+    n_features_in_=_n_features_in_docstring,
+    fit_transform=_fit_transform_docstring,
+)
+class MultiStrategyImputer(BaseImputer):
+    """
+    The MultiStrategyImputer() replaces missing data in numerical variables by the
+    mean, median or an arbitrary number, and in categorical variables by the most
+    frequent category or an arbitrary value. Optionally, it adds missing indicators
+    too.
+
+    The MultiStrategyImputer() does the work of the AddMissingIndicator(), the
+    MeanMedianImputer() or ArbitraryNumberImputer() and the CategoricalImputer()
+    together, finding the missing values of each variable only once. This is faster
+    than a pipeline of those imputers on dataframes with many variables.
+
+    Variables of numerical type are imputed as numerical and variables of any other
+    type are imputed as categorical.
+
+    More details in the :ref:`User Guide <multi_strategy_imputer>`.
+
+    Parameters
+    ----------
+    variables: list, default=None
+        The list of variables to impute. If None, the imputer will select all
+        variables.
+
+    numerical_method: str, default='median'
+        The imputation method for numerical variables. Can take 'mean', 'median' or
+        'arbitrary', to impute with the value in `arbitrary_number`.
+
+    arbitrary_number: int or float, default=999
+        The number to replace missing data in numerical variables. Only used when
+        `numerical_method='arbitrary'`.
+
+    categorical_method: str, default='missing'
+        The imputation method for categorical variables. Can take 'frequent', for
+        the most frequent category, or 'missing', to impute with the value in
+        `fill_value`.
+
+    fill_value: str, int, float, default='Missing'
+        The value to replace missing data in categorical variables. Only used when
+        `categorical_method='missing'`.
+
+    add_missing_indicator: bool, default=False
+        Whether to add missing indicators to the variables with missing data in the
+        train set.
+
+    indicator_format: str, default='int'
+        How the missing indicators are returned. Can take 'int', 'uint8', 'bool',
+        'sparse' or 'bitmap'. See AddMissingIndicator().
+
+    Attributes
+    ----------
+    {imputer_dict_}
+
+    {variables_}
+
+    indicators_:
+        List of variables for which missing indicators are added.
+
+    n_missing_:
+        Dictionary with the number of missing values of each variable in the train
+        set.
+
+    {feature_names_in_}
+
+    {n_features_in_}
+
+    Methods
+    -------
+    fit:
+        Learn the values to replace missing data.
+
+    {fit_transform}
+
+    transform:
+        Impute missing data and add the missing indicators.
+
+    See Also
+    --------
+    feature_engine.imputation.AddMissingIndicator
+    feature_engine.imputation.MeanMedianImputer
+    feature_engine.imputation.CategoricalImputer
+
+    Examples
+    --------
+
+    >>> import pandas as pd
+    >>> import numpy as np
+    >>> from feature_engine.imputation import MultiStrategyImputer
+    >>> X = pd.DataFrame(dict(
+    >>>        x1 = [np.nan,1,1,0,np.nan],
+    >>>        x2 = ["a", np.nan, "b", np.nan, "a"],
+    >>>        ))
+    >>> msi = MultiStrategyImputer(add_missing_indicator=True)
+    >>> msi.fit(X)
+    >>> msi.transform(X)
+        x1       x2  x1_na  x2_na
+    0  1.0        a      1      0
+    1  1.0  Missing      0      1
+    2  1.0        b      0      0
+    3  0.0  Missing      0      1
+    4  1.0        a      1      0
+    """
+
+    def __init__(
+        self,
+        variables: Union[None, int, str, List[Union[str, int]]] = None,
+        numerical_method: str = "median",
+        arbitrary_number: Union[int, float] = 999,
+        categorical_method: str = "missing",
+        fill_value: Union[str, int, float] = "Missing",
+        add_missing_indicator: bool = False,
+        indicator_format: str = "int",
+    ) -> None:
+
+        if numerical_method not in ["mean", "median", "arbitrary"]:
+            raise ValueError(
+                "numerical_method takes only values 'mean', 'median' or 'arbitrary'"
+            )
+
+        if not isinstance(arbitrary_number, (int, float)):
+            raise ValueError("arbitrary_number must be numeric of type int or float")
+
+        if categorical_method not in ["missing", "frequent"]:
+            raise ValueError(
+                "categorical_method takes only values 'missing' or 'frequent'"
+            )
+
+        if not isinstance(add_missing_indicator, bool):
+            raise ValueError("add_missing_indicator takes values True or False")
+
+        if indicator_format not in _INDICATOR_FORMATS:
+            raise ValueError(
+                "indicator_format takes only values 'int', 'uint8', 'bool', "
+                f"'sparse' or 'bitmap'. Got {indicator_format} instead."
+            )
+
+        self.variables = _check_init_parameter_variables(variables)
+        self.numerical_method = numerical_method
+        self.arbitrary_number = arbitrary_number
+        self.categorical_method = categorical_method
+        self.fill_value = fill_value
+        self.add_missing_indicator = add_missing_indicator
+        self.indicator_format = indicator_format
+
+    def fit(self, X: pd.DataFrame, y: Optional[pd.Series] = None):
+        """
+        Learn the values to replace missing data and the variables with missing data.
+
+        Parameters
+        ----------
+        X: pandas dataframe of shape = [n_samples, n_features]
+            The training dataset.
+
+        y: pandas Series, default=None
+            y is not needed in this imputation. You can pass None or y.
+        """
+
+        # check input dataframe
+        X = check_X(X)
+
+        # find or check the variables
+        self.variables_ = _find_all_variables(X, self.variables)
+
+        numerical = [
+            var
+            for var in self.variables_
+            if pd.api.types.is_numeric_dtype(X[var])
+            and not pd.api.types.is_bool_dtype(X[var])
+        ]
+        categorical = [var for var in self.variables_ if var not in numerical]
+
+        # find missing data in all variables at once
+        n_missing = X[self.variables_].isnull().sum()
+        self.n_missing_ = n_missing.to_dict()
+
+        self.imputer_dict_ = {}
+
+        if self.numerical_method == "mean":
+            self.imputer_dict_.update(X[numerical].mean().to_dict())
+        elif self.numerical_method == "median":
+            self.imputer_dict_.update(X[numerical].median().to_dict())
+        else:
+            self.imputer_dict_.update({var: self.arbitrary_number for var in numerical})
+
+        if self.categorical_method == "frequent":
+            self.imputer_dict_.update(_most_frequent_categories(X, categorical))
+        else:
+            self.imputer_dict_.update({var: self.fill_value for var in categorical})
+
+        # keep the order of the variables
+        self.imputer_dict_ = {var: self.imputer_dict_[var] for var in self.variables_}
+
+        if self.add_missing_indicator:
+            self.indicators_ = [var for var in self.variables_ if n_missing[var] > 0]
+        else:
+            self.indicators_ = []
+
+        self._get_feature_names_in(X)
+
+        return self
+
+    def transform(self, X: pd.DataFrame) -> pd.DataFrame:
+        """
+        Replace missing data with the learned parameters and add the missing
+        indicators.
+
+        Parameters
+        ----------
+        X: pandas dataframe of shape = [n_samples, n_features]
+            The data to be transformed.
+
+        Returns
+        -------
+        X_new: pandas dataframe of shape = [n_samples, n_features + n_indicators]
+            The dataframe without missing values in the selected variables and with
+            the missing indicators.
+        """
+
+        X = self._transform(X)
+
+        # find missing data in all variables at once, and use it both to add the
+        # indicators and to impute.
+        missing = X[self.variables_].isna().to_numpy()
+
+        if self.indicators_:
+            positions = [self.variables_.index(var) for var in self.indicators_]
+            indicators = _missing_indicators(
+                missing[:, positions],
+                self._get_new_features_name(),
+                self.indicator_format,
+                X.index,
+            )
+
+        # variables of numpy type float or object are imputed together, one block
+        # per type, with the missing data found above. Pandas extension types, like
+        # Float64 or string, are imputed one at a time.
+        blocks: dict = {}
+        dtypes = X.dtypes
+        for j in np.flatnonzero(missing.any(axis=0)):
+            var = self.variables_[j]
+
+            if pd.api.types.is_categorical_dtype(dtypes[var]):
+                X[var] = _fill_categorical(X[var], self.imputer_dict_[var])
+            elif isinstance(dtypes[var], np.dtype) and dtypes[var].kind in "fO":
+                blocks.setdefault(dtypes[var], []).append(j)
+            else:
+                X[var] = X[var].fillna(self.imputer_dict_[var])
+
+        imputed = []
+        for dtype, positions in blocks.items():
+            variables = [self.variables_[j] for j in positions]
+            values = np.array([self.imputer_dict_[var] for var in variables], dtype)
+            values = np.where(missing[:, positions], values, X[variables].to_numpy())
+            imputed.append(pd.DataFrame(values, index=X.index, columns=variables))
+
+        if imputed:
+            # replacing the variables at once is faster than one at a time
+            columns = X.columns
+            variables = np.concatenate([df.columns for df in imputed])
+            X = pd.concat([X.drop(columns=variables), *imputed], axis=1)[columns]
+
+        if self.indicators_:
+            X = _add_indicators(X, indicators)
+
+        return X
+
+    def _get_new_features_name(self) -> List:
+        """Return names of the created features."""
+        return _indicator_names(self.indicators_, self.indicator_format)
+
+    def _add_new_feature_names(self, feature_names) -> List:
+        """Adds names of new features."""
+        return feature_names + self._get_new_features_name()
+
+    def _more_tags(self):
+        tags_dict = _return_tags()
+        tags_dict["allow_nan"] = True
+        tags_dict["variables"] = "all"
+        return tags_dict
@@ -5,6 +5,7 @@ from typing import List, Optional, Union
 
 import numpy as np
 import pandas as pd
+from sklearn.utils import check_random_state
 
 from feature_engine._docstrings.fit_attributes import (
     _feature_names_in_docstring,
@@ -40,6 +41,19 @@ def _define_seed(
     return internal_seed
 
 
+def _define_seeds(
+    X: pd.DataFrame,
+    seed_variables: Union[str, int, List[Union[str, int]]],
+    how: str = "add",
+) -> np.ndarray:
+    # determine the seed of every observation at once, like _define_seed()
+    if how == "add":
+        seeds = X[seed_variables].sum(axis=1)
+    elif how == "multiply":
+        seeds = X[seed_variables].product(axis=1)
+    return np.round(seeds.to_numpy(dtype=float), 0).astype(np.int64)
+
+
 @Substitution(
     variables_=_variables_attribute_docstring,
     feature_names_in_=_feature_names_in_docstring,
@@ -90,10 +104,31 @@ class RandomSampleImputer(BaseImputer):
         observation, you can choose to combine those values as an addition or a
         multiplication. Can take the values 'add' or 'multiply'.
 
+    storage: str, default='dataframe'
+        How the training data used to extract the random samples is stored.
+
+        **'dataframe'**: a copy of the variables to impute is stored in `X_`.
+
+        **'values'**: only the non-missing values of each variable are stored, as
+        NumPy arrays, in `values_`. The imputer is smaller, and the missing values
+        are not dropped again at each transform. With the same seed, the random
+        samples are the same as with 'dataframe'.
+
+    max_values: int, default=None
+        Only used when `storage='values'`. The maximum number of values stored per
+        variable. If a variable has more non-missing values, a random subset of
+        `max_values` values, extracted without replacement, is stored instead. If
+        None, all values are stored.
+
     Attributes
     ----------
     X_:
         Copy of the training dataframe from which to extract the random samples.
+        Only present if `storage='dataframe'`.
+
+    values_:
+        Dictionary with the values from which to extract the random samples, per
+        variable. Only present if `storage='values'`.
 
     {variables_}
 
@@ -137,6 +172,8 @@ class RandomSampleImputer(BaseImputer):
         random_state: Union[None, int, str, List[Union[str, int]]] = None,
         seed: str = "general",
         seeding_method: str = "add",
+        storage: str = "dataframe",
+        max_values: Optional[int] = None,
     ) -> None:
 
         if seed not in ["general", "observation"]:
@@ -157,16 +194,30 @@ class RandomSampleImputer(BaseImputer):
                 "or more variables which will be used to seed the imputer"
             )
 
+        if storage not in ["dataframe", "values"]:
+            raise ValueError("storage takes only values 'dataframe' or 'values'")
+
+        if max_values is not None and (
+            not isinstance(max_values, int) or max_values < 1
+        ):
+            raise ValueError(
+                f"max_values must be None or a positive integer. Got {max_values} "
+                f"instead."
+            )
+
         self.variables = _check_init_parameter_variables(variables)
         self.random_state = random_state
         self.seed = seed
         self.seeding_method = seeding_method
+        self.storage = storage
+        self.max_values = max_values
 
     def fit(self, X: pd.DataFrame, y: Optional[pd.Series] = None):
         """
-        Makes a copy of the train set. Only stores a copy of the variables to impute.
-        This copy is then used to randomly extract the values to fill the missing data
-        during transform.
+        Makes a copy of the train set. Only stores a copy of the variables to impute,
+        or only their non-missing values if `storage='values'`. This copy is then
+        used to randomly extract the values to fill the missing data during
+        transform.
 
         Parameters
         ----------
@@ -184,8 +235,25 @@ class RandomSampleImputer(BaseImputer):
         # find variables to impute
         self.variables_ = _find_all_variables(X, self.variables)
 
-        # take a copy of the selected variables
-        self.X_ = X[self.variables_].copy()
+        if self.storage == "dataframe":
+            # take a copy of the selected variables
+            self.X_ = X[self.variables_].copy()
+        else:
+            # keep only the non-missing values of each variable
+            self.values_ = {}
+            if self.seed == "general":
+                random_state = check_random_state(self.random_state)
+            else:
+                random_state = check_random_state(0)
+            for var in self.variables_:
+                values = X[var].dropna().to_numpy()
+                if self.max_values is not None and len(values) > self.max_values:
+                    values = values[
+                        random_state.choice(
+                            len(values), size=self.max_values, replace=False
+                        )
+                    ]
+                self.values_[var] = values
 
         # check the variables assigned to the random state
         if self.seed == "observation":
@@ -225,47 +293,51 @@ class RandomSampleImputer(BaseImputer):
         # random sampling with a general seed
         if self.seed == "general":
             for feature in self.variables_:
-                if X[feature].isnull().sum() > 0:
-                    # determine number of data points to extract at random
-                    n_samples = X[feature].isnull().sum()
-
-                    # extract values
-                    random_sample = (
-                        self.X_[feature]
-                        .dropna()
-                        .sample(n_samples, replace=True, random_state=self.random_state)
-                    )
-                    # re-index: pandas needs this to add the values to the right
-                    # observations
-                    random_sample.index = X[X[feature].isnull()].index
+                is_missing = X[feature].isnull()
+                # determine number of data points to extract at random
+                n_samples = is_missing.sum()
+                if n_samples > 0:
+                    values = self._sampling_values(feature)
+
+                    # extract values, like pandas.sample(random_state) does.
+                    random_state = check_random_state(self.random_state)
+                    random_sample = values[random_state.choice(len(values), n_samples)]
 
                     # replace na
-                    X.loc[X[feature].isnull(), feature] = random_sample
+                    X.loc[is_missing, feature] = random_sample
 
         # random sampling observation per observation
         elif self.seed == "observation" and self.random_state:
+            random_state = np.random.RandomState()
             for feature in self.variables_:
-                if X[feature].isnull().sum() > 0:
-
-                    # loop over each observation with missing data
-                    for i in X[X[feature].isnull()].index:
-                        # find the seed using additional variables
-                        internal_seed = _define_seed(
-                            X, i, self.random_state, how=self.seeding_method
-                        )
+                is_missing = X[feature].isnull()
+                if is_missing.sum() > 0:
+                    values = self._sampling_values(feature)
 
-                        # extract 1 value at random
-                        random_sample = (
-                            self.X_[feature]
-                            .dropna()
-                            .sample(1, replace=True, random_state=internal_seed)
-                        )
-                        random_sample = random_sample.values[0]
+                    # find the seed of each observation using additional variables
+                    seeds = _define_seeds(
+                        X.loc[is_missing], self.random_state, how=self.seeding_method
+                    )
 
-                        # replace the missing data point
-                        X.loc[i, feature] = random_sample
+                    # extract 1 value at random per seed, like
+                    # pandas.sample(1, random_state=seed) does. Observations with
+                    # the same seed get the same value.
+                    unique_seeds, inverse = np.unique(seeds, return_inverse=True)
+                    positions = np.empty(len(unique_seeds), dtype=np.intp)
+                    for i, internal_seed in enumerate(unique_seeds):
+                        random_state.seed(internal_seed)
+                        positions[i] = random_state.randint(0, len(values))
+
+                    # replace the missing data
+                    X.loc[is_missing, feature] = values[positions[inverse]]
         return X
 
+    def _sampling_values(self, feature: Union[str, int]) -> np.ndarray:
+        """Returns the non-missing values of the train set of a variable."""
+        if self.storage == "values":
+            return self.values_[feature]
+        return self.X_[feature].dropna().to_numpy()
+
     def _more_tags(self):
         tags_dict = _return_tags()
         tags_dict["allow_nan"] = True
@@ -1,6 +1,7 @@
 import warnings
 from typing import List, Optional, Union
 
+import numpy as np
 import pandas as pd
 
 from feature_engine._docstrings.fit_attributes import (
@@ -15,6 +16,7 @@ from feature_engine._docstrings.init_parameters import (
 )
 from feature_engine._docstrings.substitute import Substitution
 from feature_engine.dataframe_checks import _check_contains_na, check_X
+from feature_engine.encoding._factorization import _factorize_categories
 from feature_engine.encoding.base_encoder import (
     CategoricalInitMixin,
     CategoricalMethodsMixin,
@@ -149,26 +151,49 @@ class MatchCategories(
         """
         X = self._check_transform_input_and_state(X)
 
-        if self.missing_values == "raise":
-            _check_contains_na(X, self.variables_)
-
+        # the category of each observation is found from its code, so that the
+        # levels are only looked up with the distinct values of the variable.
+        # Missing values have code -1.
+        encoded = {}
+        input_nan = []
         for feature, levels in self.category_dict_.items():
-            X[feature] = pd.Categorical(X[feature], levels)
+            if pd.api.types.is_categorical_dtype(X[feature]):
+                codes = X[feature].cat.codes.to_numpy()
+                uniques = X[feature].cat.categories
+                ordered = X[feature].cat.ordered
+            else:
+                codes, uniques = _factorize_categories(X[feature])
+                ordered = False
 
-        self._check_nas_in_result(X)
-        return X
+            if (codes == -1).any():
+                input_nan.append(feature)
 
-    def _check_nas_in_result(self, X: pd.DataFrame):
-        # check if NaN values were introduced by the encoding
-        if X[self.category_dict_.keys()].isnull().sum().sum() > 0:
+            # variables already encoded with the levels keep their codes.
+            if not levels.equals(pd.Index(uniques)):
+                codes = np.append(levels.get_indexer(uniques), -1)[codes]
+
+            encoded[feature] = pd.Categorical.from_codes(
+                codes, dtype=pd.CategoricalDtype(levels, ordered=ordered)
+            )
 
-            # obtain the name(s) of the columns that have null values
-            nan_columns = (
-                X[self.category_dict_.keys()]
-                .columns[X[self.category_dict_.keys()].isnull().any()]
-                .tolist()
+        if self.missing_values == "raise" and input_nan:
+            raise ValueError(
+                "Some of the variables to transform contain NaN. Check and "
+                "remove those before using this transformer."
             )
 
+        for feature, values in encoded.items():
+            X[feature] = pd.Series(values, index=X.index)
+
+        self._check_nas_in_result(
+            [feature for feature, values in encoded.items() if values.isna().any()]
+        )
+        return X
+
+    def _check_nas_in_result(self, nan_columns: List[Union[str, int]]):
+        # check if NaN values were introduced by the encoding
+        if len(nan_columns) > 0:
+
             if len(nan_columns) > 1:
                 nan_columns_str = ", ".join(nan_columns)
             else:
@@ -176,12 +176,19 @@ class MatchVariables(BaseEstimator, TransformerMixin, GetFeatureNamesOutMixin):
 
         X = check_X(X)
 
+        # the columns already match those of the train set.
+        if X.columns.equals(pd.Index(self.feature_names_in_)):
+            if self.missing_values == "raise":
+                _check_contains_na(X, X.columns)
+            return X
+
+        indexer, order, _columns_to_add, _columns_to_drop = self._get_column_plan(
+            X.columns
+        )
+
         if self.missing_values == "raise":
             # check if dataset contains na
-            _check_contains_na(X, self.feature_names_in_)
-
-        _columns_to_drop = list(set(X.columns) - set(self.feature_names_in_))
-        _columns_to_add = list(set(self.feature_names_in_) - set(X.columns))
+            _check_contains_na(X, X.columns[indexer[indexer >= 0]])
 
         if self.verbose:
             if len(_columns_to_add) > 0:
@@ -195,11 +202,37 @@ class MatchVariables(BaseEstimator, TransformerMixin, GetFeatureNamesOutMixin):
                     f"{_columns_to_drop}"
                 )
 
-        X = X.drop(_columns_to_drop, axis=1)
+        present = indexer >= 0
+        if present.all():
+            return X.iloc[:, indexer]
+
+        X_added = pd.DataFrame(
+            self.fill_value,
+            index=X.index,
+            columns=pd.Index(self.feature_names_in_)[~present],
+        )
+        X = pd.concat([X.iloc[:, indexer[present]], X_added], axis=1)
 
-        X = X.reindex(columns=self.feature_names_in_, fill_value=self.fill_value)
+        return X.iloc[:, order]
 
-        return X
+    def _get_column_plan(self, columns: pd.Index):
+        """
+        Returns the position in `columns` of each variable of the train set (-1 if
+        the variable is absent), the order of the variables of the train set after
+        the added variables are appended to the present ones, and the variables to
+        add and to drop.
+        """
+        indexer = columns.get_indexer(self.feature_names_in_)
+        present = np.flatnonzero(indexer >= 0)
+        absent = np.flatnonzero(indexer < 0)
+        order = np.argsort(np.concatenate([present, absent]))
+
+        return (
+            indexer,
+            order,
+            list(set(self.feature_names_in_) - set(columns)),
+            list(set(columns) - set(self.feature_names_in_)),
+        )
 
     # for the check_estimator tests
     def _more_tags(self):
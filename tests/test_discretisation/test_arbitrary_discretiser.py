@@ -20,10 +20,10 @@ def test_arbitrary_discretiser():
 
     # HouseAge is the median house age in the block group.
     data_t1["HouseAge"] = pd.cut(data["HouseAge"], bins=[0, 20, 40, 60, np.Inf])
-    data_t1["HouseAge"] = data_t1["HouseAge"].astype(str)
+    data_t1["HouseAge"] = data_t1["HouseAge"].cat.rename_categories(str)
     data_t2["HouseAge"] = pd.cut(
         data["HouseAge"], bins=[0, 20, 40, 60, np.Inf], labels=False
-    )
+    ).astype("int8")
 
     transformer = ArbitraryDiscretiser(
         binning_dict=user_dict, return_object=False, return_boundaries=False
@@ -117,3 +117,24 @@ def test_error_if_not_permitted_value_is_errors():
     age_dict = {"Age": [0, 10, 20, 30, np.Inf]}
     with pytest.raises(ValueError):
         ArbitraryDiscretiser(binning_dict=age_dict, errors="medialuna")
+
+
+@pytest.mark.parametrize("return_boundaries", [True, False])
+def test_values_outside_the_limits_are_nan(return_boundaries):
+    X = pd.DataFrame({"x": [0, 5, 10, 15, 25]})
+    transformer = ArbitraryDiscretiser(
+        binning_dict={"x": [0, 10, 20]}, return_boundaries=return_boundaries
+    )
+    with pytest.warns(UserWarning):
+        X_transformed = transformer.fit_transform(X)
+
+    expected = pd.cut(X["x"], [0, 10, 20], labels=None if return_boundaries else False)
+    if return_boundaries:
+        expected = expected.cat.rename_categories(str)
+    pd.testing.assert_series_equal(X_transformed["x"], expected)
+
+
+def test_error_if_limits_do_not_increase():
+    X = pd.DataFrame({"x": [1, 5, 10]})
+    with pytest.raises(ValueError):
+        ArbitraryDiscretiser(binning_dict={"x": [0, 10, 5]}).fit(X)
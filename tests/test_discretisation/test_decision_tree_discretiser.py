@@ -2,6 +2,7 @@ import numpy as np
 import pandas as pd
 import pytest
 from sklearn.exceptions import NotFittedError
+from sklearn.model_selection import train_test_split
 
 from feature_engine.discretisation import DecisionTreeDiscretiser, EqualWidthDiscretiser
 
@@ -132,3 +133,117 @@ def test_error_when_regression_is_false_and_target_is_continuous(df_discretise):
     with pytest.raises(ValueError):
         transformer = DecisionTreeDiscretiser(regression=False)
         transformer.fit(df_discretise[["var_A", "var_B"]], y)
+
+
+@pytest.fixture(scope="module")
+def df_many_variables():
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.normal(size=(1000, 4)), columns=["a", "b", "c", "d"])
+    y = pd.Series((X["a"] + rng.normal(size=1000) > 0).astype(int))
+    return X, y
+
+
+def test_same_trees_in_parallel(df_many_variables):
+    X, y = df_many_variables
+    params = dict(regression=False, scoring="roc_auc", random_state=0)
+    transformer = DecisionTreeDiscretiser(**params).fit(X, y)
+    transformer_parallel = DecisionTreeDiscretiser(n_jobs=2, **params).fit(X, y)
+
+    assert transformer_parallel.scores_dict_ == transformer.scores_dict_
+    pd.testing.assert_frame_equal(
+        transformer_parallel.transform(X), transformer.transform(X)
+    )
+
+
+@pytest.mark.parametrize("regression", [True, False])
+def test_max_samples(df_many_variables, regression):
+    X, y = df_many_variables
+    transformer = DecisionTreeDiscretiser(
+        regression=regression,
+        scoring="neg_mean_squared_error" if regression else "roc_auc",
+        max_samples=300,
+        random_state=0,
+    )
+    y_train = y + X["b"] if regression else y
+    transformer.fit(X, y_train)
+
+    sample, _ = train_test_split(
+        np.arange(len(X)),
+        train_size=300,
+        random_state=0,
+        stratify=None if regression else y,
+    )
+    X_sample = X.iloc[np.sort(sample)]
+    y_sample = y_train.iloc[np.sort(sample)]
+    sample_transformer = DecisionTreeDiscretiser(
+        regression=regression, scoring=transformer.scoring, random_state=0
+    ).fit(X_sample, y_sample)
+
+    for var in transformer.variables_:
+        tree_model = transformer.binner_dict_[var]
+        # the grid search used the sample, the best tree was refit to all data
+        np.testing.assert_array_equal(
+            tree_model.cv_results_["mean_test_score"],
+            sample_transformer.binner_dict_[var].cv_results_["mean_test_score"],
+        )
+        assert tree_model.best_estimator_.tree_.n_node_samples[0] == len(X)
+        assert transformer.scores_dict_[var] == tree_model.score(X[[var]], y_train)
+
+    assert transformer.transform(X)["a"].nunique() <= 16
+
+
+def test_error_when_max_samples_not_permitted():
+    with pytest.raises(ValueError):
+        DecisionTreeDiscretiser(max_samples=0)
+
+
+@pytest.mark.parametrize("regression", [True, False])
+def test_histogram_method(df_many_variables, regression):
+    X, y = df_many_variables
+    y_train = y + X["b"] if regression else y
+    transformer = DecisionTreeDiscretiser(
+        regression=regression,
+        scoring="neg_mean_squared_error" if regression else "roc_auc",
+        method="histogram",
+        max_bins=32,
+        random_state=0,
+    )
+    X_transformed = transformer.fit_transform(X, y_train)
+
+    for var in transformer.variables_:
+        edges = transformer.binner_dict_[var]
+        predictions = transformer.predictions_dict_[var]
+        assert edges[0] == float("-inf") and edges[-1] == float("inf")
+        assert edges == sorted(edges)
+        assert len(predictions) == len(edges) - 1 <= 32
+
+        # each interval is replaced by the prediction of the tree
+        intervals = pd.cut(X[var], edges, labels=False)
+        expected = np.asarray(predictions)[intervals]
+        np.testing.assert_array_equal(X_transformed[var], expected)
+
+    # the variable related to the target predicts it better
+    assert transformer.scores_dict_["a"] > transformer.scores_dict_["d"]
+
+
+def test_histogram_method_learns_the_tree_splits():
+    X = pd.DataFrame({"x": np.arange(1000, dtype=float)})
+    y = pd.Series(np.where(X["x"] > 499, 1, 0))
+    transformer = DecisionTreeDiscretiser(
+        regression=False,
+        method="histogram",
+        max_bins=10,
+        param_grid={"max_depth": [1]},
+    )
+    X_transformed = transformer.fit_transform(X, y)
+
+    assert transformer.binner_dict_["x"] == [float("-inf"), 499.5, float("inf")]
+    assert transformer.predictions_dict_["x"] == [0.0, 1.0]
+    np.testing.assert_array_equal(X_transformed["x"], y.astype(float))
+    assert transformer.scores_dict_["x"] == 0
+
+
+@pytest.mark.parametrize("params", [{"method": "arbitrary"}, {"max_bins": 1}])
+def test_error_when_histogram_params_not_permitted(params):
+    with pytest.raises(ValueError):
+        DecisionTreeDiscretiser(**params)
@@ -68,3 +68,43 @@ def test_non_fitted_error(df_vartypes):
     with pytest.raises(NotFittedError):
         transformer = EqualWidthDiscretiser()
         transformer.transform(df_vartypes)
+
+
+def test_return_smallest_integer_type_and_boundaries_as_category(df_normal_dist):
+    transformer = EqualWidthDiscretiser(bins=10)
+    X = transformer.fit_transform(df_normal_dist)
+    expected = pd.cut(
+        df_normal_dist["var"], transformer.binner_dict_["var"], labels=False
+    )
+    assert X["var"].dtype == "int8"
+    pd.testing.assert_series_equal(X["var"], expected.astype("int8"))
+
+    transformer = EqualWidthDiscretiser(bins=10, return_boundaries=True)
+    X = transformer.fit_transform(df_normal_dist)
+    expected = pd.cut(df_normal_dist["var"], transformer.binner_dict_["var"])
+    assert X["var"].dtype == "category"
+    pd.testing.assert_series_equal(X["var"], expected.cat.rename_categories(str))
+    # all intervals are categories, even if no value falls into them
+    assert X["var"].cat.categories.tolist() == [
+        str(interval) for interval in expected.cat.categories
+    ]
+
+
+@pytest.mark.parametrize("return_boundaries", [True, False])
+def test_transform_without_stored_intervals(df_normal_dist, return_boundaries):
+    transformer = EqualWidthDiscretiser(bins=10, return_boundaries=return_boundaries)
+    X = transformer.fit_transform(df_normal_dist)
+
+    # as in discretisers fitted with older versions
+    del transformer._limits
+    del transformer._boundaries
+    pd.testing.assert_frame_equal(transformer.transform(df_normal_dist), X)
+
+
+def test_transform_uses_modified_binner_dict(df_normal_dist):
+    transformer = EqualWidthDiscretiser(bins=10).fit(df_normal_dist)
+    transformer.binner_dict_["var"] = [float("-inf"), 0, float("inf")]
+
+    X = transformer.transform(df_normal_dist)
+    expected = (df_normal_dist["var"] > 0).astype("int8")
+    pd.testing.assert_series_equal(X["var"], expected)
@@ -103,3 +103,85 @@ def test_categorical_methods_mixin_inverse_transform_when_ignore_unseen():
     enc = MockClass(unseen="ignore")
     pd.testing.assert_frame_equal(enc.transform(input_df), output_df)
     pd.testing.assert_frame_equal(enc.inverse_transform(output_df), inverse_df)
+
+
+def test_categorical_methods_mixin_inverse_transform_with_consecutive_integers():
+    enc = MockClass()
+    enc.encoder_dict_ = {"words": {"dog": 0, "dig": 1, "cat": 2}}
+    enc._fit_lookup()
+
+    # the categories are found by position
+    assert enc._get_lookup("words")[2][0] is None
+
+    output_df = pd.DataFrame({"words": [2, 0, 3, -1, 1]})
+    inverse_df = pd.DataFrame({"words": ["cat", "dog", np.nan, np.nan, "dig"]})
+    pd.testing.assert_frame_equal(enc.inverse_transform(output_df), inverse_df)
+
+    output_df = pd.DataFrame({"words": [2.0, 0.5, np.nan]})
+    inverse_df = pd.DataFrame({"words": ["cat", np.nan, np.nan]})
+    pd.testing.assert_frame_equal(enc.inverse_transform(output_df), inverse_df)
+
+
+def test_categorical_methods_mixin_inverse_transform_with_repeated_values():
+    enc = MockClass()
+    enc.encoder_dict_ = {"words": {"dog": 5, "dig": 3, "cat": 5, "bird": np.nan}}
+    enc._fit_lookup()
+
+    # like inverting the dictionary, the last category with the value is returned
+    output_df = pd.DataFrame({"words": [5, 3, 4, 5]})
+    inverse_df = pd.DataFrame({"words": ["cat", "dig", np.nan, "cat"]})
+    pd.testing.assert_frame_equal(enc.inverse_transform(output_df), inverse_df)
+
+
+@pytest.mark.parametrize("unseen", ["ignore", "encode"])
+def test_categorical_methods_mixin_transform_categorical_variables(unseen):
+    words = pd.Categorical(["dog", "bird", "cat"], categories=["cat", "bird", "dog"])
+    input_df = pd.DataFrame({"words": words})
+    unseen_value = -1 if unseen == "encode" else np.nan
+    output_df = pd.DataFrame({"words": [1, unseen_value, 0]})
+    enc = MockClass(unseen=unseen)
+    enc.encoder_dict_ = {"words": {"dog": 1, "cat": 0}}
+    enc._fit_lookup()
+
+    if unseen == "ignore":
+        with pytest.warns(UserWarning):
+            X = enc.transform(input_df)
+    else:
+        X = enc.transform(input_df)
+
+    # the encoded values keep the dtype of the encoding, without inference
+    pd.testing.assert_frame_equal(X, output_df)
+
+
+def test_categorical_methods_mixin_uses_modified_encoder_dict():
+    enc = MockClass()
+    enc.encoder_dict_ = {"words": {"dog": 0.5, "dig": 0.1, "cat": 0.2}}
+    enc._fit_lookup()
+    input_df = pd.DataFrame({"words": ["dog", "cat"]})
+    pd.testing.assert_frame_equal(
+        enc.transform(input_df), pd.DataFrame({"words": [0.5, 0.2]})
+    )
+
+    lookup = enc._lookup
+    enc.encoder_dict_["words"]["cat"] = 0.9
+    pd.testing.assert_frame_equal(
+        enc.transform(input_df), pd.DataFrame({"words": [0.5, 0.9]})
+    )
+    pd.testing.assert_frame_equal(
+        enc.inverse_transform(pd.DataFrame({"words": [0.9, 0.2]})),
+        pd.DataFrame({"words": ["cat", np.nan]}),
+    )
+    # the tables of fit are not replaced
+    assert enc._lookup is lookup
+
+
+def test_categorical_methods_mixin_without_stored_lookup():
+    # as in encoders fitted with older versions
+    enc = MockClass()
+    enc.encoder_dict_ = {"words": {"dog": 1, "dig": 0.66, "cat": 0}}
+    input_df = pd.DataFrame({"words": ["dog", "dig", "cat"]})
+    output_df = pd.DataFrame({"words": [1, 0.66, 0]})
+
+    pd.testing.assert_frame_equal(enc.transform(input_df), output_df)
+    pd.testing.assert_frame_equal(enc.inverse_transform(output_df), input_df)
+    assert not hasattr(enc, "_lookup")
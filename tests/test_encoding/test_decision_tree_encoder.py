@@ -139,3 +139,57 @@ def test_inverse_transform_raises_not_implemented_error(df_enc):
     encoder = DecisionTreeEncoder(regression=True).fit(df_enc[["var_A", "var_B"]], y)
     with pytest.raises(NotImplementedError):
         encoder.inverse_transform(df_enc[["var_A", "var_B"]])
+
+
+@pytest.mark.parametrize("encoding_method", ["arbitrary", "ordered"])
+def test_fit_on_aggregates_returns_same_encoding(encoding_method):
+    random = np.random.RandomState(42)
+    X = pd.DataFrame(
+        {
+            "var_A": random.choice(list("ABCDEFGH"), 500),
+            "var_B": random.choice(list("WXYZ"), 500),
+        }
+    )
+    y_reg = pd.Series(random.normal(0, 1, 500)) + X["var_A"].map(
+        dict(zip("ABCDEFGH", range(8)))
+    )
+    y_clf = (y_reg > y_reg.median()).astype(int)
+
+    for regression, y, scoring in [
+        (True, y_reg, "neg_mean_squared_error"),
+        (False, y_clf, "roc_auc"),
+    ]:
+        params = dict(
+            encoding_method=encoding_method,
+            regression=regression,
+            scoring=scoring,
+            random_state=0,
+        )
+        encoder = DecisionTreeEncoder(**params).fit(X, y)
+        encoder_agg = DecisionTreeEncoder(
+            fit_on_aggregates=True, n_jobs=2, **params
+        ).fit(X, y)
+
+        assert not hasattr(encoder_agg, "encoder_")
+        assert list(encoder_agg.encoder_dict_) == ["var_A", "var_B"]
+        pd.testing.assert_frame_equal(encoder.transform(X), encoder_agg.transform(X))
+
+
+def test_fit_on_aggregates_raises_error_with_unseen_categories(df_enc):
+    encoder = DecisionTreeEncoder(regression=False, fit_on_aggregates=True)
+    encoder.fit(df_enc[["var_A", "var_B"]], df_enc["target"])
+    X = pd.DataFrame({"var_A": ["A", "Z"], "var_B": ["A", "B"]})
+    with pytest.raises(ValueError):
+        encoder.transform(X)
+
+
+@pytest.mark.parametrize("fit_on_aggregates", [1, "True", None])
+def test_error_when_fit_on_aggregates_not_bool(fit_on_aggregates):
+    with pytest.raises(ValueError):
+        DecisionTreeEncoder(fit_on_aggregates=fit_on_aggregates)
+
+
+def test_n_jobs_is_passed_to_discretiser(df_enc):
+    encoder = DecisionTreeEncoder(regression=False, n_jobs=2)
+    encoder.fit(df_enc[["var_A", "var_B"]], df_enc["target"])
+    assert encoder.encoder_[1].n_jobs == 2
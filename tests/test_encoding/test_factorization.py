@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from feature_engine.encoding import (
+    CountFrequencyEncoder,
+    OneHotEncoder,
+    OrdinalEncoder,
+    RareLabelEncoder,
+)
+from feature_engine.encoding._factorization import (
+    _count_categories,
+    _factorize_categories,
+)
+
+
+@pytest.fixture
+def df_large():
+    random = np.random.RandomState(0)
+    categories = np.array(["A", "B", "C", "D", "E"], dtype=object)
+    return pd.DataFrame(
+        {
+            "var_A": categories[random.randint(0, 5, 20_000)],
+            "var_B": categories[random.randint(0, 3, 20_000)],
+        }
+    )
+
+
+def test_factorize_categories_equals_pd_factorize(df_large):
+    codes, uniques = _factorize_categories(df_large["var_A"])
+    expected_codes, expected_uniques = pd.factorize(df_large["var_A"])
+    np.testing.assert_array_equal(codes, expected_codes)
+    np.testing.assert_array_equal(uniques, expected_uniques)
+
+
+def test_count_categories_equals_value_counts(df_large):
+    pd.testing.assert_series_equal(
+        _count_categories(df_large["var_A"]),
+        df_large["var_A"].value_counts(),
+        check_index_type=False,
+    )
+
+
+@pytest.mark.parametrize(
+    "encoder",
+    [
+        CountFrequencyEncoder(),
+        OrdinalEncoder(encoding_method="arbitrary"),
+        OneHotEncoder(),
+        RareLabelEncoder(tol=0.25, n_categories=2),
+    ],
+)
+def test_encoders_return_same_output_on_slices(encoder, df_large):
+    X = encoder.fit(df_large).transform(df_large)
+
+    X_small = encoder.transform(df_large.iloc[:100])
+    pd.testing.assert_frame_equal(X.iloc[:100], X_small)
+
+
+def test_factorize_categories_reuses_categorical_codes():
+    x = pd.Series(
+        pd.Categorical(["b", np.nan, "c", "b", "a"], categories=["a", "b", "c", "d"])
+    )
+    codes, uniques = _factorize_categories(x)
+    expected_codes, expected_uniques = pd.factorize(x.to_numpy())
+    np.testing.assert_array_equal(codes, expected_codes)
+    np.testing.assert_array_equal(uniques, expected_uniques)
+
+
+@pytest.mark.parametrize(
+    "encoder",
+    [
+        CountFrequencyEncoder(),
+        OrdinalEncoder(encoding_method="arbitrary"),
+        OneHotEncoder(),
+        RareLabelEncoder(tol=0.25, n_categories=2),
+    ],
+)
+def test_encoders_return_same_output_on_categorical_dtype(encoder, df_large):
+    X = encoder.fit(df_large).transform(df_large)
+
+    df_cat = df_large.astype("category")
+    X_cat = encoder.fit(df_cat).transform(df_cat)
+    # the RareLabelEncoder returns categorical variables as categorical
+    pd.testing.assert_frame_equal(X, X_cat.astype(X.dtypes), check_dtype=False)
@@ -0,0 +1,28 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from feature_engine.encoding._grouped_statistics import (
+    _batched_target_statistics,
+    _target_statistics,
+)
+
+
+@pytest.mark.parametrize("max_stacked", [1, 40, 2**24])
+def test_batched_target_statistics_equal_per_variable_statistics(
+    df_enc_big, max_stacked
+):
+    X = df_enc_big.copy()
+    X["var_B"] = X["var_B"].astype("category").cat.add_categories(["Z"])
+    y = np.arange(len(X)) % 3
+
+    statistics = _batched_target_statistics(
+        X, ["var_A", "var_B", "var_C"], y, max_stacked=max_stacked
+    )
+
+    assert list(statistics) == ["var_A", "var_B", "var_C"]
+    for var in ["var_A", "var_B", "var_C"]:
+        expected = _target_statistics(X[var], y)
+        pd.testing.assert_index_equal(statistics[var][0], expected[0])
+        for result, exp in zip(statistics[var][1:], expected[1:]):
+            np.testing.assert_array_equal(result, exp)
@@ -1,6 +1,7 @@
 import numpy as np
 import pandas as pd
 import pytest
+from sklearn.model_selection import KFold
 
 from feature_engine.encoding import MeanEncoder
 
@@ -324,15 +325,39 @@ def test_auto_smoothing(df_enc):
     assert encoder.variables is None
     # test fit attr
     assert encoder.variables_ == ["var_A", "var_B"]
-    assert encoder.encoder_dict_ == {
-        "var_A": var_A_dict,
-        "var_B": var_B_dict,
-    }
+    # the variances are computed in two passes, equal to the expected values up to
+    # rounding.
+    for var, expected in [("var_A", var_A_dict), ("var_B", var_B_dict)]:
+        assert encoder.encoder_dict_[var] == pytest.approx(expected, rel=1e-15)
     assert encoder.n_features_in_ == 2
     # test transform output
     pd.testing.assert_frame_equal(X, transf_df[["var_A", "var_B"]])
 
 
+@pytest.mark.parametrize("offset", [1e8, 1e9])
+def test_auto_smoothing_with_large_target_offset(offset):
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame({"var_A": rng.choice(["A", "B", "C", "D"], 2000)})
+    y = pd.Series(rng.normal(size=2000)) + offset
+
+    encoder = MeanEncoder(smoothing="auto").fit(X, y)
+
+    # the encoding of the target without the offset, plus the offset, up to the
+    # rounding of values of the size of the offset.
+    expected = MeanEncoder(smoothing="auto").fit(X, y - offset).encoder_dict_
+    for category, value in expected["var_A"].items():
+        assert encoder.encoder_dict_["var_A"][category] - offset == pytest.approx(
+            value, abs=offset * 1e-13
+        )
+
+    # the out of fold encoding keeps the precision too
+    Xt = MeanEncoder(smoothing="auto", cv=3).fit_transform(X, y)
+    expected = MeanEncoder(smoothing="auto", cv=3).fit_transform(X, y - offset)
+    np.testing.assert_allclose(
+        Xt["var_A"] - offset, expected["var_A"], atol=offset * 1e-13
+    )
+
+
 def test_value_smoothing(df_enc):
     encoder = MeanEncoder(smoothing=100)
     encoder.fit(df_enc[["var_A", "var_B"]], df_enc["target"])
@@ -414,3 +439,124 @@ def test_inverse_transform_when_encode_unseen():
 def test_raises_error_when_not_allowed_smoothing_param_in_init(smoothing):
     with pytest.raises(ValueError):
         MeanEncoder(smoothing=smoothing)
+
+
+@pytest.mark.parametrize("smoothing", [0, 1, "auto"])
+def test_fit_transform_out_of_fold_encoding(df_enc, smoothing):
+    X = df_enc[["var_A", "var_B"]]
+    y = df_enc["target"]
+    cv = KFold(n_splits=4, shuffle=True, random_state=0)
+
+    encoder = MeanEncoder(smoothing=smoothing, cv=cv, n_jobs=2)
+    Xt = encoder.fit_transform(X, y)
+
+    # each fold encoded with an encoder fitted to the remaining folds
+    expected = pd.DataFrame(index=X.index, columns=X.columns, dtype=float)
+    for train, test in cv.split(X, y):
+        fold_encoder = MeanEncoder(smoothing=smoothing)
+        fold_encoder.fit(X.iloc[train], y.iloc[train])
+        expected.iloc[test] = fold_encoder.transform(X.iloc[test]).values
+
+    pd.testing.assert_frame_equal(Xt, expected)
+
+    # mappings used in transform are learned from the entire dataset
+    full_encoder = MeanEncoder(smoothing=smoothing).fit(X, y)
+    assert encoder.encoder_dict_ == full_encoder.encoder_dict_
+    pd.testing.assert_frame_equal(encoder.transform(X), full_encoder.transform(X))
+
+
+def test_out_of_fold_encoding_of_categories_absent_from_training_folds():
+    X = pd.DataFrame({"var_A": ["A", "A", "B", "B", "C", "D"]})
+    y = pd.Series([1, 0, 1, 1, 0, 1])
+    cv = [
+        (np.array([0, 1, 2, 3]), np.array([4, 5])),
+        (np.array([2, 3, 4, 5]), np.array([0, 1])),
+    ]
+
+    Xt = MeanEncoder(cv=cv).fit_transform(X, y)
+
+    # categories only present in the held-out fold are encoded with the fold prior;
+    # observations not in any held-out fold keep the encoding learned from all data
+    expected = pd.DataFrame({"var_A": [0.75, 0.75, 1.0, 1.0, 0.75, 0.75]})
+    pd.testing.assert_frame_equal(Xt, expected)
+
+
+@pytest.mark.parametrize("smoothing", [0, 1, "auto"])
+def test_multiclass_target(df_enc, smoothing):
+    X = df_enc[["var_A", "var_B"]]
+    y = pd.Series(["a", "b", "c", "c", "a"] * 4)
+
+    encoder = MeanEncoder(smoothing=smoothing, multiclass=True)
+    Xt = encoder.fit_transform(X, y)
+
+    assert encoder.classes_.tolist() == ["a", "b", "c"]
+    assert list(Xt.columns) == [
+        "var_A_a",
+        "var_A_b",
+        "var_A_c",
+        "var_B_a",
+        "var_B_b",
+        "var_B_c",
+    ]
+    assert encoder.get_feature_names_out() == list(Xt.columns)
+
+    # each class is encoded as the mean of its indicator, one-vs-rest
+    for class_ in ["a", "b", "c"]:
+        binary_encoder = MeanEncoder(smoothing=smoothing)
+        binary_encoder.fit(X, (y == class_).astype(int))
+        for var in ["var_A", "var_B"]:
+            assert encoder.encoder_dict_[var][class_] == pytest.approx(
+                binary_encoder.encoder_dict_[var]
+            )
+            np.testing.assert_allclose(
+                Xt[f"{var}_{class_}"], binary_encoder.transform(X)[var]
+            )
+
+
+def test_multiclass_target_unseen_categories(df_enc):
+    X = df_enc[["var_A", "var_B"]]
+    y = pd.Series([0, 1, 2, 2, 0] * 4)
+    df_unseen = pd.DataFrame({"var_A": ["A", "D"], "var_B": ["A", "A"]})
+
+    encoder = MeanEncoder(multiclass=True, unseen="encode").fit(X, y)
+    Xt = encoder.transform(df_unseen)
+    assert Xt.loc[1, ["var_A_0", "var_A_1", "var_A_2"]].tolist() == [0.4, 0.2, 0.4]
+
+    encoder = MeanEncoder(multiclass=True, unseen="ignore").fit(X, y)
+    with pytest.warns(UserWarning):
+        Xt = encoder.transform(df_unseen)
+    assert Xt.loc[1, ["var_A_0", "var_A_1", "var_A_2"]].isnull().all()
+
+    encoder = MeanEncoder(multiclass=True, unseen="raise").fit(X, y)
+    with pytest.raises(ValueError):
+        encoder.transform(df_unseen)
+
+    with pytest.raises(NotImplementedError):
+        encoder.inverse_transform(Xt)
+
+
+def test_multiclass_target_out_of_fold_encoding(df_enc):
+    X = df_enc[["var_A", "var_B"]]
+    y = pd.Series([0, 1, 2, 2, 0] * 4)
+    cv = KFold(n_splits=4, shuffle=True, random_state=0)
+
+    Xt = MeanEncoder(multiclass=True, cv=cv).fit_transform(X, y)
+
+    for class_ in [0, 1, 2]:
+        binary_encoder = MeanEncoder(cv=cv)
+        X_binary = binary_encoder.fit_transform(X, (y == class_).astype(int))
+        for var in ["var_A", "var_B"]:
+            np.testing.assert_allclose(Xt[f"{var}_{class_}"], X_binary[var])
+
+
+def test_multiclass_error_if_target_is_continuous():
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame({"var_A": rng.choice(["A", "B", "C"], 300)})
+    y = pd.Series(rng.normal(size=300))
+    with pytest.raises(ValueError):
+        MeanEncoder(multiclass=True).fit(X, y)
+
+
+def test_error_if_multiclass_not_bool():
+    with pytest.raises(ValueError):
+        MeanEncoder(multiclass="yes")
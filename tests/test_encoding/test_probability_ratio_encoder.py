@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -271,3 +272,26 @@ def test_warn_if_transform_df_contains_categories_not_seen_in_fit(df_enc, df_enc
 def test_error_if_rare_labels_not_permitted_value():
     with pytest.raises(ValueError):
         PRatioEncoder(unseen="empanada")
+
+
+@pytest.mark.parametrize("encoding_method", ["ratio", "log_ratio"])
+def test_laplace_smoothing_when_probability_is_zero(encoding_method):
+    df = {
+        "var_A": ["A"] * 6 + ["B"] * 10 + ["C"] * 4,
+        "target": [1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 0, 0, 0, 0, 1, 1, 0, 0],
+    }
+    df = pd.DataFrame(df)
+    encoder = PRatioEncoder(encoding_method=encoding_method, smoothing=1)
+    encoder.fit(df[["var_A"]], df["target"])
+
+    # A: 6 positives and 0 negatives, B: 2 and 8, C: 2 and 2.
+    expected = {"A": 7.0, "B": 1 / 3, "C": 1.0}
+    if encoding_method == "log_ratio":
+        expected = {k: np.log(v) for k, v in expected.items()}
+    assert encoder.encoder_dict_["var_A"] == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("smoothing", [-1, "auto", None])
+def test_error_if_smoothing_not_permitted(smoothing):
+    with pytest.raises(ValueError):
+        PRatioEncoder(smoothing=smoothing)
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -206,6 +207,10 @@ def test_variables_cast_as_category(df_enc_big):
         + ["G"] * 6,
     }
     df = pd.DataFrame(df)
+    # variables cast as category remain categorical, with the rare label as category
+    df["var_B"] = pd.Categorical(
+        df["var_B"], categories=["A", "B", "C", "D", "G", "Rare"]
+    )
 
     # test fit attr
     assert encoder.variables_ == ["var_A", "var_B", "var_C"]
@@ -224,3 +229,104 @@ def test_inverse_transform_raises_not_implemented_error(df_enc_big):
     enc = RareLabelEncoder().fit(df_enc_big)
     with pytest.raises(NotImplementedError):
         enc.inverse_transform(df_enc_big)
+
+
+def test_n_jobs_returns_same_output(df_enc_big):
+    encoder = RareLabelEncoder(tol=0.06, n_categories=5)
+    X = encoder.fit_transform(df_enc_big)
+
+    encoder_parallel = RareLabelEncoder(tol=0.06, n_categories=5, n_jobs=2)
+    X_parallel = encoder_parallel.fit_transform(df_enc_big)
+
+    pd.testing.assert_frame_equal(X, X_parallel)
+    for var in ["var_A", "var_B", "var_C"]:
+        assert list(encoder.encoder_dict_[var]) == list(
+            encoder_parallel.encoder_dict_[var]
+        )
+
+
+def test_transform_with_frequent_categories_stored_as_array(df_enc_big):
+    # encoders pickled with older versions store arrays in the encoder_dict_
+    encoder = RareLabelEncoder(tol=0.06, n_categories=5).fit(df_enc_big)
+    X = encoder.transform(df_enc_big)
+
+    for var in encoder.encoder_dict_:
+        encoder.encoder_dict_[var] = np.asarray(encoder.encoder_dict_[var])
+    pd.testing.assert_frame_equal(encoder.transform(df_enc_big), X)
+
+
+def test_categorical_variables_with_unseen_and_unused_categories():
+    X_train = pd.DataFrame({"var_A": ["A"] * 6 + ["B"] * 3 + ["C"]})
+    X_train["var_A"] = pd.Categorical(X_train["var_A"], categories=["C", "B", "A", "Z"])
+    encoder = RareLabelEncoder(tol=0.2, n_categories=2).fit(X_train)
+
+    assert list(encoder.encoder_dict_["var_A"]) == ["A", "B"]
+
+    X_test = pd.DataFrame(
+        {"var_A": pd.Categorical(["A", "D", "C", "B"], categories=["A", "B", "C", "D"])}
+    )
+    X = encoder.transform(X_test)
+
+    expected = pd.DataFrame(
+        {
+            "var_A": pd.Categorical(
+                ["A", "Rare", "Rare", "B"], categories=["A", "B", "Rare"]
+            )
+        }
+    )
+    pd.testing.assert_frame_equal(X, expected)
+
+
+def test_sketch_frequency_estimator_finds_frequent_categories():
+    X = pd.DataFrame(
+        {
+            "var_A": ["A"] * 300
+            + ["B"] * 200
+            + ["C"] * 95
+            + ["D"] * 40
+            + [f"tail_{i}" for i in range(365)]
+        }
+    )
+    X = X.sample(frac=1, random_state=0)
+
+    encoder = RareLabelEncoder(
+        tol=0.1, n_categories=5, frequency_estimator="sketch", sketch_error=0.01
+    )
+    encoder.fit(X)
+
+    # C, with frequency 0.095, is within sketch_error of tol, D is not.
+    assert set(encoder.encoder_dict_["var_A"]).issuperset({"A", "B"})
+    assert set(encoder.encoder_dict_["var_A"]).issubset({"A", "B", "C"})
+    assert list(encoder.encoder_dict_["var_A"][:2]) == ["A", "B"]
+
+    X_tr = encoder.transform(X)
+    assert X_tr.loc[X["var_A"].str.startswith("tail"), "var_A"].eq("Rare").all()
+
+
+def test_sketch_frequency_estimator_is_exact_with_few_categories(df_enc_big):
+    encoder = RareLabelEncoder(tol=0.06, n_categories=5)
+    encoder_sketch = RareLabelEncoder(
+        tol=0.06, n_categories=5, frequency_estimator="sketch", sketch_error=0.05
+    )
+    pd.testing.assert_frame_equal(
+        encoder.fit_transform(df_enc_big), encoder_sketch.fit_transform(df_enc_big)
+    )
+
+    with pytest.warns(UserWarning):
+        RareLabelEncoder(n_categories=10, frequency_estimator="sketch").fit(
+            df_enc_big
+        )
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"frequency_estimator": "approximate"},
+        {"sketch_error": 0},
+        {"sketch_error": 1.5},
+        {"sketch_error": "auto"},
+    ],
+)
+def test_error_when_not_allowed_frequency_estimator_params(params):
+    with pytest.raises(ValueError):
+        RareLabelEncoder(**params)
@@ -1,5 +1,7 @@
+import numpy as np
 import pandas as pd
 import pytest
+from sklearn.model_selection import StratifiedKFold
 
 from feature_engine.encoding import WoEEncoder
 
@@ -269,3 +271,112 @@ def test_variables_cast_as_category(df_enc_category_dtypes):
 def test_error_if_rare_labels_not_permitted_value():
     with pytest.raises(ValueError):
         WoEEncoder(unseen="empanada")
+
+
+def test_fit_transform_out_of_fold_encoding():
+    X = pd.DataFrame(
+        {
+            "var_A": ["A", "B", "C"] * 16,
+            "var_B": ["A", "A", "B", "B"] * 12,
+        }
+    )
+    y = pd.Series([1, 0, 0, 1, 0, 1, 1, 1] * 6)
+    cv = StratifiedKFold(n_splits=3)
+
+    encoder = WoEEncoder(cv=3, n_jobs=2)
+    Xt = encoder.fit_transform(X, y)
+
+    # each fold encoded with an encoder fitted to the remaining folds
+    expected = pd.DataFrame(index=X.index, columns=X.columns, dtype=float)
+    for train, test in cv.split(X, y):
+        fold_encoder = WoEEncoder().fit(X.iloc[train], y.iloc[train])
+        expected.iloc[test] = fold_encoder.transform(X.iloc[test]).values
+
+    pd.testing.assert_frame_equal(Xt, expected)
+
+    # mappings used in transform are learned from the entire dataset
+    full_encoder = WoEEncoder().fit(X, y)
+    assert encoder.encoder_dict_ == full_encoder.encoder_dict_
+
+
+def test_error_if_probability_is_zero_in_training_folds():
+    X = pd.DataFrame({"var_A": ["A", "A", "B", "B", "C", "C"]})
+    y = pd.Series([1, 0, 1, 0, 1, 0])
+    encoder = WoEEncoder(cv=[([0, 1, 2, 3, 4], [5])])
+    with pytest.raises(ValueError):
+        encoder.fit_transform(X, y)
+
+
+def test_multiclass_target():
+    X = pd.DataFrame(
+        {
+            "var_A": ["A", "B", "C"] * 16,
+            "var_B": ["A", "A", "B", "B"] * 12,
+        }
+    )
+    y = pd.Series(["x", "y", "y", "z", "x", "z", "z", "x"] * 6)
+
+    encoder = WoEEncoder(multiclass=True)
+    Xt = encoder.fit_transform(X, y)
+
+    assert encoder.classes_.tolist() == ["x", "y", "z"]
+    assert encoder.get_feature_names_out() == [
+        "var_A_x",
+        "var_A_y",
+        "var_A_z",
+        "var_B_x",
+        "var_B_y",
+        "var_B_z",
+    ]
+    assert list(Xt.columns) == encoder.get_feature_names_out()
+
+    # each class is encoded with its WoE against the rest
+    for class_ in ["x", "y", "z"]:
+        binary_encoder = WoEEncoder().fit(X, (y == class_).astype(int))
+        Xt_binary = binary_encoder.transform(X)
+        for var in ["var_A", "var_B"]:
+            assert (
+                encoder.encoder_dict_[var][class_]
+                == pytest.approx(binary_encoder.encoder_dict_[var])
+            )
+            pd.testing.assert_series_equal(
+                Xt[f"{var}_{class_}"], Xt_binary[var], check_names=False
+            )
+
+    with pytest.raises(NotImplementedError):
+        encoder.inverse_transform(Xt)
+
+
+def test_multiclass_error_if_target_is_continuous():
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame({"var_A": rng.choice(["A", "B", "C"], 300)})
+    y = pd.Series(rng.normal(size=300))
+    with pytest.raises(ValueError):
+        WoEEncoder(multiclass=True).fit(X, y)
+
+
+def test_multiclass_target_error_if_class_proportion_is_zero():
+    X = pd.DataFrame({"var_A": ["A", "A", "B", "B", "C", "C"]})
+    y = pd.Series([0, 1, 1, 2, 0, 2])
+    with pytest.raises(ValueError):
+        WoEEncoder(multiclass=True).fit(X, y)
+
+
+def test_laplace_smoothing_when_probability_is_zero():
+    df = {
+        "var_A": ["A"] * 6 + ["B"] * 10 + ["C"] * 4,
+        "target": [1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 0, 0, 0, 0, 1, 1, 0, 0],
+    }
+    df = pd.DataFrame(df)
+    encoder = WoEEncoder(smoothing=1)
+    encoder.fit(df[["var_A"]], df["target"])
+
+    # A: 6 positives and 0 negatives, B: 2 and 8, C: 2 and 2.
+    expected = {"A": np.log(7), "B": np.log(1 / 3), "C": 0.0}
+    assert encoder.encoder_dict_["var_A"] == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("smoothing", [-1, "auto", None])
+def test_error_if_smoothing_not_permitted(smoothing):
+    with pytest.raises(ValueError):
+        WoEEncoder(smoothing=smoothing)
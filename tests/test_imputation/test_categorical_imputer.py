@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -293,3 +294,74 @@ def test_variables_cast_as_category_frequent(df_na):
     assert X_transformed[["City", "Studies"]].isnull().sum().sum() == 0
     assert X_transformed[["Age", "Marks"]].isnull().sum().sum() > 0
     pd.testing.assert_frame_equal(X_transformed, X_reference)
+
+
+def test_variables_cast_as_category_keep_codes_and_order():
+    X = pd.DataFrame(
+        {
+            "ordered": pd.Categorical(
+                ["b", np.nan, "a", "b"], categories=["b", "a"], ordered=True
+            ),
+            "with_fill": pd.Categorical(
+                ["x", np.nan, "Missing", "x"], categories=["x", "Missing"]
+            ),
+        }
+    )
+
+    X_transformed = CategoricalImputer().fit_transform(X)
+
+    # the imputation value is appended to the categories, only if needed
+    assert list(X_transformed["ordered"].cat.categories) == ["b", "a", "Missing"]
+    assert X_transformed["ordered"].cat.ordered is True
+    assert list(X_transformed["ordered"]) == ["b", "Missing", "a", "b"]
+    assert list(X_transformed["with_fill"].cat.categories) == ["x", "Missing"]
+    assert list(X_transformed["with_fill"]) == ["x", "Missing", "Missing", "x"]
+
+    X_transformed = CategoricalImputer(imputation_method="frequent").fit_transform(X)
+    assert list(X_transformed["ordered"].cat.categories) == ["b", "a"]
+    assert list(X_transformed["ordered"]) == ["b", "b", "a", "b"]
+
+
+def test_mode_of_variable_with_only_missing_values():
+    X = pd.DataFrame({"var1": ["a", "a", "b"], "var2": [np.nan, np.nan, np.nan]})
+    imputer = CategoricalImputer(imputation_method="frequent", ignore_format=True)
+    X_transformed = imputer.fit_transform(X)
+
+    assert imputer.imputer_dict_["var1"] == "a"
+    assert np.isnan(imputer.imputer_dict_["var2"])
+    pd.testing.assert_frame_equal(X_transformed, X)
+
+
+def test_impute_by_group_with_frequent_category():
+    X = pd.DataFrame(
+        {
+            "region": ["a", "a", "a", "a", "b", "b", "b", "c", "c", "d"],
+            "city": ["x", "x", "y", np.nan, "z", "y", np.nan, "y", np.nan, np.nan],
+        }
+    )
+    imputer = CategoricalImputer(
+        imputation_method="frequent", variables="city", group_by="region"
+    ).fit(X)
+
+    # ties within a group are resolved with the first category in sorted order
+    assert imputer.imputer_dict_ == {"city": "y"}
+    pd.testing.assert_series_equal(
+        imputer.group_imputer_dict_["city"],
+        pd.Series(
+            ["x", "y", "y", np.nan],
+            index=pd.Index(["a", "b", "c", "d"], name="region"),
+            name="city",
+        ),
+    )
+
+    expected = ["x", "x", "y", "x", "z", "y", "y", "y", "y", "y"]
+    X_transformed = imputer.transform(X)
+    assert X_transformed["city"].tolist() == expected
+
+    X_transformed = imputer.transform(X.astype({"city": "category"}))
+    assert X_transformed["city"].tolist() == expected
+
+
+def test_error_when_group_by_and_imputation_method_missing():
+    with pytest.raises(ValueError):
+        CategoricalImputer(imputation_method="missing", group_by="region")
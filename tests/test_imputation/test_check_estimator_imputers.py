@@ -7,7 +7,10 @@ from feature_engine.imputation import (
     CategoricalImputer,
     DropMissingData,
     EndTailImputer,
+    IterativeImputer,
+    KNNImputer,
     MeanMedianImputer,
+    MultiStrategyImputer,
     RandomSampleImputer,
 )
 from tests.estimator_checks.estimator_checks import check_feature_engine_estimator
@@ -20,6 +23,9 @@ _estimators = [
     AddMissingIndicator(),
     RandomSampleImputer(),
     DropMissingData(),
+    IterativeImputer(),
+    KNNImputer(),
+    MultiStrategyImputer(),
 ]
 
 
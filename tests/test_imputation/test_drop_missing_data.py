@@ -1,3 +1,5 @@
+import numpy as np
+import pandas as pd
 import pytest
 
 from feature_engine.imputation import DropMissingData
@@ -47,7 +49,8 @@ def test_return_na_data_method(df_na):
     )
     imputer.fit_transform(df_na)
     X_nona = imputer.return_na_data(df_na)
-    assert list(X_nona.index) == [2, 3]
+    # the rows removed by transform, which keeps rows with 50% of data
+    assert list(X_nona.index) == [3]
 
     # test without vars & threshold
     imputer = DropMissingData()
@@ -118,3 +121,54 @@ def test_threshold_with_variables(df_na):
     )
     X = imputer.fit_transform(df_na)
     assert list(X.index) == [0, 1, 4, 5, 6, 7]
+
+
+@pytest.mark.parametrize("threshold", [None, 0.5, 1])
+def test_split_na_data_and_mask(df_na, threshold):
+    imputer = DropMissingData(threshold=threshold).fit(df_na)
+    X_transformed = imputer.transform(df_na)
+    X_na = imputer.return_na_data(df_na)
+
+    X_new, X_na_new = imputer.split_na_data(df_na)
+    pd.testing.assert_frame_equal(X_new, X_transformed)
+    pd.testing.assert_frame_equal(X_na_new, X_na)
+    assert sorted(X_new.index.append(X_na.index)) == list(df_na.index)
+
+    mask = imputer.return_na_mask(df_na)
+    pd.testing.assert_index_equal(mask.index, df_na.index)
+    assert list(mask.index[mask]) == list(X_na.index)
+
+
+def test_return_na_mask_does_not_copy(df_na):
+    imputer = DropMissingData().fit(df_na)
+    X = df_na.copy()
+    mask = imputer.return_na_mask(X)
+    assert mask.dtype == bool
+    assert list(mask) == [False, False, True, True, False, True, False, False]
+    pd.testing.assert_frame_equal(X, df_na)
+
+
+def test_iter_split_na_data(df_na):
+    imputer = DropMissingData().fit(df_na)
+
+    chunks = list(imputer.iter_split_na_data(df_na, chunksize=3))
+    assert len(chunks) == 3
+    assert [list(X_na.index) for _, X_na in chunks] == [[2], [3, 5], []]
+    pd.testing.assert_frame_equal(
+        pd.concat([X_new for X_new, _ in chunks]), imputer.transform(df_na)
+    )
+
+    # iterables of dataframes are split chunk by chunk
+    chunks = list(imputer.iter_split_na_data(iter([df_na.iloc[:4], df_na.iloc[4:]])))
+    assert [list(X_na.index) for _, X_na in chunks] == [[2, 3], [5]]
+
+    # the chunksize is checked when the method is called
+    with pytest.raises(ValueError):
+        imputer.iter_split_na_data(df_na, chunksize=0)
+
+
+def test_threshold_keeps_rows_in_transform_or_return_na_data():
+    X = pd.DataFrame({"x1": [np.nan, 1.0, np.nan], "x2": [np.nan, np.nan, 1.0]})
+    imputer = DropMissingData(threshold=0.5, missing_only=False).fit(X)
+    assert list(imputer.transform(X).index) == [1, 2]
+    assert list(imputer.return_na_data(X).index) == [0]
@@ -101,3 +101,34 @@ def test_error_when_tail_is_string():
 def test_error_when_fold_is_1():
     with pytest.raises(ValueError):
         EndTailImputer(fold=-1)
+
+
+@pytest.mark.parametrize(
+    "imputation_method, tail", [("gaussian", "left"), ("iqr", "right"), ("max", None)]
+)
+def test_impute_by_group(imputation_method, tail):
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(
+        {"region": rng.integers(0, 5, 500), "income": rng.normal(size=500)}
+    )
+    X["income"] = X["income"] + X["region"]
+    X_na = X.assign(income=X["income"].mask(rng.random(500) < 0.2))
+
+    params = dict(imputation_method=imputation_method, group_by="region")
+    if tail is not None:
+        params["tail"] = tail
+    imputer = EndTailImputer(**params)
+    X_transformed = imputer.fit_transform(X_na)
+
+    assert imputer.variables_ == ["income"]
+    for region, group in X_na.groupby("region"):
+        expected = EndTailImputer(**dict(params, group_by=None)).fit(group)
+        assert np.isclose(
+            imputer.group_imputer_dict_["income"][region],
+            expected.imputer_dict_["income"],
+        )
+        missing = group["income"].isnull()
+        assert (
+            X_transformed.loc[missing[missing].index, "income"]
+            == imputer.group_imputer_dict_["income"][region]
+        ).all()
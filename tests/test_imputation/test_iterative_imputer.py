@@ -0,0 +1,158 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.tree import DecisionTreeClassifier, DecisionTreeRegressor
+
+from feature_engine.imputation import IterativeImputer
+
+
+@pytest.fixture(scope="module")
+def df_linear():
+    rng = np.random.default_rng(0)
+    n = 1000
+    x1 = rng.normal(size=n)
+    df = pd.DataFrame(
+        {
+            "x1": x1,
+            "x2": 2 * x1 + rng.normal(scale=0.01, size=n),
+            "x3": rng.normal(size=n),
+            "cat": np.where(x1 > 0, "pos", "neg").astype(object),
+        }
+    )
+    df_na = df.copy()
+    df_na.loc[rng.random(n) < 0.1, "x2"] = np.nan
+    df_na.loc[rng.random(n) < 0.1, "cat"] = np.nan
+    return df, df_na
+
+
+def test_impute_numerical_and_categorical_variables(df_na):
+    imputer = IterativeImputer()
+    X_transformed = imputer.fit_transform(df_na)
+
+    # test fit attributes
+    assert imputer.variables_ == ["Name", "City", "Studies", "Age", "Marks"]
+    assert set(imputer.categories_.keys()) == {"Name", "City", "Studies"}
+    assert imputer.initial_imputer_dict_["City"] == "London"
+    assert imputer.initial_imputer_dict_["Age"] == df_na["Age"].mean()
+    assert imputer.n_iter_ >= 1
+    assert len(imputer.estimators_) == imputer.n_iter_
+
+    # test transform output
+    assert X_transformed[imputer.variables_].isnull().sum().sum() == 0
+    observed = df_na.notnull()
+    pd.testing.assert_frame_equal(X_transformed[observed], df_na[observed])
+    for var in ["Name", "City", "Studies"]:
+        assert X_transformed[var].isin(imputer.categories_[var]).all()
+
+
+def test_predictions_follow_other_variables(df_linear):
+    df, df_na = df_linear
+    imputer = IterativeImputer(variables=["x1", "x2", "cat"])
+    X_transformed = imputer.fit_transform(df_na)
+
+    assert imputer.variables_ == ["x1", "x2", "cat"]
+
+    is_missing = df_na["x2"].isnull()
+    np.testing.assert_allclose(
+        X_transformed.loc[is_missing, "x2"], df.loc[is_missing, "x2"], atol=0.1
+    )
+
+    is_missing = df_na["cat"].isnull()
+    is_correct = X_transformed.loc[is_missing, "cat"] == df.loc[is_missing, "cat"]
+    assert is_correct.mean() > 0.95
+
+    # x3 was not imputed
+    pd.testing.assert_series_equal(X_transformed["x3"], df_na["x3"])
+
+
+def test_impute_variables_without_missing_data_in_train_set(df_linear):
+    df, df_na = df_linear
+    imputer = IterativeImputer(variables=["x1", "x2"]).fit(df_na)
+    assert "x1" in imputer.estimators_[-1]
+
+    X = df.copy()
+    X.loc[:9, "x1"] = np.nan
+    X_transformed = imputer.transform(X)
+    np.testing.assert_allclose(X_transformed.loc[:9, "x1"], df.loc[:9, "x1"], atol=0.1)
+
+
+def test_custom_estimators_and_chunksize(df_linear):
+    _, df_na = df_linear
+    params = dict(
+        regressor=DecisionTreeRegressor(max_depth=3, random_state=0),
+        classifier=DecisionTreeClassifier(max_depth=3, random_state=0),
+        max_iter=3,
+    )
+    X_transformed = IterativeImputer(**params).fit_transform(df_na)
+    X_chunked = IterativeImputer(chunksize=7, **params).fit_transform(df_na)
+
+    pd.testing.assert_frame_equal(X_chunked, X_transformed)
+    assert X_transformed.isnull().sum().sum() == 0
+
+
+def test_early_stopping_and_max_iter(df_linear):
+    _, df_na = df_linear
+    imputer = IterativeImputer(max_iter=5, tol=2).fit(df_na)
+    assert imputer.n_iter_ == 1
+
+    imputer = IterativeImputer(max_iter=2, tol=0).fit(df_na)
+    assert imputer.n_iter_ == 2
+    assert len(imputer.estimators_) == 2
+
+
+def test_max_samples(df_linear):
+    _, df_na = df_linear
+    imputer = IterativeImputer(max_samples=100, random_state=0).fit(df_na)
+    X_transformed = imputer.transform(df_na)
+
+    assert X_transformed.isnull().sum().sum() == 0
+    sample = df_na.sample(100, random_state=0)
+    assert imputer.initial_imputer_dict_["x2"] == sample["x2"].mean()
+
+
+def test_warm_start(df_linear):
+    _, df_na = df_linear
+    imputer = IterativeImputer(max_iter=2, tol=0, warm_start=True)
+    imputer.fit(df_na)
+    initial_values = imputer.initial_imputer_dict_
+    imputer.fit(df_na)
+
+    assert len(imputer.estimators_) == 4
+    assert imputer.n_iter_ == 2
+    assert imputer.initial_imputer_dict_ is initial_values
+
+    with pytest.raises(ValueError):
+        imputer.fit(df_na[["x1", "x2"]])
+
+
+def test_single_variable_is_imputed_with_initial_value(df_linear):
+    _, df_na = df_linear
+    imputer = IterativeImputer(variables="x2", initial_strategy="median")
+    X_transformed = imputer.fit_transform(df_na)
+
+    assert imputer.estimators_ == []
+    assert (X_transformed["x2"] == df_na["x2"].fillna(df_na["x2"].median())).all()
+
+
+def test_error_if_variable_only_has_missing_values(df_linear):
+    _, df_na = df_linear
+    X = df_na.assign(x4=np.nan)
+    with pytest.raises(ValueError) as record:
+        IterativeImputer().fit(X)
+    assert str(record.value) == "The variable(s) x4 contain(s) only missing values."
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"initial_strategy": "mode"},
+        {"max_iter": 0},
+        {"tol": -1},
+        {"max_samples": 0},
+        {"chunksize": 1.5},
+        {"warm_start": "yes"},
+    ],
+)
+def test_error_if_params_not_permitted(params):
+    with pytest.raises(ValueError):
+        IterativeImputer(**params)
@@ -0,0 +1,122 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.impute import KNNImputer as SklearnKNNImputer
+
+from feature_engine.imputation import KNNImputer
+from feature_engine.imputation.knn import _INDEX_MEMORY
+
+
+@pytest.fixture(scope="module")
+def df_train_test():
+    rng = np.random.default_rng(0)
+    train = pd.DataFrame(rng.normal(size=(500, 4)), columns=["a", "b", "c", "d"])
+    test = pd.DataFrame(rng.normal(size=(200, 4)), columns=["a", "b", "c", "d"])
+    test = test.mask(rng.random(test.shape) < 0.2)
+    return train, test
+
+
+@pytest.mark.parametrize("weights", ["uniform", "distance"])
+@pytest.mark.parametrize("algorithm", ["ball_tree", "kd_tree", "brute"])
+def test_same_imputation_as_sklearn(df_train_test, weights, algorithm):
+    train, test = df_train_test
+    imputer = KNNImputer(weights=weights, algorithm=algorithm, chunksize=7)
+    X_transformed = imputer.fit(train).transform(test)
+
+    expected = SklearnKNNImputer(weights=weights).fit(train).transform(test)
+    expected = pd.DataFrame(expected, columns=test.columns)
+
+    # sklearn leaves observations without observed values to the mean
+    all_missing = test.isnull().all(axis=1)
+    pd.testing.assert_frame_equal(X_transformed[~all_missing], expected[~all_missing])
+    assert X_transformed.isnull().sum().sum() == 0
+
+
+def test_neighbours_and_observations_without_observed_values():
+    X = pd.DataFrame(
+        {
+            "x1": [np.nan, 1, 2, 3, 10, np.nan],
+            "x2": [1, 1, 2, 3, 10, np.nan],
+            "x3": ["a", "b", "c", "d", "e", "f"],
+        }
+    )
+    imputer = KNNImputer(n_neighbors=2)
+    X_transformed = imputer.fit_transform(X)
+
+    assert imputer.variables_ == ["x1", "x2"]
+    pd.testing.assert_frame_equal(imputer.X_, X.loc[1:4, ["x1", "x2"]])
+
+    expected = X.copy()
+    expected.loc[0, "x1"] = 1.5
+    expected.loc[5, ["x1", "x2"]] = 4.0
+    pd.testing.assert_frame_equal(X_transformed, expected)
+
+
+def test_exact_matches_take_all_the_weight():
+    X = pd.DataFrame({"x1": [1.0, 2.0, 3.0, 4.0], "x2": [1.0, 1.0, 5.0, 9.0]})
+    imputer = KNNImputer(n_neighbors=3, weights="distance").fit(X)
+
+    X_transformed = imputer.transform(pd.DataFrame({"x1": [2.0], "x2": [np.nan]}))
+    assert X_transformed.loc[0, "x2"] == 1.0
+
+
+def test_indices_are_built_in_fit(df_train_test):
+    train, test = df_train_test
+    imputer = KNNImputer().fit(train)
+
+    # no missing data in the train set, one index per single missing variable
+    assert len(imputer._indices) == 4
+    indices = dict(imputer._indices)
+    imputer.transform(test)
+    assert imputer._indices == indices
+
+    # the most common combinations of missing variables come first
+    train = train.copy()
+    train.loc[:9, ["a", "b"]] = np.nan
+    imputer = KNNImputer().fit(train)
+    assert next(iter(imputer._indices)) == np.array([0, 0, 1, 1], bool).tobytes()
+
+
+def test_indices_memory_is_bounded():
+    rng = np.random.default_rng(1)
+    train = pd.DataFrame(rng.normal(size=(100, 20)))
+    test = pd.DataFrame(rng.normal(size=(300, 20))).mask(rng.random((300, 20)) < 0.5)
+    imputer = KNNImputer().fit(train)
+
+    # each index stores the observed variables and the position of each observation
+    size = sum(np.frombuffer(k, bool).sum() + 1 for k in imputer._indices)
+    assert size <= _INDEX_MEMORY * train.shape[1]
+
+    indices = dict(imputer._indices)
+    X_transformed = imputer.transform(test)
+    assert imputer._indices == indices
+    assert X_transformed.isnull().sum().sum() == 0
+
+
+def test_max_samples(df_train_test):
+    train, test = df_train_test
+    imputer = KNNImputer(max_samples=50, random_state=0).fit(train)
+    pd.testing.assert_frame_equal(imputer.X_, train.sample(50, random_state=0))
+    assert imputer.transform(test).isnull().sum().sum() == 0
+
+
+def test_error_if_no_observation_without_missing_data():
+    X = pd.DataFrame({"x1": [np.nan, 1.0], "x2": [1.0, np.nan]})
+    with pytest.raises(ValueError):
+        KNNImputer().fit(X)
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"weights": "arbitrary"},
+        {"algorithm": "arbitrary"},
+        {"n_neighbors": 0},
+        {"leaf_size": 1.5},
+        {"chunksize": None},
+        {"max_samples": 0},
+    ],
+)
+def test_error_if_params_not_permitted(params):
+    with pytest.raises(ValueError):
+        KNNImputer(**params)
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -59,6 +60,61 @@ def test_median_imputation_when_user_enters_single_variables(df_na):
     pd.testing.assert_frame_equal(X_transformed, X_reference)
 
 
+@pytest.mark.parametrize("imputation_method", ["mean", "median"])
+def test_impute_by_group(imputation_method):
+    X = pd.DataFrame(
+        {
+            "region": ["a", "a", "a", "b", "b", "b", "c", np.nan],
+            "segment": [0, 0, 1, 1, 1, 1, 0, 0],
+            "income": [1.0, 3.0, np.nan, 10.0, 30.0, np.nan, np.nan, np.nan],
+        }
+    )
+    imputer = MeanMedianImputer(
+        imputation_method=imputation_method, group_by="region"
+    ).fit(X)
+
+    assert imputer.group_by_ == ["region"]
+    assert imputer.variables_ == ["segment", "income"]
+    global_value = X["income"].agg(imputation_method)
+    assert imputer.imputer_dict_["income"] == global_value
+    pd.testing.assert_series_equal(
+        imputer.group_imputer_dict_["income"],
+        pd.Series([2.0, 20.0, np.nan], index=pd.Index(["a", "b", "c"], name="region")),
+        check_names=False,
+    )
+
+    # groups not seen in fit, or without values, take the global value
+    X_test = X.copy()
+    X_test.loc[0, "region"] = "z"
+    X_test.loc[0, "income"] = np.nan
+    X_transformed = imputer.transform(X_test)
+
+    expected = X_test.copy()
+    expected["income"] = [global_value, 3, 2, 10, 30, 20, global_value, global_value]
+    pd.testing.assert_frame_equal(X_transformed, expected)
+
+
+def test_impute_by_several_groups():
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(
+        {
+            "region": rng.integers(0, 50, 1000),
+            "segment": rng.integers(0, 3, 1000),
+            "income": rng.normal(size=1000),
+        }
+    )
+    X["income"] = X["income"].mask(rng.random(1000) < 0.2)
+    imputer = MeanMedianImputer(group_by=["region", "segment"])
+    X_transformed = imputer.fit_transform(X)
+
+    assert imputer.variables_ == ["income"]
+    expected = X["income"].fillna(
+        X.groupby(["region", "segment"])["income"].transform("median")
+    )
+    expected = expected.fillna(X["income"].median())
+    pd.testing.assert_series_equal(X_transformed["income"], expected)
+
+
 def test_error_with_wrong_imputation_method():
     with pytest.raises(ValueError):
         MeanMedianImputer(imputation_method="arbitrary")
@@ -1,3 +1,5 @@
+import numpy as np
+import pandas as pd
 import pytest
 from sklearn.pipeline import Pipeline
 
@@ -57,6 +59,51 @@ def test_error_when_missing_only_not_bool():
         AddMissingIndicator(missing_only="missing_only")
 
 
+@pytest.mark.parametrize(
+    "indicator_format, dtype",
+    [
+        ("int", np.dtype("int64")),
+        ("uint8", np.dtype("uint8")),
+        ("bool", np.dtype("bool")),
+        ("sparse", pd.SparseDtype(np.uint8, 0)),
+    ],
+)
+def test_indicator_format(df_na, indicator_format, dtype):
+    imputer = AddMissingIndicator(indicator_format=indicator_format)
+    X_transformed = imputer.fit_transform(df_na)
+
+    indicators = X_transformed[[f"{var}_na" for var in imputer.variables_]]
+    assert (indicators.dtypes == dtype).all()
+    expected = df_na[imputer.variables_].isna().astype(dtype)
+    expected.columns = indicators.columns
+    pd.testing.assert_frame_equal(indicators, expected)
+
+
+def test_indicator_format_bitmap():
+    X = pd.DataFrame(np.ones((4, 10)), columns=[f"x{i}" for i in range(10)])
+    X.iloc[0, 0] = np.nan
+    X.iloc[1, [1, 7]] = np.nan
+    X.iloc[2, 8] = np.nan
+    X.iloc[3, [0, 9]] = np.nan
+
+    imputer = AddMissingIndicator(missing_only=False, indicator_format="bitmap")
+    X_transformed = imputer.fit_transform(X)
+
+    assert imputer.get_feature_names_out() == list(X.columns) + [
+        "na_bitmap_0",
+        "na_bitmap_1",
+    ]
+    expected = pd.DataFrame(
+        {"na_bitmap_0": [1, 130, 0, 1], "na_bitmap_1": [0, 0, 1, 2]}, dtype=np.uint8
+    )
+    pd.testing.assert_frame_equal(X_transformed[expected.columns], expected)
+
+
+def test_error_when_indicator_format_not_permitted():
+    with pytest.raises(ValueError):
+        AddMissingIndicator(indicator_format="float")
+
+
 def test_get_feature_names_out(df_na):
     original_features = df_na.columns.to_list()
 
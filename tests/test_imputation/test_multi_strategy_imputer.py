@@ -0,0 +1,132 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.pipeline import make_pipeline
+
+from feature_engine.imputation import (
+    AddMissingIndicator,
+    ArbitraryNumberImputer,
+    CategoricalImputer,
+    MeanMedianImputer,
+    MultiStrategyImputer,
+)
+
+
+def test_impute_numerical_and_categorical_variables(df_na):
+    imputer = MultiStrategyImputer()
+    X_transformed = imputer.fit_transform(df_na)
+
+    # fit attributes
+    assert imputer.variables_ == list(df_na.columns)
+    assert imputer.imputer_dict_ == {
+        "Name": "Missing",
+        "City": "Missing",
+        "Studies": "Missing",
+        "Age": df_na["Age"].median(),
+        "Marks": df_na["Marks"].median(),
+        "dob": "Missing",
+    }
+    assert imputer.n_missing_ == {
+        "Name": 2,
+        "City": 2,
+        "Studies": 2,
+        "Age": 1,
+        "Marks": 2,
+        "dob": 0,
+    }
+    assert imputer.indicators_ == []
+
+    # transform output
+    expected = df_na.fillna(imputer.imputer_dict_)
+    pd.testing.assert_frame_equal(X_transformed, expected)
+
+
+@pytest.mark.parametrize("indicator_format", ["int", "bool", "sparse", "bitmap"])
+def test_same_output_as_pipeline(df_na, indicator_format):
+    imputer = MultiStrategyImputer(
+        numerical_method="mean",
+        categorical_method="frequent",
+        add_missing_indicator=True,
+        indicator_format=indicator_format,
+        variables=["City", "Studies", "Age", "Marks"],
+    )
+    X = df_na.assign(Studies=df_na["Studies"].replace("PhD", "Bachelor"))
+    X_transformed = imputer.fit_transform(X)
+
+    pipe = make_pipeline(
+        AddMissingIndicator(
+            variables=["City", "Studies", "Age", "Marks"],
+            indicator_format=indicator_format,
+        ),
+        MeanMedianImputer(imputation_method="mean", variables=["Age", "Marks"]),
+        CategoricalImputer(imputation_method="frequent", variables=["City", "Studies"]),
+    )
+    expected = pipe.fit_transform(X)
+
+    assert imputer.indicators_ == ["City", "Studies", "Age", "Marks"]
+    pd.testing.assert_frame_equal(X_transformed, expected)
+    assert imputer.get_feature_names_out() == list(expected.columns)
+
+
+def test_arbitrary_number_and_categorical_dtype():
+    X = pd.DataFrame(
+        {
+            "num": [1.0, np.nan, 3.0, np.nan],
+            "int": [1, 2, 3, 4],
+            "cat": pd.Categorical(["a", np.nan, "b", "a"]),
+        }
+    )
+    imputer = MultiStrategyImputer(
+        numerical_method="arbitrary", arbitrary_number=-1, add_missing_indicator=True
+    )
+    X_transformed = imputer.fit_transform(X)
+
+    expected = ArbitraryNumberImputer(arbitrary_number=-1).fit_transform(X)
+    expected["cat"] = pd.Categorical(
+        ["a", "Missing", "b", "a"], categories=["a", "b", "Missing"]
+    )
+    expected["num_na"] = [0, 1, 0, 1]
+    expected["cat_na"] = [0, 1, 0, 0]
+
+    assert imputer.indicators_ == ["num", "cat"]
+    pd.testing.assert_frame_equal(X_transformed, expected)
+
+
+def test_pandas_extension_dtypes():
+    X = pd.DataFrame(
+        {
+            "f": pd.array([1.0, None, 3.0, 4.0], dtype="Float64"),
+            "s": pd.array(["a", None, "b", "a"], dtype="string"),
+            "num": [1.0, np.nan, 3.0, 5.0],
+        }
+    )
+    imputer = MultiStrategyImputer(categorical_method="frequent")
+    X_transformed = imputer.fit_transform(X)
+
+    expected = X.fillna({"f": 3.0, "s": "a", "num": 3.0})
+    assert X_transformed["f"].dtype == "Float64"
+    assert X_transformed["s"].dtype == "string"
+    pd.testing.assert_frame_equal(X_transformed, expected)
+
+
+def test_error_when_multiple_frequent_categories(df_na):
+    with pytest.raises(ValueError) as record:
+        MultiStrategyImputer(categorical_method="frequent").fit(df_na)
+    assert str(record.value) == (
+        "The variable(s) Name, dob contain(s) multiple frequent categories."
+    )
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"numerical_method": "frequent"},
+        {"arbitrary_number": "1"},
+        {"categorical_method": "median"},
+        {"add_missing_indicator": 1},
+        {"indicator_format": "float"},
+    ],
+)
+def test_error_if_params_not_permitted(params):
+    with pytest.raises(ValueError):
+        MultiStrategyImputer(**params)
@@ -6,7 +6,7 @@ import pandas as pd
 import pytest
 
 from feature_engine.imputation import RandomSampleImputer
-from feature_engine.imputation.random_sample import _define_seed
+from feature_engine.imputation.random_sample import _define_seed, _define_seeds
 
 
 def test_define_seed(df_vartypes):
@@ -18,6 +18,16 @@ def test_define_seed(df_vartypes):
     assert _define_seed(df_vartypes, 3, ["Marks"], how="multiply") == 1
 
 
+@pytest.mark.parametrize("how", ["add", "multiply"])
+@pytest.mark.parametrize("seed_variables", [["Age", "Marks"], ["Age"], ["Marks"]])
+def test_define_seeds_matches_define_seed(df_na, how, seed_variables):
+    seeds = _define_seeds(df_na, seed_variables, how=how)
+    expected = [
+        _define_seed(df_na, i, seed_variables, how=how) for i in df_na.index
+    ]
+    assert seeds.tolist() == expected
+
+
 def test_general_seed_plus_automatically_select_variables(df_na):
     # set up transformer
     imputer = RandomSampleImputer(variables=None, random_state=5, seed="general")
@@ -307,3 +317,72 @@ def test_variables_cast_as_category(df_na):
 
     # test transform output
     pd.testing.assert_frame_equal(X_transformed, ref, check_dtype=False)
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"random_state": 5, "seed": "general"},
+        {"random_state": ["Marks"], "seed": "observation"},
+        {"random_state": ["Age", "Marks"], "seed": "observation"},
+    ],
+)
+def test_storage_values_returns_same_samples_as_dataframe(df_na, params):
+    imputer = RandomSampleImputer(**params)
+    X_reference = imputer.fit_transform(df_na)
+
+    imputer = RandomSampleImputer(storage="values", **params)
+    X_transformed = imputer.fit_transform(df_na)
+
+    assert not hasattr(imputer, "X_")
+    assert list(imputer.values_.keys()) == imputer.variables_
+    np.testing.assert_array_equal(
+        imputer.values_["City"], df_na["City"].dropna().to_numpy()
+    )
+    pd.testing.assert_frame_equal(X_transformed, X_reference)
+
+
+def test_storage_values_with_max_values(df_na):
+    imputer = RandomSampleImputer(random_state=0, storage="values", max_values=3)
+    X_transformed = imputer.fit_transform(df_na)
+
+    for var in imputer.variables_:
+        values = imputer.values_[var]
+        assert len(values) == 3
+        assert len(set(values)) == 3
+        assert np.isin(values, df_na[var].dropna().to_numpy()).all()
+
+    # the missing data is replaced by the stored values
+    assert X_transformed.isnull().sum().sum() == 0
+    for var in ["City", "Studies", "Age", "Marks"]:
+        is_missing = df_na[var].isnull()
+        assert X_transformed.loc[is_missing, var].isin(imputer.values_[var]).all()
+
+
+@pytest.mark.parametrize(
+    "params",
+    [{"storage": "arbitrary"}, {"max_values": 0}, {"max_values": 1.5}],
+)
+def test_error_if_storage_or_max_values_not_permitted(params):
+    with pytest.raises(ValueError):
+        RandomSampleImputer(**params)
+
+
+def test_seed_per_observation_same_seed_same_value():
+    n = 100
+    X = pd.DataFrame(
+        {
+            "var": [np.nan if i % 2 else float(i) for i in range(n)],
+            "seed": [i % 5 for i in range(n)],
+        }
+    )
+    imputer = RandomSampleImputer(seed="observation", random_state="seed")
+    X_transformed = imputer.fit_transform(X)
+
+    imputed = X_transformed.loc[X["var"].isnull()]
+    assert (imputed.groupby("seed")["var"].nunique() == 1).all()
+
+    # the value for each seed is the one pandas.sample would extract
+    values = X["var"].dropna()
+    for seed, value in imputed.groupby("seed")["var"].first().items():
+        assert value == values.sample(1, replace=True, random_state=seed).iloc[0]
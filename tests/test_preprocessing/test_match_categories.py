@@ -65,3 +65,43 @@ def test_category_outputs_correct_results():
         variables=["col1", "col2"], ignore_format=True, missing_values="ignore"
     ).fit_transform(df)
     pd.testing.assert_frame_equal(df, res, check_dtype=False, check_categorical=False)
+
+
+def test_categorical_variables_with_different_categories():
+    df_train = pd.DataFrame({"col1": ["a", "b", "c"], "col2": ["x", "y", "y"]})
+    tr = MatchCategories(missing_values="ignore").fit(df_train)
+
+    df = pd.DataFrame(
+        {
+            "col1": pd.Categorical(["c", "a", "d"], categories=["d", "c", "a"]),
+            "col2": pd.Categorical(
+                ["y", "x", "y"], categories=["x", "y"], ordered=True
+            ),
+        }
+    )
+    with pytest.warns(UserWarning) as record:
+        res = tr.transform(df)
+    assert str(record[0].message) == (
+        "During the encoding, NaN values were introduced in the feature(s) col1."
+    )
+
+    expected = pd.DataFrame(
+        {
+            "col1": pd.Categorical(["c", "a", np.nan], categories=["a", "b", "c"]),
+            "col2": pd.Categorical(
+                ["y", "x", "y"], categories=["x", "y"], ordered=True
+            ),
+        }
+    )
+    pd.testing.assert_frame_equal(res, expected)
+
+
+def test_raises_missing_values_error_before_unseen_categories_error():
+    tr = MatchCategories().fit(pd.DataFrame({"col1": ["a", "b"], "col2": ["a", "b"]}))
+    df = pd.DataFrame({"col1": ["a", "c"], "col2": ["a", np.nan]})
+    with pytest.raises(ValueError, match="contain NaN"):
+        tr.transform(df)
+
+    df = pd.DataFrame({"col1": ["a", "c"], "col2": ["d", "b"]})
+    with pytest.raises(ValueError, match="feature\\(s\\) col1, col2."):
+        tr.transform(df)
@@ -188,3 +188,41 @@ def test_non_fitted_error(df_vartypes):
     with pytest.raises(NotFittedError):
         transformer = MatchVariables()
         transformer.transform(df_vartypes)
+
+
+@pytest.mark.parametrize("fill_value", [np.nan, 0, "missing"])
+def test_same_output_as_reindex(df_vartypes, fill_value):
+    train = df_vartypes.copy()
+    train["new_variable"] = 5
+
+    match_columns = MatchVariables(fill_value=fill_value)
+    match_columns.fit(train)
+
+    test = df_vartypes[["dob", "Marks", "Name", "City"]].copy()
+    test["extra"] = 1
+
+    expected = test.reindex(columns=train.columns, fill_value=fill_value)
+
+    pd.testing.assert_frame_equal(match_columns.transform(test), expected)
+
+    # reordered columns only
+    reordered = train[train.columns[::-1]]
+    pd.testing.assert_frame_equal(match_columns.transform(reordered), train)
+
+    # transform does not store anything in the transformer
+    fitted = {"feature_names_in_", "n_features_in_"}
+    params = set(vars(MatchVariables(fill_value=fill_value)))
+    assert set(vars(match_columns)) == params | fitted
+
+    match_columns.fit(df_vartypes)
+    expected = test.reindex(columns=df_vartypes.columns, fill_value=fill_value)
+    pd.testing.assert_frame_equal(match_columns.transform(test), expected)
+
+
+def test_missing_values_raise_when_variables_are_added(df_vartypes):
+    match_columns = MatchVariables(missing_values="raise")
+    match_columns.fit(df_vartypes)
+
+    Xt = match_columns.transform(df_vartypes.drop(columns=["Age"]))
+    assert list(Xt.columns) == list(df_vartypes.columns)
+    assert Xt["Age"].isnull().all()